@@ -0,0 +1,58 @@
+"""
+Benchmark rendering and fingerprinting components with and without the component memo cache.
+
+Usage
+-----
+```sh
+python benchmarks/bench_components.py
+```
+"""
+
+import timeit
+
+from ductile import ViewObject
+from ductile.ui import Button, Select
+from ductile.ui.memo import _PAYLOADS
+from ductile.ui.select import _OPTIONS
+
+N_COMPONENTS = 25
+NUMBER = 1000
+
+
+def render() -> ViewObject:
+    components = [
+        Select(
+            config={},
+            style={},
+            options=[{"label": f"option {j}"} for j in range(25)],
+            custom_id=f"select-{i}",
+        )
+        if i % 5 == 0
+        else Button(f"button {i}", style={"color": "blurple"}, custom_id=f"button-{i}")
+        for i in range(N_COMPONENTS)
+    ]
+    return ViewObject(content="benchmark", components=components)
+
+
+def cold() -> bytes:
+    _OPTIONS.clear()
+    _PAYLOADS.clear()
+    return render().fingerprint
+
+
+def warm() -> bytes:
+    return render().fingerprint
+
+
+def main() -> None:
+    warm()
+    cold_time = timeit.timeit(cold, number=NUMBER) / NUMBER
+    warm_time = timeit.timeit(warm, number=NUMBER) / NUMBER
+
+    print(f"{N_COMPONENTS} components, {NUMBER} renders")
+    print(f"render + fingerprint (cold cache): {cold_time * 1e6:8.1f} us/render")
+    print(f"render + fingerprint (warm cache): {warm_time * 1e6:8.1f} us/render")
+
+
+if __name__ == "__main__":
+    main()
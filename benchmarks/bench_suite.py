@@ -0,0 +1,216 @@
+"""
+Benchmark the hot paths of views and controllers on the headless harness of `ductile.testing`.
+
+Each case is timed over a fixed number of operations, repeated, and reported as the best and the median
+microseconds per operation. Save the results of a commit and compare another commit against them
+to catch regressions, e.g. in `ViewObject.equals` or `_process_view_for_discord`.
+
+Usage
+-----
+```sh
+python benchmarks/bench_suite.py --json before.json
+git checkout my-branch
+python benchmarks/bench_suite.py --compare before.json
+```
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import discord
+
+from ductile import State, View, ViewObject
+from ductile.controller import MessageableController
+from ductile.pagination import Paginator
+from ductile.testing import FakeMessage, FakeMessageable
+from ductile.ui import Button, SearchableSelect, Select, SelectOption, VirtualSelect
+
+# a message holds 5 rows. a select takes a whole row.
+N_SELECTS = 2
+N_BUTTONS = 15
+N_EMBEDS = 10
+N_ITEMS = 100_000
+N_OPTIONS = 50_000
+N_VALUES = 10_000
+
+Case = Callable[[int], Awaitable[float]]
+
+
+class DashboardView(View):
+    """A view filling all 5 rows with components and 10 embeds, re-rendered on every tick."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.tick = State(0, self)
+
+    def render(self) -> ViewObject:
+        embeds = [
+            discord.Embed(title=f"Embed {i}", description="description " * 20, color=0x00FF00)
+            .add_field(name="field 1", value="value " * 10)
+            .add_field(name="tick", value=str(self.tick()))
+            for i in range(N_EMBEDS)
+        ]
+        selects = [
+            Select(config={}, style={}, options=[{"label": f"option {j}"} for j in range(25)], custom_id=f"select-{i}")
+            for i in range(N_SELECTS)
+        ]
+        buttons = [Button(f"button {i}", style={"color": "blurple"}, custom_id=f"button-{i}") for i in range(N_BUTTONS)]
+        components: list[Select | Button] = [*selects, *buttons]
+        return ViewObject(content="dashboard", embeds=embeds, components=components)
+
+
+class PagerView(View):
+    def __init__(self) -> None:
+        super().__init__()
+        self.pages = Paginator(self, source=range(N_ITEMS), config={"page_size": 10})
+
+    def render(self) -> ViewObject:
+        next_button = Button("next", style={"color": "blurple"}, on_click=self.go_next)
+        return ViewObject(content="\n".join(map(str, self.pages.data)), components=[next_button])
+
+    def go_next(self, interaction: discord.Interaction) -> None:
+        if self.pages.at_last:
+            self.pages.go_first(interaction)
+        else:
+            self.pages.go_next(interaction)
+
+
+class DetachedView(View):
+    """A view without a controller, to benchmark components alone."""
+
+    def sync(self) -> None:
+        pass
+
+
+OPTIONS: list[SelectOption] = [{"label": f"option {i:05}", "value": str(i)} for i in range(N_OPTIONS)]
+
+
+async def send(view: View) -> tuple[MessageableController, FakeMessage]:
+    messageable = FakeMessageable()
+    controller = MessageableController(view, messageable=messageable, timeout=None)
+    await controller.send()
+    return controller, messageable.messages[0]
+
+
+async def render_equals(number: int) -> float:
+    view = DashboardView()
+    previous = view.render()
+    previous.fingerprint  # noqa: B018 # the committed render is fingerprinted by the controller
+    start = time.perf_counter()
+    for _ in range(number):
+        previous.equals(view.render())
+    return time.perf_counter() - start
+
+
+async def process_view(number: int) -> float:
+    controller, _ = await send(DashboardView())
+    start = time.perf_counter()
+    for _ in range(number):
+        controller._process_view_for_discord("attachment")  # noqa: SLF001
+    return time.perf_counter() - start
+
+
+async def set_state(number: int) -> float:
+    # large lists differing at the head, so comparing them is cheap and formatting them for logs is not
+    values = [[i, *range(N_VALUES)] for i in range(2)]
+    state = State(values[0], DetachedView())
+    start = time.perf_counter()
+    for i in range(number):
+        state.set_state(values[(i + 1) % 2])
+    return time.perf_counter() - start
+
+
+async def set_state_to_edit(number: int) -> float:
+    view = DashboardView()
+    controller, message = await send(view)
+    start = time.perf_counter()
+    for i in range(number):
+        view.tick.set_state(i + 1)
+        await controller.sync()
+    elapsed = time.perf_counter() - start
+    assert len(message.edits) == number  # noqa: S101
+    return elapsed
+
+
+async def paginator_flip(number: int) -> float:
+    _, message = await send(PagerView())
+    start = time.perf_counter()
+    for _ in range(number):
+        await message.click("next")
+    return time.perf_counter() - start
+
+
+async def virtual_select(number: int) -> float:
+    select = VirtualSelect(DetachedView(), source=OPTIONS, config={"max_values": 5})
+    start = time.perf_counter()
+    for _ in range(number):
+        select.render().to_component_dict()
+    return time.perf_counter() - start
+
+
+async def searchable_select(number: int) -> float:
+    select = SearchableSelect(DetachedView(), source=OPTIONS)
+    # prefixes of the numbers in the labels, matching 1 to 100 options each
+    queries = [f"{i:03}" for i in range(number)]
+    start = time.perf_counter()
+    for query in queries:
+        select.search(query)
+        select.render().to_component_dict()
+    return time.perf_counter() - start
+
+
+CASES: dict[str, tuple[Case, int]] = {
+    "render_equals": (render_equals, 200),
+    "process_view": (process_view, 2000),
+    "set_state": (set_state, 20_000),
+    "set_state_to_edit": (set_state_to_edit, 200),
+    "paginator_flip": (paginator_flip, 500),
+    "virtual_select": (virtual_select, 2000),
+    "searchable_select": (searchable_select, 500),
+}
+
+
+def run(repeat: int, only: list[str] | None) -> dict[str, dict[str, float]]:
+    results = {}
+    for name, (case, number) in CASES.items():
+        if only and name not in only:
+            continue
+        # a fresh loop per run, so timers and tasks left by a run do not leak into the next one
+        timings = [asyncio.new_event_loop().run_until_complete(case(number)) / number for _ in range(repeat)]
+        results[name] = {"best_us": min(timings) * 1e6, "median_us": statistics.median(timings) * 1e6}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case")
+    parser.add_argument("--only", nargs="*", choices=list(CASES), help="cases to run")
+    parser.add_argument("--json", type=Path, help="save the results to the file")
+    parser.add_argument("--compare", type=Path, help="compare with the results saved by --json")
+    args = parser.parse_args()
+
+    # build the shared search index outside of the timed runs
+    SearchableSelect(DetachedView(), source=OPTIONS)
+    results = run(args.repeat, args.only)
+    baseline: dict[str, dict[str, float]] = json.loads(args.compare.read_text())["results"] if args.compare else {}
+
+    print(f"python {platform.python_version()}, discord.py {discord.__version__}, best of {args.repeat}")
+    for name, result in results.items():
+        line = f"{name:<18}: {result['best_us']:10.1f} us/op (median {result['median_us']:10.1f})"
+        if name in baseline:
+            line += f"  {result['best_us'] / baseline[name]['best_us'] - 1:+7.1%} vs baseline"
+        print(line)
+
+    if args.json:
+        meta = {"python": platform.python_version(), "discord.py": discord.__version__}
+        args.json.write_text(json.dumps({"meta": meta, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
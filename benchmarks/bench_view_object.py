@@ -0,0 +1,77 @@
+"""
+Benchmark `ViewObject.equals` on a view with 25 components and 10 embeds.
+
+Usage
+-----
+```sh
+python benchmarks/bench_view_object.py
+```
+"""
+
+import timeit
+
+import discord
+
+from ductile import ViewObject
+from ductile.ui import Button, Select
+
+N_COMPONENTS = 25
+N_EMBEDS = 10
+NUMBER = 1000
+
+
+def render() -> ViewObject:
+    embeds = [
+        discord.Embed(title=f"Embed {i}", description="description " * 20, color=0x00FF00)
+        .add_field(name="field 1", value="value " * 10)
+        .add_field(name="field 2", value="value " * 10)
+        .set_footer(text="footer")
+        for i in range(N_EMBEDS)
+    ]
+    components = [
+        Select(
+            config={},
+            style={},
+            options=[{"label": f"option {j}"} for j in range(25)],
+            custom_id=f"select-{i}",
+        )
+        if i % 5 == 0
+        else Button(f"button {i}", style={"color": "blurple"}, custom_id=f"button-{i}")
+        for i in range(N_COMPONENTS)
+    ]
+    return ViewObject(content="benchmark", embeds=embeds, components=components)
+
+
+def legacy_equals(a: ViewObject, b: ViewObject) -> bool:
+    """Pairwise comparison used before fingerprinting."""
+    if a.content != b.content:
+        return False
+    if (a.embeds is None) != (b.embeds is None) or len(a.embeds or []) != len(b.embeds or []):
+        return False
+    if not all(x == y for x, y in zip(a.embeds or [], b.embeds or [], strict=True)):
+        return False
+    if (a.components is None) != (b.components is None) or len(a.components or []) != len(b.components or []):
+        return False
+    return all(
+        x.to_component_dict() == y.to_component_dict() for x, y in zip(a.components or [], b.components or [], strict=True)
+    )
+
+
+def main() -> None:
+    previous = render()
+    previous.fingerprint  # noqa: B018 # the previous render is already fingerprinted by the controller
+    upcoming = [render() for _ in range(NUMBER)]
+
+    # each sync compares a fresh render against the previous (committed) render
+    legacy = timeit.timeit(lambda: [legacy_equals(previous, u) for u in upcoming], number=1) / NUMBER
+    fingerprint = timeit.timeit(lambda: [previous.equals(u) for u in upcoming], number=1) / NUMBER
+    cached = timeit.timeit(lambda: [previous.equals(upcoming[0]) for _ in upcoming], number=1) / NUMBER
+
+    print(f"{N_COMPONENTS} components, {N_EMBEDS} embeds, {NUMBER} syncs")
+    print(f"legacy pairwise     : {legacy * 1e6:8.1f} us/sync")
+    print(f"fingerprint (fresh) : {fingerprint * 1e6:8.1f} us/sync")
+    print(f"fingerprint (cached): {cached * 1e6:8.1f} us/compare")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,20 +35,18 @@ class CounterView(View):
         # in this example, self.count() is equivalent to self.count.get_state()
         e = discord.Embed(title="Counter", description=f"Count: {self.count.get_state()}")
 
-        async def handle_increment(interaction: discord.Interaction) -> None:
-            # use defer if you only update State in callback.
-            await interaction.response.defer()
+        async def handle_increment(_: discord.Interaction) -> None:
+            # you do not need to respond if you only update State in callback.
+            # the library responds by editing the message with the latest render.
 
             # if you pass callable to State.set_state, the callable will be called with the current value of the state.
             # in this example, x is the current value of the state.
             self.count.set_state(lambda x: x + 1)
 
-        async def handle_decrement(interaction: discord.Interaction) -> None:
-            await interaction.response.defer()
+        async def handle_decrement(_: discord.Interaction) -> None:
             self.count.set_state(lambda x: x - 1)
 
-        async def handle_reset(interaction: discord.Interaction) -> None:
-            await interaction.response.defer()
+        async def handle_reset(_: discord.Interaction) -> None:
             # also you can pass new value to State.set_state.
             self.count.set_state(0)
 
@@ -74,8 +72,8 @@ class CounterView(View):
                 Button(
                     "random",
                     style={"color": "green", "row": 1},
-                    # if you passed synchronous function to Button.on_click,
-                    # library automatically calls `await interaction.response.defer()`.
+                    # if the callback does not respond to the interaction, the library responds
+                    # by editing the message with the latest render (`interaction.response.edit_message`).
                     on_click=lambda _: self.count.set_state(random.randint(0, 100)),  # noqa: S311
                 ),
                 Button("stop", style={"color": "red", "row": 1}, on_click=stop),
@@ -1,13 +1,21 @@
-from . import controller, pagination, types, ui
+import logging
+
+from . import controller, hibernation, instrumentation, pagination, types, ui
 from .state import State
-from .view import View, ViewObject
+from .view import View, ViewObject, static
+
+# records are dropped unless the application configures logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __all__ = [
     "State",
     "View",
     "ViewObject",
     "controller",
+    "hibernation",
+    "instrumentation",
     "pagination",
+    "static",
     "types",
     "ui",
 ]
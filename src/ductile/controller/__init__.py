@@ -1,5 +1,12 @@
 from .controller import ViewController
+from .dispatcher import EditDispatcher, get_default_dispatcher
 from .interaction_controller import InteractionController
 from .messageable_controller import MessageableController
 
-__all__ = ["InteractionController", "MessageableController", "ViewController"]
+__all__ = [
+    "EditDispatcher",
+    "InteractionController",
+    "MessageableController",
+    "ViewController",
+    "get_default_dispatcher",
+]
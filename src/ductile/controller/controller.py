@@ -1,24 +1,36 @@
 import asyncio
+import inspect
+import json
+import logging
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple, overload
 
-from ..internal import _InternalView  # noqa: TID252
+from discord import InteractionMessage, WebhookMessage
+
+from ..instrumentation import Metric, MetricsRegistry, SyncTracer, get_default_metrics  # noqa: TID252
+from ..instrumentation.tracing import _INTERACTION, SyncOutcome, _callback_name  # noqa: TID252
+from ..internal import _clone, _InternalView, _reconcile, _release, _TimeoutEntry, _TimeoutManager  # noqa: TID252
 from ..state import State  # noqa: TID252
-from ..utils import (  # noqa: TID252
-    debounce,
-    wait_tasks_by_name,
-)
+from ..utils import LRUCache, TrailingEdgeScheduler, get_logger  # noqa: TID252
 from ..view import (  # noqa: TID252
     ViewObject,
 )
+from .dispatcher import EditDispatcher, get_default_dispatcher
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Generator
+    from collections.abc import Generator, Hashable
 
-    from discord import Message
+    from discord import Interaction, InteractionResponse, Message, PartialMessage, ui
 
+    from ..hibernation import HibernationConfig  # noqa: TID252
     from ..view import View  # noqa: TID252
     from .type import ViewObjectDictWithAttachment, ViewObjectDictWithFiles
 
+_logger = get_logger(__name__)
+
 
 class ViewResult(NamedTuple):
     """
@@ -34,38 +46,315 @@ class ViewResult(NamedTuple):
     states: dict[str, Any]
 
 
+def _copy_view_object(view_object: ViewObject) -> ViewObject:
+    components = view_object.components
+    return ViewObject(
+        content=view_object.content,
+        embeds=view_object.embeds,
+        files=view_object.files,
+        components=None if components is None else [_clone(c) for c in components],
+    )
+
+
+def _payload_size(view_object: ViewObject, view: "ui.View") -> int:
+    payload = {
+        "content": view_object.content,
+        "embeds": [embed.to_dict() for embed in view_object.embeds or []],
+        "components": view.to_components(),
+    }
+    return len(json.dumps(payload, separators=(",", ":")))
+
+
 class ViewController:
     """ViewController is a class that controls the view."""
 
-    def __init__(self, view: "View", *, timeout: float | None = 180, sync_interval: float | None = None) -> None:
-        self.__view = view
+    def __init__(  # noqa: PLR0913
+        self,
+        view: "View",
+        *,
+        timeout: float | None = 180,
+        sync_interval: float | None = None,
+        sync_max_wait: float | None = None,
+        dispatcher: EditDispatcher | None = None,
+        hibernation: "HibernationConfig | None" = None,
+        render_cache: int | None = None,
+        render_in_executor: bool | Executor = False,
+        metrics: MetricsRegistry | None = None,
+        trace: int | None = None,
+    ) -> None:
+        # None while the view is hibernated
+        self.__view: View | None = view
         view._controller = self  # noqa: SLF001
-        self.__raw_view = _InternalView(timeout=timeout, on_error=self.__view.on_error, on_timeout=self.__view.on_timeout)
-        self.__message: Message | None = None
-
-        # sync_fn is a function that syncs the message with the current view
-        self.__sync_fn = self.__create_sync_function(sync_interval=sync_interval)
+        # timeout is managed by a timer shared across controllers instead of discord.py's task per view
+        # handlers look up the view on call, so the raw view does not keep a hibernated view alive
+        self.__raw_view = _InternalView(
+            timeout=None,
+            on_error=self.__on_error,
+            on_timeout=self.__on_timeout,
+            on_respond=self.__respond,
+            on_interaction=self.__on_interaction,
+        )
+        # a partial message while the view is hibernated
+        self.__message: Message | PartialMessage | None = None
         self.__loop = asyncio.get_event_loop()
 
+        self.__timeout = timeout
+        self.__timeout_entry: _TimeoutEntry | None = None
+        self.__timeout_task: asyncio.Task[None] | None = None
+        # resolved with True on timeout and False on stop
+        self.__stopped: asyncio.Future[bool] = self.__loop.create_future()
+
+        # scheduler coalesces bursts of sync into a single trailing-edge sync.
+        self.__scheduler = self.__create_scheduler(sync_interval=sync_interval, sync_max_wait=sync_max_wait)
+
         # store latest view object to compare with upcoming view object
         self.__view_object = ViewObject()
+        # render key of the latest view object. None if unknown.
+        self.__view_key: Hashable | None = None
+        # memoized renders by render key. see `View.render_key`.
+        self.__render_cache: LRUCache[Hashable, ViewObject] | None = LRUCache(render_cache) if render_cache else None
+        if isinstance(render_in_executor, ProcessPoolExecutor):
+            msg = "render_in_executor does not support ProcessPoolExecutor since rendered callbacks can not be pickled"
+            raise TypeError(msg)
+        # None runs sync renders on the event loop. True runs them in the default executor of the loop.
+        self.__render_executor: Executor | Literal[True] | None = render_in_executor or None
+        # stamp of the latest render started, to discard the results of superseded renders
+        self.__render_seq = 0
+        # version of the view when the latest view object was committed. -1 means never rendered.
+        self.__rendered_version = -1
+        # stamp of the latest render and the lock held while an edit is in flight
+        self.__render_stamp = 0
+        self.__commit_lock = asyncio.Lock()
+        # edits are dispatched through a dispatcher shared across controllers to respect rate limits
+        self.__dispatcher = dispatcher or get_default_dispatcher(self.__loop)
+
+        # hibernation releases the view after idle seconds and rebuilds it on the next interaction
+        self.__hibernation = hibernation
+        self.__view_type = type(view)
+        self.__factory = hibernation.get("factory", self.__view_type) if hibernation is not None else self.__view_type
+        self.__idle_entry: _TimeoutEntry | None = None
+        self.__waking: asyncio.Task[View] | None = None
+        self.__hibernated_fingerprint: bytes | None = None
+        # metrics are labeled by the View class, which is kept while the view is hibernated
+        self.__metrics = metrics if metrics is not None else get_default_metrics()
+        self.__view_name = type(view).__qualname__
+        # traces of the latest syncs. see `SyncTracer`.
+        self.__tracer = SyncTracer(trace, loop=self.__loop) if trace else None
+        self.__logger = _logger
 
     @property
-    def message(self) -> "Message | None":
+    def message(self) -> "Message | PartialMessage | None":
         """
         return attached message with the View.
 
         Returns
         -------
-        `discord.Message | None`
+        `discord.Message | discord.PartialMessage | None`
             The attached message. None if the View is not sent yet.
+            A `discord.PartialMessage` if the View has been hibernated.
         """
         return self.__message
 
     @message.setter
-    def message(self, value: "Message | None") -> None:
+    def message(self, value: "Message | PartialMessage | None") -> None:
         self.__message = value
 
+        # start the timeout once the view is sent, same as discord.py
+        if value is not None and self.__timeout and self.__timeout_entry is None and not self.__stopped.done():
+            self.__timeout_entry = _TimeoutManager.get(self.__loop).register(self.__timeout, self.__dispatch_timeout)
+        if value is not None and self.__idle_entry is None:
+            self.__schedule_hibernation()
+
+    @property
+    def hibernated(self) -> bool:
+        """
+        property: Whether the view is hibernated.
+
+        Returns
+        -------
+        bool
+            True if the view has been released and its states are kept in the hibernation store.
+        """
+        return self.__view is None
+
+    async def __on_interaction(self, interaction: "Interaction") -> None:
+        # rebuild the view before discord.py dispatches the interaction to the item
+        await self.__wake()
+
+        if self.__tracer is not None:
+            # discord.py calls the item callback in the same task, so changes made by it are attributed to it
+            custom_id = (interaction.data or {}).get("custom_id")
+            item = next((i for i in self.__raw_view.children if getattr(i, "custom_id", None) == custom_id), None)
+            _INTERACTION.set((interaction.id, "-" if item is None else _callback_name(item)))
+
+        if self.__timeout_entry is not None:
+            self.__timeout_entry.refresh()
+        if self.__idle_entry is not None:
+            self.__idle_entry.refresh()
+
+    async def __on_error(self, interaction: "Interaction", error: Exception, item: "ui.Item") -> None:
+        view = await self.__wake()
+        await view.on_error(interaction, error, item)
+
+    async def __on_timeout(self) -> None:
+        view = await self.__wake()
+        await view.on_timeout()
+
+    def __hibernation_key(self) -> str:
+        return str(getattr(self.__message, "id", id(self)))
+
+    def __schedule_hibernation(self) -> None:
+        if self.__hibernation is None or self.__stopped.done():
+            return
+
+        self.__idle_entry = _TimeoutManager.get(self.__loop).register(self.__hibernation["idle"], self.__hibernate)
+
+    def __hibernate(self) -> None:
+        """Save the states of the view to the store and release the view, the states and the latest view object."""
+        view = self.__view
+        if self.__hibernation is None or view is None or self.__stopped.done():
+            return
+
+        if self.__scheduler.pending or self.__commit_lock.locked() or view._version != self.__rendered_version:  # noqa: SLF001
+            # the view is still being synced. try again after another idle period.
+            self.__schedule_hibernation()
+            return
+
+        try:
+            data = pickle.dumps(self.__snapshot(view))
+        except Exception:
+            self.__logger.exception(
+                "Failed to serialize states. The view will not hibernate.",
+                extra={"view": self.__view_name},
+            )
+            return
+
+        self.__hibernation["store"].save(self.__hibernation_key(), data)
+        self.__release_message()
+        # the raw view is kept since discord.py dispatches interactions to it. its items release their callbacks.
+        for item in self.__raw_view.children:
+            _release(item)
+        view._controller = None  # noqa: SLF001
+        self.__view = None
+        # the rebuilt render is compared with the message on wake up
+        self.__hibernated_fingerprint = self.__view_object.fingerprint
+        self.__view_object = ViewObject()
+        self.__view_key = None
+        if self.__render_cache is not None:
+            # memoized renders hold callbacks bound to the view
+            self.__render_cache.clear()
+
+    def __release_message(self) -> None:
+        """Replace the message with a partial message, keeping only the ids of the message and its channel."""
+        message = self.__message
+        if message is None or isinstance(message, (InteractionMessage, WebhookMessage)):
+            # edited through the webhook of the interaction, e.g. ephemeral messages, which the channel can not edit
+            return
+        get_partial_message = getattr(message.channel, "get_partial_message", None)
+        if callable(get_partial_message):
+            self.__message = get_partial_message(message.id)
+
+    async def __wake(self) -> "View":
+        """
+        Return the view, rebuilding it from the hibernation store if it is hibernated.
+
+        The rebuilt view is rendered and reconciled with the live items, so their callbacks are restored
+        and their custom_ids are kept. The render is edited into the message only if it differs from the message,
+        e.g. when the view was changed outside its states. Interactions arriving while the view is rebuilt
+        wait for the same rebuild.
+        """
+        if self.__view is not None:
+            return self.__view
+
+        if self.__waking is None:
+            self.__waking = self.__loop.create_task(self.__rebuild())
+        return await asyncio.shield(self.__waking)
+
+    async def __rebuild(self) -> "View":
+        try:
+            view = self.__restore()
+            # the view is not attached until rendered, so syncs meanwhile are deferred
+            await self.__prepare(view)
+        finally:
+            self.__waking = None
+
+        stale = self.__view_object.fingerprint != self.__hibernated_fingerprint
+        if stale:
+            # forget the committed render so that the next sync edits the message
+            self.__view_object = ViewObject()
+            self.__view_key = None
+            self.__rendered_version = -1
+
+        assert self.__hibernation is not None  # noqa: S101
+        self.__hibernation["store"].delete(self.__hibernation_key())
+        self.__view = view
+        self.__schedule_hibernation()
+        if stale:
+            self._request_sync()
+        return view
+
+    def __snapshot(self, view: "View") -> dict[str, Any]:
+        """
+        Return the states of the view and the positions of its helpers (e.g. `Paginator`) to keep while hibernated.
+
+        Raises
+        ------
+        TypeError
+            If the view holds a helper whose position can not be kept.
+        """
+        snapshot: dict[str, Any] = {}
+        for name, value in view.__dict__.items():
+            if isinstance(value, State):
+                snapshot[name] = value.get_state()
+            elif callable(hibernate := getattr(value, "_hibernate", None)):
+                snapshot[name] = hibernate()
+            elif callable(getattr(value, "_render_key", None)):
+                msg = f"{type(value).__qualname__} {name!r} can not be hibernated"
+                raise TypeError(msg)
+        return snapshot
+
+    def __restore(self) -> "View":
+        """
+        Build a view with the states saved in the hibernation store.
+
+        Raises
+        ------
+        TypeError
+            If the factory returns a view of another type than the hibernated view.
+        """
+        assert self.__hibernation is not None  # noqa: S101
+        data = self.__hibernation["store"].load(self.__hibernation_key())
+
+        view = self.__factory()
+        if type(view) is not self.__view_type:
+            msg = f"factory must return {self.__view_name}, got {type(view).__qualname__}"
+            raise TypeError(msg)
+        view._controller = self  # noqa: SLF001
+        if data is None:
+            self.__logger.warning(
+                "States of the hibernated view are not found. The view is rebuilt with initial states.",
+                extra={"view": self.__view_name},
+            )
+        else:
+            for name, value in pickle.loads(data).items():  # noqa: S301
+                # restore without sync
+                if isinstance(target := view.__dict__.get(name), State):
+                    target._current_value = value  # noqa: SLF001
+                elif callable(restore := getattr(target, "_restore", None)):
+                    restore(value)
+        return view
+
+    def __dispatch_timeout(self) -> None:
+        if self.__stopped.done():
+            return
+
+        self.__raw_view.stop()
+        if self.__idle_entry is not None:
+            self.__idle_entry.cancel()
+        self.__timeout_task = self.__loop.create_task(self.__raw_view.on_timeout())
+        self.__stopped.set_result(True)
+        self.__count("timeouts")
+
     async def send(self) -> None:
         """
         Send the view to the channel.
@@ -78,54 +367,341 @@ class ViewController:
         # implement this in subclasses
         raise NotImplementedError
 
+    def _measure(self, metric: Metric) -> AbstractContextManager[None]:
+        """
+        Return a context manager observing the duration of the block into the metrics registry of this controller.
+
+        Parameters
+        ----------
+        metric : `Metric`
+            The observed metric.
+
+        Returns
+        -------
+        `ContextManager[None]`
+            The context manager. This does nothing if metrics are disabled.
+        """
+        if self.__metrics is None:
+            return nullcontext()
+        return self.__metrics.time(metric, view=self.__view_name)
+
+    def __count(self, metric: Metric) -> None:
+        if self.__metrics is not None:
+            self.__metrics.increment(metric, view=self.__view_name)
+
     async def sync(self) -> None:
-        """Sync the message with current view."""
-        try:
-            return await self.__sync_fn()
-        except RuntimeError:
-            pass
+        """
+        Sync the message with current view.
 
-    def __create_sync_function(self, *, sync_interval: float | None) -> "Callable[[], Awaitable[None]]":
+        Sync requests made in the same event loop iteration (or within `sync_interval` if set)
+        are coalesced into a single render and a single edit.
         """
-        Create a function that syncs the message with the current view.
+        return await self.__scheduler.schedule()
+
+    def _request_sync(self) -> None:
+        """Request a sync without waiting for it. This method is called by `View.sync()`."""
+        if self.__tracer is not None:
+            self.__tracer._record_change(None)  # noqa: SLF001
+        self.__scheduler.schedule()
+
+    def _trace_state(self, state: State[Any]) -> None:
+        """Record the State changed for the next sync if tracing is enabled. This method is called by `State`."""
+        if self.__tracer is not None and (view := self.__view) is not None:
+            name = next((k for k, v in view.__dict__.items() if v is state), type(state).__name__)
+            self.__tracer._record_change(name)  # noqa: SLF001
+
+    @property
+    def tracer(self) -> SyncTracer | None:
+        """
+        property: The traces of the latest syncs.
+
+        Returns
+        -------
+        `SyncTracer | None`
+            The tracer. None if tracing is disabled, which is the default.
+        """
+        return self.__tracer
+
+    def __create_scheduler(
+        self,
+        *,
+        sync_interval: float | None,
+        sync_max_wait: float | None,
+    ) -> TrailingEdgeScheduler:
+        """
+        Create a scheduler that syncs the message with the current view.
 
         Parameters
         ----------
-        sync_interval : `float | None`, optional
-            The interval to sync the message with the current view. If None, the message will be synced immediately.
+        sync_interval : `float | None`
+            Seconds to wait after the last sync request before syncing.
+            If None, sync requests made in the same event loop iteration are coalesced and synced immediately.
+        sync_max_wait : `float | None`
+            Maximum seconds a burst of sync requests can postpone the sync. If None, there is no limit.
 
         Returns
         -------
-        Callable[[], Awaitable[None]]
-            The function that syncs the message with the current view.
+        TrailingEdgeScheduler
+            The scheduler.
+        """
+        return TrailingEdgeScheduler(
+            self.__sync_immediately,
+            wait=sync_interval or 0,
+            max_wait=sync_max_wait,
+            loop=self.__loop,
+        )
+
+    async def __sync_immediately(self, interaction: "Interaction | None" = None) -> None:
+        """
+        Sync the message with current view, tracing and logging the sync if they are enabled.
 
-            **Note that this function returns a same coroutine while debouncing.**
+        Parameters
+        ----------
+        interaction : `discord.Interaction | None`, optional
+            The component interaction that triggered this sync.
         """
-        if sync_interval is None:
-            return self.__sync_immediately
+        tracer = self.__tracer
+        pending = tracer._begin() if tracer is not None else None  # noqa: SLF001
+        try:
+            outcome = await self.__sync(interaction)
+        except Exception:
+            if tracer is not None and pending is not None:
+                tracer._finish(pending, "failed")  # noqa: SLF001
+            raise
+        if tracer is not None and pending is not None:
+            tracer._finish(pending, outcome)  # noqa: SLF001
+
+        if self.__logger.isEnabledFor(logging.DEBUG):
+            self.__logger.debug("Synced %s: %s", self.__view_name, outcome, extra={"view": self.__view_name})
+
+    async def __sync(self, interaction: "Interaction | None") -> SyncOutcome:
+        """
+        Sync the message with current view.
 
-        return debounce(wait=sync_interval)(self.__sync_immediately)
+        Each render is stamped with a monotonically increasing number and at most one edit is in flight.
+        A render waiting for the in-flight edit is dropped if a newer render is made meanwhile,
+        so edits are never applied out of order.
 
-    async def __sync_immediately(self) -> None:
-        """Sync the message with current view."""
-        if self.message is None:
-            return
+        Parameters
+        ----------
+        interaction : `discord.Interaction | None`, optional
+            The component interaction that triggered this sync. If it has not been responded yet,
+            the message is edited as the initial response of the interaction instead of `Message.edit`.
 
-        # Do not re-render if the view is not changed
-        if self.__view_object.equals(upcoming := self.__view.render()):
-            return
+        Returns
+        -------
+        `SyncOutcome`
+            How the sync ended.
+        """
+        # the initial response of the interaction if it is still available
+        response = interaction.response if interaction is not None and not interaction.response.is_done() else None
+        if response is not None and (self.__view is None or self.__commit_lock.locked() or self.__render_may_suspend()):
+            # acknowledge now instead of waiting for the in-flight edit or a slow render, which may outlast
+            # the deadline of the interaction, and edit the message after them
+            await response.defer()
+            response = None
+
+        if self.__view is None:
+            # states of a hibernated view can not be changed
+            return "coalesced"
+
+        version = self.__view._version  # noqa: SLF001
+        rendered = "coalesced" if self.message is None else await self.__render_if_dirty()
+        if rendered != "changed":
+            if response is not None:
+                await response.defer()
+            return rendered
+
+        self.__render_stamp += 1
+        stamp = self.__render_stamp
+        if response is not None and self.__commit_lock.locked():
+            # an edit has started while rendering
+            await response.defer()
+            response = None
+
+        async with self.__commit_lock:
+            if stamp != self.__render_stamp:
+                # superseded by a newer render while waiting for the in-flight edit
+                self.__count("renders_superseded")
+                if response is not None:
+                    await response.defer()
+                return "superseded"
+
+            # maybe validation for self.__view is needed
+            await self.__push(self._process_view_for_discord("attachment"), response)
+
+        self.__rendered_version = max(self.__rendered_version, version)
+        self.__count("renders_committed")
+        return "committed"
+
+    async def __push(self, d: "ViewObjectDictWithAttachment", response: "InteractionResponse | None") -> None:
+        """Edit the message with the committed render, as the initial response of the interaction if given."""
+        try:
+            with self._measure("edit_seconds"):
+                if response is not None:
+                    await response.edit_message(**d)
+                else:
+                    await self.__edit(self.message, d)
+        except Exception:
+            # discard the uncommitted render so that the next sync renders and edits again
+            self.__view_object = ViewObject()
+            self.__view_key = None
+            self.__rendered_version = -1
+            if response is not None:
+                # the pending sync was taken over by the response. edit the message instead.
+                self._request_sync()
+            raise
+
+    def __render_may_suspend(self) -> bool:
+        """Return whether rendering the view may wait for other tasks, i.e. it is async or runs in an executor."""
+        view = self.__view
+        return self.__render_executor is not None or (view is not None and inspect.iscoroutinefunction(view.render))
+
+    async def __edit(self, message: "Message | PartialMessage", d: "ViewObjectDictWithAttachment") -> None:
+        channel = getattr(message, "channel", None)
+        await self.__dispatcher.submit(
+            partial(message.edit, **d),
+            key=getattr(message, "id", id(message)),
+            channel=getattr(channel, "id", None),
+            owner=self,
+        )
+
+    async def __respond(self, interaction: "Interaction") -> None:
+        """
+        Respond to the component interaction with the latest render.
+
+        This takes over the pending sync, so the state changes made in the callback are pushed
+        by the initial response of the interaction, saving one HTTP request per interaction.
+        """
+        await self.__scheduler.flush(partial(self.__sync_immediately, interaction))
+
+    async def __render_if_dirty(self) -> Literal["changed", "coalesced", "identical", "superseded"]:
+        """
+        Render the view if it has changed since the last committed render.
+
+        Returns
+        -------
+        `Literal["changed", "coalesced", "identical", "superseded"]`
+            "changed" if a view object different from the committed one has been rendered.
+            "coalesced" if no state has been changed since the last render, "identical" if the render
+            is identical to the committed one, and "superseded" if state changes were made while rendering.
+        """
+        view = await self.__wake()
+        version = view._version  # noqa: SLF001
+        # Do not re-render if no state is changed
+        if version == self.__rendered_version:
+            return "coalesced"
+
+        key = self.__render_key(view)
+        if key is not None and key == self.__view_key:
+            # states have been changed and changed back. the render is memoized, so the view is not changed.
+            self.__rendered_version = version
+            self.__count("renders_skipped")
+            return "identical"
+
+        self.__render_seq += 1
+        seq = self.__render_seq
+        upcoming = await self.__render(view, key)
+        if seq != self.__render_seq or view._version != version:  # noqa: SLF001
+            # states have been changed while rendering. the sync requested by the change renders them.
+            self.__count("renders_superseded")
+            return "superseded"
+        upcoming = self.__reconcile(upcoming)
+
+        # Do not re-edit if the view is not changed
+        with self._measure("equals_seconds"):
+            unchanged = self.__view_object.equals(upcoming)
+        if unchanged:
+            self.__rendered_version = version
+            self.__view_key = key
+            self.__count("renders_skipped")
+            return "identical"
+
+        self.__view_object = self.__commit(upcoming)
+        self.__view_key = key
+        return "changed"
+
+    async def _prepare_send(self) -> None:
+        """Render the view to send it for the first time. This method must be awaited by `send` in subclasses."""
+        await self.__prepare(await self.__wake())
+
+    async def __prepare(self, view: "View") -> None:
+        key = self.__render_key(view)
+        version = view._version  # noqa: SLF001
+        self.__render_seq += 1
+        view_object = await self.__render(view, key)
+        self.__rendered_version = version
+        self.__view_object = self.__commit(self.__reconcile(view_object))
+        self.__view_key = key
+
+    @staticmethod
+    def __commit(view_object: ViewObject) -> ViewObject:
+        """
+        Freeze the fingerprint of the view object to be committed.
 
-        self.__view_object = upcoming
+        Its components are the live ones, which the next render patches in place,
+        so the fingerprint must be computed before that to detect changes of components.
+        """
+        view_object.fingerprint  # noqa: B018
+        return view_object
+
+    def __render_key(self, view: "View") -> "Hashable | None":
+        return None if self.__render_cache is None else view.render_key()
 
-        # maybe validation for self.__view is needed
-        d = self._process_view_for_discord("attachment")
-        await self.message.edit(**d)
+    async def __render(self, view: "View", key: "Hashable | None") -> ViewObject:
+        """
+        Render the view, reusing the memoized render for the key if any.
+
+        Memoized renders are kept as copies never attached to the message, because reconciliation patches
+        the live components in place. Renders with files are not memoized since files can be sent only once.
+        """
+        if self.__render_cache is None or key is None:
+            return await self.__call_render(view)
+
+        if (cached := self.__render_cache.get(key)) is None:
+            upcoming = await self.__call_render(view)
+            if upcoming.files is None:
+                self.__render_cache.put(key, _copy_view_object(upcoming))
+            return upcoming
+
+        return _copy_view_object(cached)
+
+    async def __call_render(self, view: "View") -> ViewObject:
+        """Call `View.render`, running it in the render executor if any, and await the result if it is awaitable."""
+        with self._measure("render_seconds"):
+            if inspect.iscoroutinefunction(view.render) or self.__render_executor is None:
+                result = view.render()
+            else:
+                executor = None if self.__render_executor is True else self.__render_executor
+                result = await self.__loop.run_in_executor(executor, view.render)
+            # a plain `def` may return an awaitable too
+            return await result if inspect.isawaitable(result) else result
+
+    def __reconcile(self, view_object: ViewObject) -> ViewObject:
+        """
+        Reconcile the internal view with the components of the view object.
+
+        Components matching the live ones are patched in place and the live ones are put back into the view object,
+        so auto-generated custom_ids stay stable across renders and the fingerprint only reflects actual changes.
+        """
+        components = _reconcile(self.__raw_view, view_object.components or [])
+        if view_object.components is not None:
+            view_object.components = components
+        return view_object
 
     def stop(self) -> None:
         """Stop the view and return the state of all states in the view."""
-        self.__loop.create_task(self.__sync_immediately())  # execute last sync before stop
+        # execute last sync before stop. this also flushes the pending sync of the scheduler.
+        self.__loop.create_task(self.__scheduler.flush())
         self.__raw_view.stop()
 
+        if self.__timeout_entry is not None:
+            self.__timeout_entry.cancel()
+        if self.__idle_entry is not None:
+            self.__idle_entry.cancel()
+        if not self.__stopped.done():
+            self.__stopped.set_result(False)
+
     async def wait(self) -> ViewResult:
         """
         Wait for the view to stop and return the state of all states in the view.
@@ -139,20 +715,21 @@ class ViewController:
 
             `states` is a dictionary of all states in the view.
         """
-        is_timed_out = await self.__raw_view.wait()
+        is_timed_out = await asyncio.shield(self.__stopped)
 
-        if is_timed_out:
-            # this is got from discord.ui.View._dispatch_timeout()
-            timeout_task_name = f"discord-ui-view-timeout-{self.__raw_view.id}"
-            await wait_tasks_by_name([timeout_task_name])
+        if is_timed_out and self.__timeout_task is not None:
+            # wait for on_timeout to complete
+            await asyncio.gather(self.__timeout_task, return_exceptions=True)
 
         d = {}
-        for key, state in self._get_all_state_in_view():
+        # states of a hibernated view are read from the store without rendering it
+        view = self.__view or self.__restore()
+        for key, state in self._get_all_state_in_view(view):
             d[key] = state.get_state()
         return ViewResult(is_timed_out, d)
 
-    def _get_all_state_in_view(self) -> "Generator[tuple[str, State[Any]], None, None]":
-        for k, v in self.__view.__dict__.items():
+    def _get_all_state_in_view(self, view: "View") -> "Generator[tuple[str, State[Any]], None, None]":
+        for k, v in view.__dict__.items():
             if isinstance(v, State):
                 yield k, v
 
@@ -185,18 +762,17 @@ class ViewController:
             This can be passed to `discord.abc.Messageable.send` or `discord.abc.Messageable.edit` and etc
             as unpacked keyword arguments.
         """
-        view_object = self.__view_object
+        with self._measure("process_seconds"):
+            view_object = self.__view_object
 
-        # implicitly clear view every time see:#54
-        v = self.__raw_view
-        v.clear_items()
-        if view_object.components:
-            for child in view_object.components:
-                v.add_item(child)
+            # patch items in place instead of clearing the view every time see:#54
+            v = self.__raw_view
+            _reconcile(v, view_object.components or [])
 
-        if mode == "attachment":
-            # implicitly clear items every time see:#54
+        if self.__metrics is not None:
+            self.__metrics.observe("payload_bytes", _payload_size(view_object, v), view=self.__view_name)
 
+        if mode == "attachment":
             return {
                 "content": view_object.content,
                 "embeds": view_object.embeds or [],
@@ -0,0 +1,291 @@
+import asyncio
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+from weakref import WeakKeyDictionary
+
+from discord import HTTPException, RateLimited
+
+__all__ = [
+    "EditDispatcher",
+    "get_default_dispatcher",
+]
+
+_R = TypeVar("_R")
+
+# status code of "Too Many Requests"
+_TOO_MANY_REQUESTS = 429
+
+
+class _Job(Generic[_R]):
+    __slots__ = ("attempts", "channel", "fn", "future", "key", "owner")
+
+    def __init__(
+        self,
+        *,
+        key: Hashable,
+        channel: Hashable,
+        owner: Hashable,
+        fn: Callable[[], Awaitable[_R]],
+        future: "asyncio.Future[_R]",
+    ) -> None:
+        self.key = key
+        self.channel = channel
+        self.owner = owner
+        self.fn = fn
+        self.future = future
+        self.attempts = 0
+
+
+class EditDispatcher:
+    """
+    EditDispatcher limits and orders message edits across all controllers.
+
+    - Edits run with a global and a per-channel concurrency limit.
+    - Queued edits are taken round-robin between owners (usually controllers), so a busy view can not starve others.
+    - A queued edit for a message is replaced by a newer edit for the same message.
+    - An edit rejected with 429 blocks its channel for `retry_after` seconds and is retried.
+
+    Parameters
+    ----------
+    max_concurrency : `int`, optional
+        Maximum number of edits in flight across all channels, by default 50.
+    max_concurrency_per_channel : `int`, optional
+        Maximum number of edits in flight per channel, by default 1.
+    max_retries : `int`, optional
+        Maximum number of retries of an edit rejected with 429, by default 3.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 50,
+        max_concurrency_per_channel: int = 1,
+        max_retries: int = 3,
+    ) -> None:
+        self.__max_concurrency = max_concurrency
+        self.__max_concurrency_per_channel = max_concurrency_per_channel
+        self.__max_retries = max_retries
+
+        # pending jobs per owner, and owners with pending jobs in round-robin order
+        self.__queues: dict[Hashable, deque[_Job[Any]]] = {}
+        self.__owners: deque[Hashable] = deque()
+        # pending jobs by key, to collapse them
+        self.__pending: dict[Hashable, _Job[Any]] = {}
+
+        self.__active = 0
+        self.__active_per_channel: Counter[Hashable] = Counter()
+        self.__blocked_until: dict[Hashable, float] = {}
+        self.__wakeup: asyncio.TimerHandle | None = None
+        self.__tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def active(self) -> int:
+        """
+        Return the number of edits in flight.
+
+        Returns
+        -------
+        int
+            The number of edits in flight.
+        """
+        return self.__active
+
+    @property
+    def pending(self) -> int:
+        """
+        Return the number of queued edits.
+
+        Returns
+        -------
+        int
+            The number of queued edits.
+        """
+        return len(self.__pending)
+
+    async def submit(
+        self,
+        fn: Callable[[], Awaitable[_R]],
+        *,
+        key: Hashable,
+        channel: Hashable = None,
+        owner: Hashable = None,
+    ) -> _R:
+        """
+        Submit an edit and wait for it.
+
+        Parameters
+        ----------
+        fn : `Callable[[], Awaitable[_R]]`
+            The function performing the edit. This may be called more than once when the edit is rate limited.
+        key : `Hashable`
+            The key of the edited resource, usually the message id. A queued edit with the same key is replaced.
+        channel : `Hashable`, optional
+            The key of the rate limit bucket, usually the channel id. If None, `key` is used.
+        owner : `Hashable`, optional
+            The key used for fair queuing, usually the controller.
+
+        Returns
+        -------
+        `_R`
+            The result of `fn`. If this edit is replaced by a newer edit, the result of the newer edit.
+        """
+        if (queued := self.__pending.get(key)) is not None:
+            # collapse into the latest edit. the previous submitter waits for the latest one.
+            queued.fn = fn
+            return await asyncio.shield(queued.future)
+
+        channel = key if channel is None else channel
+        job: _Job[_R] = _Job(key=key, channel=channel, owner=owner, fn=fn, future=asyncio.get_running_loop().create_future())
+        self.__enqueue(job)
+        self.__pump()
+        return await asyncio.shield(job.future)
+
+    def __enqueue(self, job: "_Job[Any]", *, front: bool = False) -> None:
+        queue = self.__queues.get(job.owner)
+        if queue is None:
+            queue = self.__queues[job.owner] = deque()
+            self.__owners.append(job.owner)
+
+        if front:
+            queue.appendleft(job)
+        else:
+            queue.append(job)
+        self.__pending[job.key] = job
+
+    def __is_available(self, channel: Hashable, now: float) -> bool:
+        if self.__active_per_channel[channel] >= self.__max_concurrency_per_channel:
+            return False
+        return self.__blocked_until.get(channel, 0) <= now
+
+    def __pump(self) -> None:
+        """Start queued jobs while the limits allow, taking one job per owner in turn."""
+        now = asyncio.get_running_loop().time()
+        idle_turns = 0
+        while self.__owners and self.__active < self.__max_concurrency and idle_turns < len(self.__owners):
+            owner = self.__owners[0]
+            self.__owners.rotate(-1)
+            queue = self.__queues[owner]
+
+            job = next((j for j in queue if self.__is_available(j.channel, now)), None)
+            if job is None:
+                idle_turns += 1
+                continue
+
+            idle_turns = 0
+            queue.remove(job)
+            if not queue:
+                del self.__queues[owner]
+                self.__owners.remove(owner)
+            self.__start(job)
+
+        self.__schedule_wakeup(now)
+
+    def __start(self, job: "_Job[Any]") -> None:
+        del self.__pending[job.key]
+        self.__active += 1
+        self.__active_per_channel[job.channel] += 1
+
+        task = asyncio.get_running_loop().create_task(self.__run(job))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    def __schedule_wakeup(self, now: float) -> None:
+        """Wake up when the earliest rate limited channel with queued jobs is released."""
+        if self.__wakeup is not None:
+            self.__wakeup.cancel()
+            self.__wakeup = None
+
+        # forget expired rate limits
+        for channel in [c for c, until in self.__blocked_until.items() if until <= now]:
+            del self.__blocked_until[channel]
+
+        blocked = [until for job in self.__pending.values() if (until := self.__blocked_until.get(job.channel, 0)) > now]
+        if blocked:
+            self.__wakeup = asyncio.get_running_loop().call_at(min(blocked), self.__pump)
+
+    async def __run(self, job: "_Job[Any]") -> None:
+        try:
+            result = await job.fn()
+        except (RateLimited, HTTPException) as e:
+            retry_after = _retry_after(e)
+            if retry_after is None:
+                _set_exception(job.future, e)
+                return
+
+            self.__blocked_until[job.channel] = asyncio.get_running_loop().time() + retry_after
+            job.attempts += 1
+            if (newer := self.__pending.get(job.key)) is not None:
+                # a newer edit is queued for the same resource. it supersedes this one.
+                newer.future.add_done_callback(lambda f: _chain(f, job.future))
+            elif job.attempts > self.__max_retries:
+                _set_exception(job.future, e)
+            else:
+                self.__enqueue(job, front=True)
+        except Exception as e:  # noqa: BLE001
+            _set_exception(job.future, e)
+        else:
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self.__active -= 1
+            self.__active_per_channel[job.channel] -= 1
+            if self.__active_per_channel[job.channel] <= 0:
+                del self.__active_per_channel[job.channel]
+            self.__pump()
+
+
+def _retry_after(e: Exception) -> float | None:
+    """Return seconds to wait before retrying, or None if the error is not a rate limit."""
+    if isinstance(e, RateLimited):
+        return e.retry_after
+
+    if isinstance(e, HTTPException) and e.status == _TOO_MANY_REQUESTS:
+        headers = getattr(e.response, "headers", None) or {}
+        try:
+            return float(headers.get("Retry-After", 1.0))
+        except (TypeError, ValueError):
+            return 1.0
+
+    return None
+
+
+def _set_exception(future: "asyncio.Future[Any]", e: BaseException) -> None:
+    if not future.done():
+        future.set_exception(e)
+
+
+def _chain(source: "asyncio.Future[Any]", target: "asyncio.Future[Any]") -> None:
+    if target.done():
+        return
+    if source.cancelled():
+        target.cancel()
+    elif (e := source.exception()) is not None:
+        target.set_exception(e)
+    else:
+        target.set_result(source.result())
+
+
+# the dispatcher holds futures, timers and counters bound to a loop, so it is shared per loop
+_default_dispatchers: "WeakKeyDictionary[asyncio.AbstractEventLoop, EditDispatcher]" = WeakKeyDictionary()
+
+
+def get_default_dispatcher(loop: asyncio.AbstractEventLoop | None = None) -> EditDispatcher:
+    """
+    Return the dispatcher shared by controllers on the event loop created without `dispatcher`.
+
+    Parameters
+    ----------
+    loop : `asyncio.AbstractEventLoop | None`, optional
+        The event loop. By default, the current event loop.
+
+    Returns
+    -------
+    EditDispatcher
+        The shared dispatcher of the event loop.
+    """
+    loop = loop or asyncio.get_event_loop()
+    dispatcher = _default_dispatchers.get(loop)
+    if dispatcher is None:
+        dispatcher = _default_dispatchers[loop] = EditDispatcher()
+    return dispatcher
@@ -5,15 +5,20 @@ from discord import CategoryChannel, ForumChannel
 from .controller import ViewController
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from discord import Interaction
 
+    from ..hibernation import HibernationConfig  # noqa: TID252
+    from ..instrumentation import MetricsRegistry  # noqa: TID252
     from ..view import View  # noqa: TID252
+    from .dispatcher import EditDispatcher
 
 
 class InteractionController(ViewController):
     """InteractionController is a class that controls the view with `discord.abc.Messageable`."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         view: "View",
         *,
@@ -21,25 +26,45 @@ class InteractionController(ViewController):
         timeout: float | None = 180,
         ephemeral: bool = False,
         sync_interval: float | None = None,
+        sync_max_wait: float | None = None,
+        dispatcher: "EditDispatcher | None" = None,
+        hibernation: "HibernationConfig | None" = None,
+        render_cache: int | None = None,
+        render_in_executor: "bool | Executor" = False,
+        metrics: "MetricsRegistry | None" = None,
+        trace: int | None = None,
     ) -> None:
-        super().__init__(view, timeout=timeout, sync_interval=sync_interval)
+        super().__init__(
+            view,
+            timeout=timeout,
+            sync_interval=sync_interval,
+            sync_max_wait=sync_max_wait,
+            dispatcher=dispatcher,
+            hibernation=hibernation,
+            render_cache=render_cache,
+            render_in_executor=render_in_executor,
+            metrics=metrics,
+            trace=trace,
+        )
         self.__interaction = interaction
         self.__ephemeral = ephemeral
 
     async def send(self) -> None:
         """Send the view to the channel."""
         target = self.__interaction
+        await self._prepare_send()
         view_kwargs = self._process_view_for_discord("files")
 
-        if target.is_expired():
-            if target.channel is not None and not isinstance(target.channel, CategoryChannel | ForumChannel):
-                self.message = await target.channel.send(**view_kwargs)
-            return
+        with self._measure("send_seconds"):
+            if target.is_expired():
+                if target.channel is not None and not isinstance(target.channel, CategoryChannel | ForumChannel):
+                    self.message = await target.channel.send(**view_kwargs)
+                return
 
-        if target.response.is_done():
-            self.message = await target.followup.send(**view_kwargs, ephemeral=self.__ephemeral, wait=True)
-            return
+            if target.response.is_done():
+                self.message = await target.followup.send(**view_kwargs, ephemeral=self.__ephemeral, wait=True)
+                return
 
-        await target.response.send_message(**view_kwargs, ephemeral=self.__ephemeral)
-        self.message = await target.original_response()
-        return
+            await target.response.send_message(**view_kwargs, ephemeral=self.__ephemeral)
+            self.message = await target.original_response()
+            return
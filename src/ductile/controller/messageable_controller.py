@@ -3,28 +3,53 @@ from typing import TYPE_CHECKING
 from .controller import ViewController
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     import discord
 
+    from ..hibernation import HibernationConfig  # noqa: TID252
+    from ..instrumentation import MetricsRegistry  # noqa: TID252
     from ..view import View  # noqa: TID252
+    from .dispatcher import EditDispatcher
 
 
 class MessageableController(ViewController):
     """MessageableController is a class that controls the view with `discord.abc.Messageable`."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         view: "View",
         *,
         messageable: "discord.abc.Messageable",
         timeout: float | None = 180,
         sync_interval: float | None = None,
+        sync_max_wait: float | None = None,
+        dispatcher: "EditDispatcher | None" = None,
+        hibernation: "HibernationConfig | None" = None,
+        render_cache: int | None = None,
+        render_in_executor: "bool | Executor" = False,
+        metrics: "MetricsRegistry | None" = None,
+        trace: int | None = None,
     ) -> None:
-        super().__init__(view, timeout=timeout, sync_interval=sync_interval)
+        super().__init__(
+            view,
+            timeout=timeout,
+            sync_interval=sync_interval,
+            sync_max_wait=sync_max_wait,
+            dispatcher=dispatcher,
+            hibernation=hibernation,
+            render_cache=render_cache,
+            render_in_executor=render_in_executor,
+            metrics=metrics,
+            trace=trace,
+        )
         self.__messageable = messageable
 
     async def send(self) -> None:
         """Send the view to the channel."""
         target = self.__messageable
+        await self._prepare_send()
         view_kwargs = self._process_view_for_discord("files")
 
-        self.message = await target.send(**view_kwargs)
+        with self._measure("send_seconds"):
+            self.message = await target.send(**view_kwargs)
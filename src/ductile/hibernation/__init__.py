@@ -0,0 +1,9 @@
+from .config import HibernationConfig
+from .store import HibernationStore, MemoryHibernationStore, SqliteHibernationStore
+
+__all__ = [
+    "HibernationConfig",
+    "HibernationStore",
+    "MemoryHibernationStore",
+    "SqliteHibernationStore",
+]
@@ -0,0 +1,36 @@
+from typing import TYPE_CHECKING
+
+from typing_extensions import NotRequired, Required, TypedDict
+
+from .store import HibernationStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..view import View  # noqa: TID252
+
+__all__ = [
+    "HibernationConfig",
+]
+
+
+class HibernationConfig(TypedDict):
+    """
+    A hibernation configuration.
+
+    Attributes
+    ----------
+    idle : `float`
+        Seconds without interactions and syncs before the view hibernates.
+    store : `HibernationStore`
+        The store to keep the states of the hibernated view, and the positions of `Paginator`,
+        `VirtualSelect` and `SearchableSelect` on it. Views holding other helpers with a position
+        that can not be kept (e.g. `CursorPaginator`) do not hibernate.
+    factory : `Callable[[], View]`, optional
+        The function to rebuild the view on wake up. By default, the class of the view is called without arguments.
+        It must return a view of the same class as the hibernated view.
+    """
+
+    idle: Required[float]
+    store: Required[HibernationStore]
+    factory: NotRequired["Callable[[], View]"]
@@ -0,0 +1,136 @@
+import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = [
+    "HibernationStore",
+    "MemoryHibernationStore",
+    "SqliteHibernationStore",
+]
+
+
+class HibernationStore:
+    """
+    HibernationStore is a base class of stores that keep the serialized states of hibernated views.
+
+    Methods of the store are called on the event loop, so they should return quickly.
+    """
+
+    def save(self, key: str, data: bytes) -> None:
+        """
+        Save the serialized states of a view.
+
+        Parameters
+        ----------
+        key : `str`
+            The key of the view, usually the message id.
+        data : `bytes`
+            The serialized states.
+
+        Raises
+        ------
+        NotImplementedError
+            If this method is not implemented in subclasses.
+        """
+        raise NotImplementedError
+
+    def load(self, key: str) -> bytes | None:
+        """
+        Load the serialized states of a view.
+
+        Parameters
+        ----------
+        key : `str`
+            The key of the view.
+
+        Returns
+        -------
+        `bytes | None`
+            The serialized states. None if the key is not found.
+
+        Raises
+        ------
+        NotImplementedError
+            If this method is not implemented in subclasses.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """
+        Delete the serialized states of a view. This does nothing if the key is not found.
+
+        Parameters
+        ----------
+        key : `str`
+            The key of the view.
+
+        Raises
+        ------
+        NotImplementedError
+            If this method is not implemented in subclasses.
+        """
+        raise NotImplementedError
+
+
+class MemoryHibernationStore(HibernationStore):
+    """A store that keeps the serialized states in a dictionary."""
+
+    def __init__(self) -> None:
+        self.__data: dict[str, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def save(self, key: str, data: bytes) -> None:
+        self.__data[key] = data
+
+    def load(self, key: str) -> bytes | None:
+        return self.__data.get(key)
+
+    def delete(self, key: str) -> None:
+        self.__data.pop(key, None)
+
+
+class SqliteHibernationStore(HibernationStore):
+    """
+    A store that keeps the serialized states in a sqlite database.
+
+    Parameters
+    ----------
+    path : `str | Path`, optional
+        The path of the database file, by default ":memory:".
+    table : `str`, optional
+        The name of the table, by default "ductile_hibernation".
+    """
+
+    def __init__(self, path: "str | Path" = ":memory:", *, table: str = "ductile_hibernation") -> None:
+        if not table.isidentifier():
+            msg = f"Invalid table name: {table}"
+            raise ValueError(msg)
+
+        self.__table = table
+        self.__connection = sqlite3.connect(path)
+        with self.__connection:
+            self.__connection.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, data BLOB NOT NULL)")
+
+    def __len__(self) -> int:
+        (count,) = self.__connection.execute(f"SELECT COUNT(*) FROM {self.__table}").fetchone()  # noqa: S608
+        return count
+
+    def save(self, key: str, data: bytes) -> None:
+        with self.__connection:
+            self.__connection.execute(f"INSERT OR REPLACE INTO {self.__table} (key, data) VALUES (?, ?)", (key, data))  # noqa: S608
+
+    def load(self, key: str) -> bytes | None:
+        row = self.__connection.execute(f"SELECT data FROM {self.__table} WHERE key = ?", (key,)).fetchone()  # noqa: S608
+        return None if row is None else row[0]
+
+    def delete(self, key: str) -> None:
+        with self.__connection:
+            self.__connection.execute(f"DELETE FROM {self.__table} WHERE key = ?", (key,))  # noqa: S608
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.__connection.close()
@@ -0,0 +1,17 @@
+from .memory import InMemoryMetrics, Summary
+from .prometheus import to_prometheus
+from .registry import Metric, MetricsRegistry, get_default_metrics, set_default_metrics
+from .tracing import SyncOutcome, SyncTrace, SyncTracer
+
+__all__ = [
+    "InMemoryMetrics",
+    "Metric",
+    "MetricsRegistry",
+    "Summary",
+    "SyncOutcome",
+    "SyncTrace",
+    "SyncTracer",
+    "get_default_metrics",
+    "set_default_metrics",
+    "to_prometheus",
+]
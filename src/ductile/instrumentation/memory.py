@@ -0,0 +1,86 @@
+from typing import NamedTuple
+
+from .registry import Metric, MetricsRegistry
+
+__all__ = [
+    "InMemoryMetrics",
+    "Summary",
+]
+
+
+class Summary(NamedTuple):
+    """
+    Summary is a named tuple aggregating the observations of a metric.
+
+    Parameters
+    ----------
+    NamedTuple : `Summary`
+        The number, the sum and the maximum of the observations.
+    """
+
+    count: int
+    total: float
+    max: float
+
+    @property
+    def mean(self) -> float:
+        """
+        property: The mean of the observations.
+
+        Returns
+        -------
+        float
+            The mean of the observations. 0 if nothing is observed.
+        """
+        return self.total / self.count if self.count else 0.0
+
+
+class InMemoryMetrics(MetricsRegistry):
+    """
+    InMemoryMetrics aggregates metrics in memory by metric and View class.
+
+    Observations are aggregated into a `Summary` and counters into their sums, so the memory used is bounded
+    by the number of View classes. Export them with `to_prometheus`, or read them with `summaries` and `counters`.
+    """
+
+    def __init__(self) -> None:
+        self.__summaries: dict[tuple[Metric, str], Summary] = {}
+        self.__counters: dict[tuple[Metric, str], float] = {}
+
+    def observe(self, metric: Metric, value: float, *, view: str) -> None:
+        key = (metric, view)
+        if (summary := self.__summaries.get(key)) is None:
+            self.__summaries[key] = Summary(1, value, value)
+        else:
+            self.__summaries[key] = Summary(summary.count + 1, summary.total + value, max(summary.max, value))
+
+    def increment(self, metric: Metric, *, view: str, value: float = 1) -> None:
+        key = (metric, view)
+        self.__counters[key] = self.__counters.get(key, 0) + value
+
+    def summaries(self) -> dict[tuple[Metric, str], Summary]:
+        """
+        Return the aggregated observations.
+
+        Returns
+        -------
+        `dict[tuple[Metric, str], Summary]`
+            The summaries by metric and View class.
+        """
+        return dict(self.__summaries)
+
+    def counters(self) -> dict[tuple[Metric, str], float]:
+        """
+        Return the counters.
+
+        Returns
+        -------
+        `dict[tuple[Metric, str], float]`
+            The counters by metric and View class.
+        """
+        return dict(self.__counters)
+
+    def reset(self) -> None:
+        """Clear all metrics."""
+        self.__summaries.clear()
+        self.__counters.clear()
@@ -0,0 +1,55 @@
+from itertools import groupby
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .memory import InMemoryMetrics
+
+__all__ = [
+    "to_prometheus",
+]
+
+
+def to_prometheus(metrics: "InMemoryMetrics", *, prefix: str = "ductile_") -> str:
+    """
+    Export the metrics in the Prometheus text exposition format.
+
+    Observations are exported as summaries without quantiles (`_count` and `_sum`) plus a `_max` gauge,
+    and counters as `_total` counters. Every sample is labeled with `view`.
+
+    Parameters
+    ----------
+    metrics : `InMemoryMetrics`
+        The metrics to export.
+    prefix : `str`, optional
+        The prefix of the metric names, by default "ductile_".
+
+    Returns
+    -------
+    str
+        The metrics. Serve this from the endpoint scraped by Prometheus.
+    """
+    lines: list[str] = []
+
+    summaries = sorted(metrics.summaries().items())
+    for metric, group in groupby(summaries, key=lambda item: item[0][0]):
+        name = prefix + metric
+        samples = list(group)
+        lines.append(f"# TYPE {name} summary")
+        for (_, view), summary in samples:
+            lines.append(f"{name}_count{_labels(view)} {summary.count}")
+            lines.append(f"{name}_sum{_labels(view)} {summary.total!r}")
+        lines.append(f"# TYPE {name}_max gauge")
+        lines.extend(f"{name}_max{_labels(view)} {summary.max!r}" for (_, view), summary in samples)
+
+    counters = sorted(metrics.counters().items())
+    for metric, group in groupby(counters, key=lambda item: item[0][0]):
+        name = f"{prefix}{metric}_total"
+        lines.append(f"# TYPE {name} counter")
+        lines.extend(f"{name}{_labels(view)} {value!r}" for (_, view), value in group)
+
+    return "".join(line + "\n" for line in lines)
+
+
+def _labels(view: str) -> str:
+    escaped = view.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'{{view="{escaped}"}}'
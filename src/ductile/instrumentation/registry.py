@@ -0,0 +1,168 @@
+import time
+from typing import Literal
+
+__all__ = [
+    "Metric",
+    "MetricsRegistry",
+    "get_default_metrics",
+    "set_default_metrics",
+]
+
+Metric = Literal[
+    "render_seconds",
+    "equals_seconds",
+    "process_seconds",
+    "edit_seconds",
+    "send_seconds",
+    "payload_bytes",
+    "renders_committed",
+    "renders_skipped",
+    "renders_superseded",
+    "timeouts",
+]
+"""
+Metrics reported by controllers.
+
+Observations
+------------
+render_seconds
+    Duration of `View.render`. Memoized renders are not observed.
+equals_seconds
+    Duration of `ViewObject.equals` comparing a render with the committed one.
+process_seconds
+    Duration of `_process_view_for_discord`.
+edit_seconds
+    Duration of editing the message, including the time queued in the dispatcher.
+send_seconds
+    Duration of sending the view.
+payload_bytes
+    Size of the JSON payload of the content, the embeds and the components sent or edited.
+
+Counters
+--------
+renders_committed
+    Renders edited into the message.
+renders_skipped
+    Renders identical to the committed one, so not edited.
+renders_superseded
+    Renders discarded because newer state changes were made meanwhile.
+timeouts
+    Views timed out.
+"""
+
+
+class MetricsRegistry:
+    """
+    MetricsRegistry is a base class of the sinks of the metrics reported by controllers.
+
+    Override `observe` and `increment` to forward the metrics to your metrics backend.
+    Every metric is labeled with the qualified name of the View class, so hot views can be found.
+    Methods of the registry are called on the event loop in the hot path of syncs, so they should return quickly.
+    """
+
+    def observe(self, metric: Metric, value: float, *, view: str) -> None:
+        """
+        Record an observation such as a duration or a size.
+
+        Parameters
+        ----------
+        metric : `Metric`
+            The observed metric.
+        value : `float`
+            The observed value.
+        view : `str`
+            The qualified name of the View class.
+
+        Raises
+        ------
+        NotImplementedError
+            If this method is not implemented in subclasses.
+        """
+        raise NotImplementedError
+
+    def increment(self, metric: Metric, *, view: str, value: float = 1) -> None:
+        """
+        Increment a counter.
+
+        Parameters
+        ----------
+        metric : `Metric`
+            The counter.
+        view : `str`
+            The qualified name of the View class.
+        value : `float`, optional
+            The increment, by default 1.
+
+        Raises
+        ------
+        NotImplementedError
+            If this method is not implemented in subclasses.
+        """
+        raise NotImplementedError
+
+    def time(self, metric: Metric, *, view: str) -> "_Timer":
+        """
+        Return a context manager observing the duration of the block in seconds.
+
+        Parameters
+        ----------
+        metric : `Metric`
+            The observed metric.
+        view : `str`
+            The qualified name of the View class.
+
+        Returns
+        -------
+        `ContextManager[None]`
+            The context manager.
+        """
+        return _Timer(self, metric, view)
+
+
+class _Timer:
+    __slots__ = ("metric", "registry", "start", "view")
+
+    def __init__(self, registry: MetricsRegistry, metric: Metric, view: str) -> None:
+        self.registry = registry
+        self.metric: Metric = metric
+        self.view = view
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: object,
+    ) -> None:
+        self.registry.observe(self.metric, time.perf_counter() - self.start, view=self.view)
+
+
+_default_metrics: MetricsRegistry | None = None
+
+
+def get_default_metrics() -> MetricsRegistry | None:
+    """
+    Return the registry used by controllers created without `metrics`.
+
+    Returns
+    -------
+    `MetricsRegistry | None`
+        The registry. None if metrics are disabled, which is the default.
+    """
+    return _default_metrics
+
+
+def set_default_metrics(registry: MetricsRegistry | None) -> None:
+    """
+    Set the registry used by controllers created without `metrics` from now on.
+
+    Parameters
+    ----------
+    registry : `MetricsRegistry | None`
+        The registry. None disables metrics.
+    """
+    global _default_metrics  # noqa: PLW0603
+    _default_metrics = registry
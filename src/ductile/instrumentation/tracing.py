@@ -0,0 +1,151 @@
+import asyncio
+from collections import deque
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+if TYPE_CHECKING:
+    from discord import ui
+
+__all__ = [
+    "SyncOutcome",
+    "SyncTrace",
+    "SyncTracer",
+]
+
+SyncOutcome = Literal["committed", "identical", "coalesced", "superseded", "failed"]
+
+# the interaction being dispatched in the current task, as (interaction id, callback name)
+_INTERACTION: ContextVar[tuple[int, str] | None] = ContextVar("ductile_interaction", default=None)
+
+
+def _callback_name(item: "ui.Item[Any]") -> str:
+    """Return the qualified name of the callback given to the component, e.g. `CounterView.increment`."""
+    for value in item.__dict__.values():
+        if callable(value) and not isinstance(value, type):
+            return getattr(value, "__qualname__", type(value).__qualname__)
+    return f"{type(item).__qualname__}.callback"
+
+
+class SyncTrace(NamedTuple):
+    """
+    SyncTrace is a named tuple recording why a sync happened and how it ended.
+
+    Parameters
+    ----------
+    NamedTuple : `SyncTrace`
+        The trace of a sync.
+
+        `states` are the attribute names of the States changed since the previous sync, in order of change.
+        `callbacks` and `interactions` are the component callbacks and the interaction ids the changes were made in.
+
+        `outcome` is "committed" if the render was edited into the message, "identical" if the render was
+        identical to the committed one, "coalesced" if an earlier sync had already rendered the changes,
+        "superseded" if the render was discarded for a newer one, and "failed" if the edit failed.
+
+        `started_at` is the loop time of the first change and `elapsed` the seconds from it to the outcome.
+    """
+
+    states: tuple[str, ...]
+    callbacks: tuple[str, ...]
+    interactions: tuple[int, ...]
+    outcome: SyncOutcome
+    started_at: float
+    elapsed: float
+
+    def format(self) -> str:
+        """
+        Format the trace in a line.
+
+        Returns
+        -------
+        str
+            The trace.
+        """
+        states = ", ".join(self.states) or "-"
+        callbacks = ", ".join(self.callbacks) or "-"
+        return f"{self.outcome:<10} {self.elapsed * 1e3:8.2f}ms  states: {states}  callbacks: {callbacks}"
+
+
+class _PendingTrace:
+    __slots__ = ("callbacks", "interactions", "started_at", "states")
+
+    def __init__(self, started_at: float) -> None:
+        self.started_at = started_at
+        # dicts keep the order of the first change and drop duplicates
+        self.states: dict[str, None] = {}
+        self.callbacks: dict[str, None] = {}
+        self.interactions: dict[int, None] = {}
+
+
+class SyncTracer:
+    """
+    SyncTracer keeps the traces of the latest syncs of a view in a ring buffer.
+
+    Enable this with `trace` of the controller, then read `ViewController.tracer` to find redundant syncs.
+
+    Parameters
+    ----------
+    maxlen : `int`
+        Maximum number of traces to keep.
+    loop : `asyncio.AbstractEventLoop`
+        The event loop whose clock times the syncs.
+    """
+
+    def __init__(self, maxlen: int, *, loop: asyncio.AbstractEventLoop) -> None:
+        self.__traces: deque[SyncTrace] = deque(maxlen=maxlen)
+        self.__pending: _PendingTrace | None = None
+        self.__loop = loop
+
+    @property
+    def traces(self) -> list[SyncTrace]:
+        """
+        property: The kept traces, oldest first.
+
+        Returns
+        -------
+        list[SyncTrace]
+            The kept traces.
+        """
+        return list(self.__traces)
+
+    def dump(self) -> str:
+        """
+        Format the kept traces, a line per trace.
+
+        Returns
+        -------
+        str
+            The traces.
+        """
+        return "".join(trace.format() + "\n" for trace in self.__traces)
+
+    def clear(self) -> None:
+        """Drop the kept traces."""
+        self.__traces.clear()
+
+    def _record_change(self, state: str | None) -> None:
+        """Record a change requesting a sync, made by the State named `state` or directly by `View.sync`."""
+        if (pending := self.__pending) is None:
+            pending = self.__pending = _PendingTrace(self.__loop.time())
+        if state is not None:
+            pending.states[state] = None
+        if (interaction := _INTERACTION.get()) is not None:
+            pending.interactions[interaction[0]] = None
+            pending.callbacks[interaction[1]] = None
+
+    def _begin(self) -> _PendingTrace:
+        """Take the changes covered by the sync starting now."""
+        pending, self.__pending = self.__pending, None
+        return pending or _PendingTrace(self.__loop.time())
+
+    def _finish(self, pending: _PendingTrace, outcome: SyncOutcome) -> None:
+        self.__traces.append(
+            SyncTrace(
+                states=tuple(pending.states),
+                callbacks=tuple(pending.callbacks),
+                interactions=tuple(pending.interactions),
+                outcome=outcome,
+                started_at=pending.started_at,
+                elapsed=self.__loop.time() - pending.started_at,
+            )
+        )
@@ -1,3 +1,5 @@
-from .view import _InternalView
+from .reconcile import _clone, _reconcile, _release
+from .timeout import _TimeoutEntry, _TimeoutManager
+from .view import _InternalView, _respond
 
-__all__ = ["_InternalView"]
+__all__ = ["_InternalView", "_TimeoutEntry", "_TimeoutManager", "_clone", "_reconcile", "_release", "_respond"]
@@ -0,0 +1,149 @@
+import copy
+from collections.abc import Hashable, Sequence
+from functools import cache
+from typing import Any
+
+from discord import ui
+
+__all__ = [
+    "_clone",
+    "_reconcile",
+    "_release",
+]
+
+# attributes bound to the view the item is attached to. these must be kept on the live item.
+_VIEW_BOUND_ATTRIBUTES = frozenset({"_view", "_rendered_row", "_parent", "__dict__", "__weakref__"})
+
+
+def _reconcile(view: ui.View, items: Sequence[ui.Item[Any]]) -> list[ui.Item[Any]]:
+    """
+    Reconcile the children of the view with the rendered items.
+
+    Items are matched by `custom_id` if it is provided explicitly, otherwise by type and position.
+    Matched items are patched in place and keep their `custom_id`, so only unmatched items are added or removed.
+    Live items rendered again as themselves are kept as they are, and an item rendered twice is attached once.
+
+    Parameters
+    ----------
+    view : `discord.ui.View`
+        The live view attached to the message.
+    items : `Sequence[discord.ui.Item]`
+        The items of the upcoming render.
+
+    Returns
+    -------
+    `list[discord.ui.Item]`
+        The items attached to the view, in the order of `items`.
+    """
+    current = view.children
+    if len(current) == len(items) and all(a is b for a, b in zip(current, items, strict=True)):
+        return current
+
+    # live items rendered again as themselves (e.g. `@static` ones) are paired with themselves first,
+    # so they are never patched into another item
+    rendered = {id(item) for item in items}
+    live = {_key(item, i): item for i, item in enumerate(current) if id(item) not in rendered}
+    result: list[ui.Item[Any]] = []
+    added: set[int] = set()
+    for i, item in enumerate(items):
+        if id(item) in added:
+            # the same item can be attached only once
+            continue
+        older = live.pop(_key(item, i), None)
+        if older is None or older.row != item.row:
+            result.append(item)
+            added.add(id(item))
+            continue
+
+        _patch(older, item)
+        result.append(older)
+        added.add(id(item))
+
+    # remove items which are not rendered anymore
+    kept = {id(item) for item in result}
+    for item in current:
+        if id(item) not in kept:
+            view.remove_item(item)
+
+    # append new items if the order of kept items is not changed, otherwise rebuild the view
+    remaining = view.children
+    if all(a is b for a, b in zip(remaining, result, strict=False)):
+        for item in result[len(remaining) :]:
+            view.add_item(item)
+    else:
+        view.clear_items()
+        for item in result:
+            view.add_item(item)
+
+    return result
+
+
+def _key(item: ui.Item[Any], index: int) -> Hashable:
+    if item._provided_custom_id:  # noqa: SLF001
+        return ("custom_id", type(item), getattr(item, "custom_id", None))
+    return ("position", type(item), index)
+
+
+def _patch(older: ui.Item[Any], newer: ui.Item[Any]) -> None:
+    """Copy the state of `newer` into `older`, keeping the view binding and the auto-generated custom_id of `older`."""
+    custom_id = None if newer._provided_custom_id else getattr(older, "custom_id", None)  # noqa: SLF001
+
+    if hasattr(newer, "__dict__"):
+        state = newer.__dict__.copy()
+        for name in _VIEW_BOUND_ATTRIBUTES:
+            state.pop(name, None)
+        older.__dict__.update(state)
+    missing = object()
+    for name in _slot_names(type(newer)):
+        if (value := getattr(newer, name, missing)) is not missing:
+            setattr(older, name, value)
+
+    if custom_id is not None:
+        # do not use the setter, it marks the custom_id as provided
+        older._underlying.custom_id = custom_id  # noqa: SLF001
+
+
+def _clone(item: ui.Item[Any]) -> ui.Item[Any]:
+    """
+    Copy the item without running its constructor.
+
+    The underlying component and its options are copied too, so patching or mutating the copy
+    does not affect the original. The copy is not attached to any view.
+    """
+    clone = copy.copy(item)
+    underlying = getattr(item, "_underlying", None)
+    if underlying is not None:
+        underlying = copy.copy(underlying)
+        if isinstance(options := getattr(underlying, "options", None), list):
+            underlying.options = list(options)
+        clone._underlying = underlying  # noqa: SLF001
+    for name in ("_view", "_rendered_row", "_parent"):
+        if hasattr(clone, name):
+            setattr(clone, name, None)
+    return clone
+
+
+def _release(item: ui.Item[Any]) -> None:
+    """
+    Drop the callbacks of the item, keeping what is needed to dispatch an interaction to it.
+
+    Callbacks are usually closures over the view, so this lets the view be garbage collected
+    while the item stays attached to the message. The callbacks are restored by `_patch` on the next render.
+    """
+    for name, value in item.__dict__.items():
+        if callable(value) and not isinstance(value, type):
+            item.__dict__[name] = None
+
+
+@cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    names: list[str] = []
+    for klass in cls.__mro__:
+        slots = getattr(klass, "__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot in _VIEW_BOUND_ATTRIBUTES:
+                continue
+            # private slots are name-mangled
+            private = slot.startswith("__") and not slot.endswith("__")
+            names.append(f"_{klass.__name__.lstrip('_')}{slot}" if private else slot)
+    return tuple(names)
@@ -0,0 +1,136 @@
+import asyncio
+import heapq
+import itertools
+from collections.abc import Callable
+from weakref import WeakKeyDictionary
+
+__all__ = [
+    "_TimeoutEntry",
+    "_TimeoutManager",
+]
+
+
+class _TimeoutEntry:
+    """A timeout registered to `_TimeoutManager`. Refreshing and cancelling it costs O(1)."""
+
+    __slots__ = ("_callback", "_deadline", "_manager", "_timeout")
+
+    def __init__(self, manager: "_TimeoutManager", timeout: float, callback: Callable[[], None]) -> None:
+        self._manager = manager
+        self._timeout = timeout
+        self._callback = callback
+        self._deadline: float | None = manager.now() + timeout
+
+    @property
+    def active(self) -> bool:
+        return self._deadline is not None
+
+    def refresh(self) -> None:
+        """Postpone the deadline to `timeout` seconds from now."""
+        if self._deadline is not None:
+            # the heap is fixed lazily when the old deadline is popped
+            self._deadline = self._manager.now() + self._timeout
+
+    def cancel(self) -> None:
+        self._deadline = None
+
+
+class _TimeoutManager:
+    """
+    A timer heap shared by all controllers on an event loop.
+
+    This holds a single `asyncio.TimerHandle` for the earliest deadline
+    instead of a timeout task per view.
+    """
+
+    __managers: "WeakKeyDictionary[asyncio.AbstractEventLoop, _TimeoutManager]" = WeakKeyDictionary()
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.__loop = loop
+        self.__heap: list[tuple[float, int, _TimeoutEntry]] = []
+        self.__counter = itertools.count()
+        self.__handle: asyncio.TimerHandle | None = None
+        self.__handle_when: float | None = None
+
+    @classmethod
+    def get(cls, loop: asyncio.AbstractEventLoop | None = None) -> "_TimeoutManager":
+        loop = loop or asyncio.get_event_loop()
+        manager = cls.__managers.get(loop)
+        if manager is None:
+            manager = cls.__managers[loop] = cls(loop)
+        return manager
+
+    def __len__(self) -> int:
+        return len(self.__heap)
+
+    def now(self) -> float:
+        return self.__loop.time()
+
+    def register(self, timeout: float, callback: Callable[[], None]) -> _TimeoutEntry:
+        """
+        Call `callback` when `timeout` seconds have passed since the entry was registered or refreshed last.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds until the timeout.
+        callback : Callable[[], None]
+            The function called on timeout.
+
+        Returns
+        -------
+        _TimeoutEntry
+            The registered entry.
+        """
+        entry = _TimeoutEntry(self, timeout, callback)
+        self.__push(entry)
+        return entry
+
+    def __push(self, entry: _TimeoutEntry) -> None:
+        if entry._deadline is None:  # noqa: SLF001
+            return
+
+        heapq.heappush(self.__heap, (entry._deadline, next(self.__counter), entry))  # noqa: SLF001
+        self.__arm()
+
+    def __arm(self) -> None:
+        """Make the timer handle fire at the earliest deadline in the heap."""
+        if not self.__heap:
+            if self.__handle is not None:
+                self.__handle.cancel()
+                self.__handle = self.__handle_when = None
+            return
+
+        when = self.__heap[0][0]
+        if self.__handle is not None and self.__handle_when is not None and self.__handle_when <= when:
+            return
+
+        if self.__handle is not None:
+            self.__handle.cancel()
+        self.__handle = self.__loop.call_at(when, self.__expire)
+        self.__handle_when = when
+
+    def __expire(self) -> None:
+        self.__handle = self.__handle_when = None
+        now = self.now()
+
+        expired: list[_TimeoutEntry] = []
+        while self.__heap and self.__heap[0][0] <= now:
+            deadline, _, entry = heapq.heappop(self.__heap)
+            if entry._deadline is None:  # noqa: SLF001
+                # cancelled
+                continue
+            if entry._deadline > deadline:  # noqa: SLF001
+                # refreshed after it was pushed
+                self.__push_without_arm(entry)
+                continue
+            entry._deadline = None  # noqa: SLF001
+            expired.append(entry)
+
+        self.__arm()
+        for entry in expired:
+            # errors in a callback are reported by the loop without affecting others
+            self.__loop.call_soon(entry._callback)  # noqa: SLF001
+
+    def __push_without_arm(self, entry: _TimeoutEntry) -> None:
+        heapq.heappush(self.__heap, (entry._deadline, next(self.__counter), entry))  # noqa: SLF001
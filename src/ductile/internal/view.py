@@ -3,12 +3,15 @@ from typing import TYPE_CHECKING
 from discord import ui
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from discord import Interaction
 
-    from ..types import ViewErrorHandler, ViewTimeoutHandler  # noqa: TID252
+    from ..types import ViewErrorHandler, ViewInteractionResponder, ViewTimeoutHandler  # noqa: TID252
 
 __all__ = [
     "_InternalView",
+    "_respond",
 ]
 
 
@@ -19,14 +22,35 @@ class _InternalView(ui.View):
         timeout: float | None = 180,
         on_error: "ViewErrorHandler | None" = None,
         on_timeout: "ViewTimeoutHandler | None" = None,
+        on_respond: "ViewInteractionResponder | None" = None,
+        on_interaction: "Callable[[Interaction], Awaitable[None]] | None" = None,
     ) -> None:
         super().__init__(timeout=timeout)
         self.__on_error = on_error
         self.__on_timeout = on_timeout
+        self.__on_respond = on_respond
+        self.__on_interaction = on_interaction
+
+    async def interaction_check(self, interaction: "Interaction") -> bool:
+        if self.__on_interaction:
+            await self.__on_interaction(interaction)
+
+        return await super().interaction_check(interaction)
+
+    async def respond(self, interaction: "Interaction") -> None:
+        if self.__on_respond:
+            await self.__on_respond(interaction)
+            return
+
+        if not interaction.response.is_done():
+            await interaction.response.defer()
 
     async def on_error(self, interaction: "Interaction", error: Exception, item: ui.Item) -> None:
         if self.__on_error:
             await self.__on_error(interaction, error, item)
+        if not interaction.response.is_done():
+            # the callback failed before responding. acknowledge the interaction so that it does not fail.
+            await interaction.response.defer()
 
         await super().on_error(interaction, error, item)
 
@@ -35,3 +59,21 @@ class _InternalView(ui.View):
             await self.__on_timeout()
 
         await super().on_timeout()
+
+
+async def _respond(item: ui.Item, interaction: "Interaction") -> None:
+    """
+    Respond to the interaction after the callback of the item has been called.
+
+    If the callback has not responded yet, the view attached to the item responds to it,
+    e.g. by editing the message with the latest render as the initial response.
+    """
+    if interaction.response.is_done():
+        return
+
+    view = item.view
+    if isinstance(view, _InternalView):
+        await view.respond(interaction)
+        return
+
+    await interaction.response.defer()
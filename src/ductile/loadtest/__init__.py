@@ -0,0 +1,7 @@
+from .runner import LoadTestConfig, LoadTestResult, run
+
+__all__ = [
+    "LoadTestConfig",
+    "LoadTestResult",
+    "run",
+]
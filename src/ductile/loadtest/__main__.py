@@ -0,0 +1,65 @@
+"""
+Simulate users interacting with views concurrently, without Discord.
+
+Usage
+-----
+```sh
+python -m ductile.loadtest --views 1000 --rate 500 --duration 30
+python -m ductile.loadtest --view my_bot.views:DashboardView
+```
+"""
+
+import argparse
+import asyncio
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+from .runner import LoadTestConfig, run
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..view import View  # noqa: TID252
+
+
+def _load_view(path: str) -> "Callable[[], View]":
+    module, _, name = path.partition(":")
+    if not name:
+        msg = f"expected 'module:ViewClass', got {path!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return getattr(importlib.import_module(module), name)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m ductile.loadtest", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--views", type=int, default=100, help="number of views (default: %(default)s)")
+    parser.add_argument("--channels", type=int, help="number of channels the views share (default: one per view)")
+    parser.add_argument("--rate", type=float, default=100, help="interactions per second (default: %(default)s)")
+    parser.add_argument("--duration", type=float, default=10, help="seconds to interact (default: %(default)s)")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per HTTP request (default: %(default)s)")
+    parser.add_argument("--sync-interval", type=float, help="sync_interval of the controllers")
+    parser.add_argument("--view", type=_load_view, help="'module:ViewClass' constructed without arguments")
+    parser.add_argument("--seed", type=int, help="seed of the random interactions")
+    args = parser.parse_args(argv)
+
+    config: LoadTestConfig = {
+        "views": args.views,
+        "channels": args.channels,
+        "rate": args.rate,
+        "duration": args.duration,
+        "latency": args.latency,
+        "sync_interval": args.sync_interval,
+        "seed": args.seed,
+    }
+    if args.view is not None:
+        config["view"] = args.view
+
+    result = asyncio.run(run(config))
+    sys.stdout.write(result.format() + "\n")
+
+
+if __name__ == "__main__":
+    main()
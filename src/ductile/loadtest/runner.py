@@ -0,0 +1,272 @@
+import asyncio
+import random
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from discord import ui
+from typing_extensions import TypedDict
+
+from ..controller import MessageableController  # noqa: TID252
+from ..state import State  # noqa: TID252
+from ..testing import FakeMessage, FakeMessageable  # noqa: TID252
+from ..ui import Button, Select  # noqa: TID252
+from ..view import View, ViewObject  # noqa: TID252
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from discord import Interaction
+
+__all__ = [
+    "LoadTestConfig",
+    "LoadTestResult",
+    "run",
+]
+
+# how often the event loop lag is sampled
+_LAG_INTERVAL = 0.01
+
+
+class LoadTestConfig(TypedDict, total=False):
+    """
+    LoadTestConfig is a TypedDict that represents the config of a load test.
+
+    Attributes
+    ----------
+    views : `int`
+        Number of views sent, by default 100.
+    channels : `int | None`
+        Number of channels the views are sent to. If None, each view has its own channel.
+    rate : `float`
+        Interactions per second across all views, by default 100.
+    duration : `float`
+        Seconds to keep interacting, by default 10.
+    latency : `float`
+        Seconds each send and edit takes in the fake HTTP layer, by default 0.05.
+    sync_interval : `float | None`
+        `sync_interval` of the controllers.
+    view : `Callable[[], View]`
+        Factory of the views. By default a view with a counter button and a select.
+    seed : `int | None`
+        Seed of the random interactions.
+    """
+
+    views: int
+    channels: int | None
+    rate: float
+    duration: float
+    latency: float
+    sync_interval: float | None
+    view: "Callable[[], View]"
+    seed: int | None
+
+
+class LoadTestResult(NamedTuple):
+    """
+    LoadTestResult is a named tuple representing the result of a load test.
+
+    Latencies are measured from an interaction to the next edit of its message.
+    Interactions without an edit after them have been coalesced into an edit of an earlier interaction,
+    or did not change the view.
+
+    Parameters
+    ----------
+    NamedTuple : `LoadTestResult`
+        The result of the load test. Times are in seconds.
+    """
+
+    elapsed: float
+    interactions: int
+    errors: int
+    edits: int
+    coalesced: int
+    latency_p50: float
+    latency_p99: float
+    loop_lag_p50: float
+    loop_lag_p99: float
+    loop_lag_max: float
+
+    @property
+    def edits_per_second(self) -> float:
+        """
+        property: Edits committed per second.
+
+        Returns
+        -------
+        float
+            Edits committed per second.
+        """
+        return self.edits / self.elapsed if self.elapsed else 0.0
+
+    def format(self) -> str:
+        """
+        Format the result as a human readable report.
+
+        Returns
+        -------
+        str
+            The report.
+        """
+        lag = (
+            f"p50 {self.loop_lag_p50 * 1e3:.2f}ms, p99 {self.loop_lag_p99 * 1e3:.2f}ms, max {self.loop_lag_max * 1e3:.2f}ms"
+        )
+        return "\n".join(
+            [
+                f"interactions : {self.interactions} in {self.elapsed:.2f}s ({self.errors} errors)",
+                f"edits        : {self.edits} ({self.edits_per_second:.1f}/s), {self.coalesced} interactions coalesced",
+                f"latency      : p50 {self.latency_p50 * 1e3:.2f}ms, p99 {self.latency_p99 * 1e3:.2f}ms",
+                f"loop lag     : {lag}",
+            ]
+        )
+
+
+class _LoadView(View):
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = State(0, self)
+        self.choice = State("none", self)
+
+    def render(self) -> ViewObject:
+        def increment(_: object) -> None:
+            self.count.set_state(lambda x: x + 1)
+
+        def choose(_: object, values: list[str]) -> None:
+            self.choice.set_state(values[0])
+
+        return ViewObject(
+            content=f"clicked {self.count()} times, chose {self.choice()}",
+            components=[
+                Button("+1", style={"color": "green"}, on_click=increment),
+                Select(config={}, style={}, options=[{"label": f"option {i}"} for i in range(10)], on_select=choose),
+            ],
+        )
+
+
+async def run(config: LoadTestConfig | None = None) -> LoadTestResult:
+    """
+    Send views to fake channels and interact with them at a constant rate.
+
+    Interactions are dispatched to random buttons and selects of random views through their real callbacks,
+    without waiting for earlier interactions, like users clicking at the same time.
+
+    Parameters
+    ----------
+    config : `LoadTestConfig | None`, optional
+        The load test configuration.
+
+    Returns
+    -------
+    LoadTestResult
+        The result of the load test.
+    """
+    config = config or {}
+    n_views = config.get("views", 100)
+    rate = config.get("rate", 100)
+    latency = config.get("latency", 0.05)
+    factory = config.get("view", _LoadView)
+    rng = random.Random(config.get("seed"))  # noqa: S311
+    loop = asyncio.get_running_loop()
+
+    channels = [FakeMessageable(latency=latency) for _ in range(config.get("channels") or n_views)]
+    controllers: list[MessageableController] = []
+    messages: list[FakeMessage] = []
+    # discord.py passes errors raised in callbacks to `on_error` instead of raising them
+    errors: list[Exception] = []
+    for i in range(n_views):
+        channel = channels[i % len(channels)]
+        controller = MessageableController(
+            _count_errors(factory(), errors),
+            messageable=channel,
+            timeout=None,
+            sync_interval=config.get("sync_interval"),
+        )
+        await controller.send()
+        controllers.append(controller)
+        messages.append(channel.messages[-1])
+
+    lags: list[float] = []
+    monitor = loop.create_task(_monitor_lag(lags))
+
+    starts: list[tuple[float, FakeMessage]] = []
+    tasks: list[asyncio.Task[None]] = []
+    begin = loop.time()
+    for k in range(int(rate * config.get("duration", 10))):
+        # open loop: interactions keep arriving at the rate even if the views fall behind
+        await asyncio.sleep(max(begin + k / rate - loop.time(), 0))
+        message = rng.choice(messages)
+        starts.append((loop.time(), message))
+        tasks.append(loop.create_task(_interact(message, rng)))
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.gather(*(controller.sync() for controller in controllers))
+    elapsed = loop.time() - begin
+    monitor.cancel()
+    for controller in controllers:
+        controller.stop()
+
+    latencies = []
+    for start, message in starts:
+        i = bisect_left(message.edited_at, start)
+        if i < len(message.edited_at):
+            latencies.append(message.edited_at[i] - start)
+    edits = sum(len(message.edits) for message in messages)
+
+    return LoadTestResult(
+        elapsed=elapsed,
+        interactions=len(starts),
+        errors=len(errors) + sum(isinstance(r, Exception) for r in results),
+        edits=edits,
+        coalesced=max(len(starts) - edits, 0),
+        latency_p50=_percentile(latencies, 50),
+        latency_p99=_percentile(latencies, 99),
+        loop_lag_p50=_percentile(lags, 50),
+        loop_lag_p99=_percentile(lags, 99),
+        loop_lag_max=max(lags, default=0.0),
+    )
+
+
+def _count_errors(view: View, errors: list[Exception]) -> View:
+    """Record the errors of the view into `errors`, then call its own `on_error`."""
+    on_error = view.on_error
+
+    async def hook(interaction: "Interaction", error: Exception, item: "ui.Item[Any]") -> None:
+        errors.append(error)
+        await on_error(interaction, error, item)
+
+    view.on_error = hook  # type: ignore[method-assign]
+    return view
+
+
+async def _interact(message: FakeMessage, rng: random.Random) -> None:
+    children = message.view.children if message.view is not None else []
+    targets = [
+        i
+        for i, item in enumerate(children)
+        if (isinstance(item, ui.Button) and item.url is None) or isinstance(item, ui.Select)
+    ]
+    if not targets:
+        return
+
+    index = rng.choice(targets)
+    item = children[index]
+    if isinstance(item, ui.Select):
+        # the `options` getter disables the payload memo of the select
+        values = [option.value for option in item._underlying.options]  # noqa: SLF001
+        await message.select(index, rng.sample(values, k=item.min_values or 1))
+    else:
+        await message.click(index)
+
+
+async def _monitor_lag(lags: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(_LAG_INTERVAL)
+        lags.append(max(loop.time() - start - _LAG_INTERVAL, 0))
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * percentile / 100), len(ordered) - 1)]
@@ -1,6 +1,12 @@
+from .async_page import AsyncPaginator, AsyncPaginatorConfig
+from .cursor_page import CursorPaginator, CursorPaginatorConfig
 from .page import Paginator, PaginatorConfig
 
 __all__ = [
+    "AsyncPaginator",
+    "AsyncPaginatorConfig",
+    "CursorPaginator",
+    "CursorPaginatorConfig",
     "Paginator",
     "PaginatorConfig",
 ]
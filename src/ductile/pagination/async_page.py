@@ -0,0 +1,250 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from typing_extensions import NotRequired, Required, TypedDict
+
+from ..utils import LRUCache, get_logger  # noqa: TID252
+
+if TYPE_CHECKING:
+    from discord import Interaction
+
+    from ..view import View  # noqa: TID252
+
+
+_T = TypeVar("_T")
+
+_logger = get_logger(__name__)
+
+PageFetcher = Callable[[int, int], Awaitable[Sequence[_T]]]
+
+
+class AsyncPaginatorConfig(TypedDict):
+    """
+    An async paginator configuration.
+
+    Attributes
+    ----------
+    page_size : `int`
+        Number of items per page.
+    initial_page : `int`, optional
+        Index of the first page to show, by default 0.
+    total : `int | None`, optional
+        Total number of items. If None, the last page is known once a page shorter than `page_size` is fetched.
+    cache_size : `int`, optional
+        Maximum number of fetched pages to keep, by default 8.
+    prefetch : `int`, optional
+        Number of pages prefetched on each side of the current page, by default 1.
+    """
+
+    page_size: Required[int]
+    initial_page: NotRequired[int]
+    total: NotRequired[int | None]
+    cache_size: NotRequired[int]
+    prefetch: NotRequired[int]
+
+
+class AsyncPaginator(Generic[_T]):
+    """
+    A paginator that fetches pages on demand.
+
+    Fetched pages are kept in an LRU cache and the adjacent pages are prefetched in the background
+    after every page move, so flipping pages usually does not wait for the source.
+
+    Call `load()` before sending the view to fetch the initial page.
+
+    Parameters
+    ----------
+    view : `View`
+        The view to attach.
+
+    fetch: `Callable[[int, int], Awaitable[Sequence[_T]]]`
+        The coroutine function fetching items. This is called with `offset` and `limit`.
+
+    config: `AsyncPaginatorConfig`
+        The paginator configuration.
+    """
+
+    def __init__(self, view: "View", *, fetch: PageFetcher[_T], config: AsyncPaginatorConfig) -> None:
+        if config["page_size"] < 1:
+            msg = "page_size must be greater than 0"
+            raise ValueError(msg)
+
+        self.__view = view
+        self.__fetch = fetch
+        self.__page_size = config["page_size"]
+        self.__total = config.get("total")
+        self.__prefetch = config.get("prefetch", 1)
+        self.__cache: LRUCache[int, Sequence[_T]] = LRUCache(config.get("cache_size", 8))
+        # fetches in flight by page index, shared by prefetches and page moves
+        self.__loading: dict[int, asyncio.Task[Sequence[_T]]] = {}
+        # index of the last page found by fetching a short page, when the total is unknown
+        self.__last_index: int | None = None
+
+        initial = config.get("initial_page", 0)
+        self.__current_index: int = initial if self._is_valid_index(initial) else 0
+
+    @property
+    def current_page(self) -> int:
+        """
+        Return the current page number.
+
+        Returns
+        -------
+        int
+            The current page number.
+        """
+        return self.__current_index + 1
+
+    @property
+    def max_page(self) -> int | None:
+        """
+        Return the maximum page number.
+
+        Returns
+        -------
+        int | None
+            The maximum page number. None if the total is not given and the last page has not been fetched yet.
+        """
+        max_index = self.__max_index
+        return None if max_index is None else max_index + 1
+
+    @property
+    def at_first(self) -> bool:
+        """
+        Return whether the current page is the first page.
+
+        Returns
+        -------
+        bool
+            Whether the current page is the first page.
+        """
+        return self.__current_index == 0
+
+    @property
+    def at_last(self) -> bool:
+        """
+        Return whether the current page is the last page.
+
+        Returns
+        -------
+        bool
+            Whether the current page is the last page. False if the last page is not known yet.
+        """
+        return self.__current_index == self.__max_index
+
+    @property
+    def loading(self) -> bool:
+        """
+        Return whether the current page is being fetched.
+
+        Returns
+        -------
+        bool
+            Whether the current page is being fetched.
+        """
+        return self.__current_index not in self.__cache
+
+    @property
+    def data(self) -> Sequence[_T]:
+        """
+        Return the current page data.
+
+        Returns
+        -------
+        Sequence[_T]
+            The current page data. Empty while the page is being fetched.
+        """
+        return self.__cache.get(self.__current_index, ())
+
+    @property
+    def __max_index(self) -> int | None:
+        if self.__total is not None:
+            return -(-self.__total // self.__page_size) - 1
+        return self.__last_index
+
+    def _render_key(self) -> Hashable:
+        """Return the key of what `render` can read from this paginator. See `View.render_key`."""
+        return (self.__current_index, self.loading, self.__max_index)
+
+    def _is_valid_index(self, index: int) -> bool:
+        max_index = self.__max_index
+        return index >= 0 and (max_index is None or index <= max_index)
+
+    async def load(self) -> None:
+        """Fetch the current page and prefetch the adjacent pages. Call this before sending the view."""
+        await self.__get_page(self.__current_index)
+        self.__prefetch_around(self.__current_index)
+
+    async def go_next(self, _: "Interaction") -> None:
+        """Go to the next page. This method will call `View.sync`."""
+        if not self.at_last:
+            await self.__go(self.__current_index + 1)
+
+    async def go_previous(self, _: "Interaction") -> None:
+        """Go to the previous page. This method will call `View.sync`."""
+        await self.__go(self.__current_index - 1)
+
+    async def go_first(self, _: "Interaction") -> None:
+        """Go to the first page. This method will call `View.sync`."""
+        if not self.at_first:
+            await self.__go(0)
+
+    async def go_last(self, _: "Interaction") -> None:
+        """Go to the last page. This method will call `View.sync`. This does nothing if the last page is unknown."""
+        if (max_index := self.__max_index) is not None and not self.at_last:
+            await self.__go(max_index)
+
+    async def __go(self, index: int) -> None:
+        if not self._is_valid_index(index):
+            return
+
+        # move first, so that moves made while fetching are based on the latest page
+        previous, self.__current_index = self.__current_index, index
+        try:
+            page = await self.__get_page(index)
+        except Exception:
+            if self.__current_index == index:
+                self.__current_index = previous
+            raise
+        if not page and index > 0 and self.__total is None:
+            # moved past the end of a source without the total. go back to the last page.
+            self.__current_index = min(self.__current_index, self.__last_index or 0)
+
+        if self.__current_index == index:
+            self.__view.sync()
+        self.__prefetch_around(self.__current_index)
+
+    async def __get_page(self, index: int) -> Sequence[_T]:
+        if (page := self.__cache.get(index)) is not None:
+            return page
+
+        task = self.__loading.get(index)
+        if task is None:
+            task = self.__loading[index] = asyncio.get_running_loop().create_task(self.__fetch_page(index))
+        return await asyncio.shield(task)
+
+    async def __fetch_page(self, index: int) -> Sequence[_T]:
+        try:
+            page = await self.__fetch(index * self.__page_size, self.__page_size)
+        finally:
+            self.__loading.pop(index, None)
+
+        self.__cache.put(index, page)
+        if self.__total is None and len(page) < self.__page_size:
+            # a short page is the last one. an empty page means the previous one is the last.
+            last = index if page else index - 1
+            self.__last_index = last if self.__last_index is None else min(self.__last_index, last)
+        return page
+
+    def __prefetch_around(self, index: int) -> None:
+        for i in range(index - self.__prefetch, index + self.__prefetch + 1):
+            if i == index or not self._is_valid_index(i) or i in self.__cache or i in self.__loading:
+                continue
+
+            task = self.__loading[i] = asyncio.get_running_loop().create_task(self.__fetch_page(i))
+            task.add_done_callback(self.__log_prefetch_error)
+
+    def __log_prefetch_error(self, task: "asyncio.Task[Sequence[_T]]") -> None:
+        if not task.cancelled() and (e := task.exception()) is not None:
+            _logger.warning("Failed to prefetch a page: %r", e)
@@ -0,0 +1,251 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Sequence
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from typing_extensions import NotRequired, Required, TypedDict
+
+from ..utils import LRUCache  # noqa: TID252
+
+if TYPE_CHECKING:
+    from discord import Interaction
+
+    from ..view import View  # noqa: TID252
+
+
+_T = TypeVar("_T")
+_C = TypeVar("_C")
+
+CursorFetcher = Callable[[_C | None, int], Awaitable[tuple[Sequence[_T], _C | None]]]
+
+
+class CursorPaginatorConfig(TypedDict):
+    """
+    A cursor paginator configuration.
+
+    Attributes
+    ----------
+    page_size : `int`
+        Number of items per page.
+    cache_size : `int`, optional
+        Maximum number of fetched pages to keep, by default 8.
+    """
+
+    page_size: Required[int]
+    cache_size: NotRequired[int]
+
+
+class CursorPaginator(Generic[_T, _C]):
+    """
+    A paginator over a source without a cheap total count, such as audit logs or message history.
+
+    Pages are fetched lazily with a keyset cursor, and the cursor of every page seen is remembered,
+    so going back costs at most one fetch. `max_page` and `at_last` are known once the source is exhausted.
+
+    Call `load()` before sending the view to fetch the first page.
+
+    Parameters
+    ----------
+    view : `View`
+        The view to attach.
+
+    fetch: `Callable[[_C | None, int], Awaitable[tuple[Sequence[_T], _C | None]]]`
+        The coroutine function fetching a page. This is called with the cursor of the page (None for the first page)
+        and `limit`, and returns the items and the cursor of the next page (None if there are no more items).
+
+    config: `CursorPaginatorConfig`
+        The paginator configuration.
+    """
+
+    def __init__(
+        self,
+        view: "View",
+        *,
+        fetch: CursorFetcher[_C, _T],
+        config: CursorPaginatorConfig,
+        _rewindable: bool = True,
+    ) -> None:
+        if config["page_size"] < 1:
+            msg = "page_size must be greater than 0"
+            raise ValueError(msg)
+
+        self.__view = view
+        self.__fetch = fetch
+        self.__page_size = config["page_size"]
+        self.__cache: LRUCache[int, Sequence[_T]] = LRUCache(config.get("cache_size", 8))
+        self.__loading: dict[int, asyncio.Task[Sequence[_T]]] = {}
+        # cursors[i] fetches the page i. this grows by one cursor per page seen.
+        self.__cursors: list[_C | None] = [None]
+        self.__last_index: int | None = None
+        # an iterator can not be fetched again, so evicted pages are unreachable
+        self.__rewindable = _rewindable
+        self.__current_index = 0
+
+    @classmethod
+    def from_iterator(
+        cls,
+        view: "View",
+        *,
+        source: AsyncIterator[_T],
+        config: CursorPaginatorConfig,
+    ) -> "CursorPaginator[_T, int]":
+        """
+        Create a paginator pulling pages from an async iterator.
+
+        The iterator can not be rewound, so only the last `cache_size` pages can be revisited.
+
+        Parameters
+        ----------
+        view : `View`
+            The view to attach.
+        source : `AsyncIterator[_T]`
+            The source data.
+        config : `CursorPaginatorConfig`
+            The paginator configuration.
+
+        Returns
+        -------
+        CursorPaginator[_T, int]
+            The paginator.
+        """
+
+        async def fetch(cursor: int | None, limit: int) -> tuple[list[_T], int | None]:
+            items: list[_T] = []
+            end = object()
+            while len(items) < limit:
+                if (item := await anext(source, end)) is end:
+                    return items, None
+                items.append(item)  # type: ignore[arg-type]
+            return items, (cursor or 0) + 1
+
+        return cls(view, fetch=fetch, config=config, _rewindable=False)
+
+    @property
+    def current_page(self) -> int:
+        """
+        Return the current page number.
+
+        Returns
+        -------
+        int
+            The current page number.
+        """
+        return self.__current_index + 1
+
+    @property
+    def max_page(self) -> int | None:
+        """
+        Return the maximum page number.
+
+        Returns
+        -------
+        int | None
+            The maximum page number. None until the source is exhausted.
+        """
+        return None if self.__last_index is None else self.__last_index + 1
+
+    @property
+    def at_first(self) -> bool:
+        """
+        Return whether the current page is the first reachable page.
+
+        Returns
+        -------
+        bool
+            Whether the previous page can not be reached.
+        """
+        return not self._is_valid_index(self.__current_index - 1)
+
+    @property
+    def at_last(self) -> bool:
+        """
+        Return whether the current page is the last page.
+
+        Returns
+        -------
+        bool
+            Whether the current page is the last page. False until the source is exhausted.
+        """
+        return self.__current_index == self.__last_index
+
+    @property
+    def data(self) -> Sequence[_T]:
+        """
+        Return the current page data.
+
+        Returns
+        -------
+        Sequence[_T]
+            The current page data. Empty while the page is being fetched.
+        """
+        return self.__cache.get(self.__current_index, ())
+
+    def _render_key(self) -> Hashable:
+        """Return the key of what `render` can read from this paginator. See `View.render_key`."""
+        return (self.__current_index, self.__current_index in self.__cache, self.__last_index, self.at_first)
+
+    def _is_valid_index(self, index: int) -> bool:
+        if index < 0 or index >= len(self.__cursors):
+            return False
+        if self.__last_index is not None and index > self.__last_index:
+            return False
+        # the next page of an iterator is always reachable, the seen pages only while they are cached
+        return self.__rewindable or index in self.__cache or index == len(self.__cursors) - 1
+
+    async def load(self) -> None:
+        """Fetch the current page. Call this before sending the view."""
+        await self.__get_page(self.__current_index)
+
+    async def go_next(self, _: "Interaction") -> None:
+        """Go to the next page. This method will call `View.sync`."""
+        await self.__go(self.__current_index + 1)
+
+    async def go_previous(self, _: "Interaction") -> None:
+        """Go to the previous page. This method will call `View.sync`."""
+        await self.__go(self.__current_index - 1)
+
+    async def go_first(self, _: "Interaction") -> None:
+        """Go to the first reachable page. This method will call `View.sync`."""
+        first = next((i for i in range(self.__current_index) if self._is_valid_index(i)), None)
+        if first is not None:
+            await self.__go(first)
+
+    async def __go(self, index: int) -> None:
+        if not self._is_valid_index(index):
+            return
+
+        previous, self.__current_index = self.__current_index, index
+        try:
+            page = await self.__get_page(index)
+        except Exception:
+            if self.__current_index == index:
+                self.__current_index = previous
+            raise
+        if not page and index > 0:
+            # the previous page turned out to be the last one
+            self.__current_index = min(self.__current_index, index - 1)
+
+        if self.__current_index == index:
+            self.__view.sync()
+
+    async def __get_page(self, index: int) -> Sequence[_T]:
+        if (page := self.__cache.get(index)) is not None:
+            return page
+
+        task = self.__loading.get(index)
+        if task is None:
+            task = self.__loading[index] = asyncio.get_running_loop().create_task(self.__fetch_page(index))
+        return await asyncio.shield(task)
+
+    async def __fetch_page(self, index: int) -> Sequence[_T]:
+        try:
+            page, cursor = await self.__fetch(self.__cursors[index], self.__page_size)
+        finally:
+            self.__loading.pop(index, None)
+
+        self.__cache.put(index, page)
+        if cursor is None or (not page and index > 0):
+            last = index if page or index == 0 else index - 1
+            self.__last_index = last if self.__last_index is None else min(self.__last_index, last)
+        elif index == len(self.__cursors) - 1:
+            self.__cursors.append(cursor)
+        return page
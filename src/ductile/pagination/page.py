@@ -1,10 +1,14 @@
-from typing import TYPE_CHECKING, Generic, TypeVar
+from array import array
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from typing_extensions import NotRequired, Required, TypedDict
 
-from ..utils import chunks  # noqa: TID252
+from ..utils import LRUCache  # noqa: TID252
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from discord import Interaction
 
     from ..view import View  # noqa: TID252
@@ -36,19 +40,47 @@ class Paginator(Generic[_T]):
     view : `View`
         The view to attach.
 
-    source: `list[_T]`
-        The source data. This can be any iterable.
+    source: `Sequence[_T]`
+        The source data. This can be any sequence supporting `len` and slicing,
+        e.g. `list`, `range` or `numpy.ndarray`. The source is not copied, pages are sliced on demand.
+
+        The source can be sorted and filtered with `sort_by` and `filter_by`. Sort permutations and
+        filter results are cached as index arrays, so toggling back to a previous order or filter is cheap.
+        Call `invalidate` after mutating the source.
 
     config: `PaginatorConfig`
         The paginator configuration.
     """
 
-    def __init__(self, view: "View", *, source: list[_T], config: PaginatorConfig) -> None:
+    def __init__(self, view: "View", *, source: "Sequence[_T]", config: PaginatorConfig) -> None:
+        if config["page_size"] < 1:
+            msg = "page_size must be greater than 0"
+            raise ValueError(msg)
+
         self.__view = view
-        self.__CHUNKS = list(chunks(source, config["page_size"]))
-        self.__MAX_INDEX: int = len(self.__CHUNKS) - 1
+        self.__source = source
+        self.__page_size = config["page_size"]
+
+        # current sort and filter, and the caches of their index arrays
+        self.__sort: tuple[tuple[Hashable, bool], Callable[[_T], Any], bool] | None = None
+        self.__filter: tuple[Hashable, Callable[[_T], bool]] | None = None
+        self.__sort_cache: LRUCache[Hashable, array[int]] = LRUCache(8)
+        self.__filter_cache: LRUCache[Hashable, array[int]] = LRUCache(8)
+        self.__arranged_cache: LRUCache[Hashable, array[int]] = LRUCache(8)
+        # indices of the source to paginate. None means the source as is.
+        self.__indices: array[int] | None = None
+
         self.__current_index: int = c if (self._is_valid_index(c := (config.get("initial_page", 0)))) else 0
 
+    @property
+    def __length(self) -> int:
+        return len(self.__source) if self.__indices is None else len(self.__indices)
+
+    @property
+    def __max_index(self) -> int:
+        # ceil(len / page_size) - 1, computed from the length only
+        return -(-self.__length // self.__page_size) - 1
+
     @property
     def current_page(self) -> int:
         """
@@ -71,7 +103,7 @@ class Paginator(Generic[_T]):
         int
             The maximum page number.
         """
-        return self.__MAX_INDEX + 1
+        return self.__max_index + 1
 
     @property
     def at_first(self) -> bool:
@@ -95,10 +127,27 @@ class Paginator(Generic[_T]):
         bool
             Whether the current page is the last page.
         """
-        return self.__current_index == self.__MAX_INDEX
+        return self.__current_index == self.__max_index
+
+    def _render_key(self) -> "Hashable":
+        """Return the key of what `render` can read from this paginator. See `View.render_key`."""
+        sort_key = None if self.__sort is None else self.__sort[0]
+        return (self.__current_index, len(self.__source), sort_key, self.filter_key)
+
+    def _hibernate(self) -> "Hashable":
+        """Return the position of this paginator to keep while the view is hibernated."""
+        return (self.__current_index, None if self.__sort is None else self.__sort[0], self.filter_key)
+
+    def _restore(self, snapshot: "Hashable") -> None:
+        """Restore the position returned by `_hibernate` without sync."""
+        index, sort_key, filter_key = snapshot  # type: ignore[misc]
+        current_sort_key = None if self.__sort is None else self.__sort[0]
+        # the sort and the filter functions can not be kept, so the page is restored only if they are the same
+        if (current_sort_key, self.filter_key) == (sort_key, filter_key) and self._is_valid_index(index):
+            self.__current_index = index
 
     def _is_valid_index(self, index: int) -> bool:
-        return 0 <= index <= self.__MAX_INDEX
+        return 0 <= index <= self.__max_index
 
     def go_next(self, _: "Interaction") -> None:
         """Go to the next page. This method will call `View.sync`."""
@@ -131,17 +180,132 @@ class Paginator(Generic[_T]):
         if not self._is_valid_index(self.__current_index) or self.at_last:
             return
 
-        self.__current_index = self.__MAX_INDEX
+        self.__current_index = self.__max_index
         self.__view.sync()
 
     @property
-    def data(self) -> list[_T]:
+    def data(self) -> "Sequence[_T]":
         """
         Return the current page data.
 
+        The page is sliced from the source when this is accessed, so the type follows the source,
+        e.g. a `list` for a `list` source and a view for a `numpy.ndarray` source.
+
         Returns
         -------
-        _T
+        Sequence[_T]
             The current page data.
         """
-        return self.__CHUNKS[self.__current_index]
+        start = self.__current_index * self.__page_size
+        if self.__indices is None:
+            return self.__source[start : start + self.__page_size]
+        return [self.__source[i] for i in self.__indices[start : start + self.__page_size]]
+
+    @property
+    def sort_key(self) -> Hashable | None:
+        """
+        Return the name of the current sort.
+
+        Returns
+        -------
+        Hashable | None
+            The name of the current sort. None if the source is not sorted.
+        """
+        return None if self.__sort is None else self.__sort[0][0]
+
+    @property
+    def filter_key(self) -> Hashable | None:
+        """
+        Return the name of the current filter.
+
+        Returns
+        -------
+        Hashable | None
+            The name of the current filter. None if the source is not filtered.
+        """
+        return None if self.__filter is None else self.__filter[0]
+
+    def sort_by(self, key: "Callable[[_T], Any] | None", *, reverse: bool = False, name: Hashable = None) -> None:
+        """
+        Sort the source by the key. This method will call `View.sync`.
+
+        Parameters
+        ----------
+        key : `Callable[[_T], Any] | None`
+            The function returning the sort key of an item. If None, the source order is restored.
+        reverse : `bool`, optional
+            Whether to sort in descending order, by default False.
+        name : `Hashable`, optional
+            The name to cache the permutation with. If None, `key` itself is used,
+            so pass a name when `key` is created on every call, e.g. a lambda in `render`.
+        """
+        self.__sort = None if key is None else ((key if name is None else name, reverse), key, reverse)
+        self.__rearrange()
+
+    def filter_by(self, predicate: "Callable[[_T], bool] | None", *, name: Hashable = None) -> None:
+        """
+        Filter the source by the predicate. This method will call `View.sync`.
+
+        Parameters
+        ----------
+        predicate : `Callable[[_T], bool] | None`
+            The function returning whether to keep an item. If None, the filter is removed.
+        name : `Hashable`, optional
+            The name to cache the result with. If None, `predicate` itself is used.
+        """
+        self.__filter = None if predicate is None else (predicate if name is None else name, predicate)
+        self.__rearrange()
+
+    def invalidate(self) -> None:
+        """Drop the cached sort permutations and filter results. Call this after mutating the source."""
+        self.__sort_cache.clear()
+        self.__filter_cache.clear()
+        self.__arranged_cache.clear()
+        self.__rearrange()
+
+    def __rearrange(self) -> None:
+        previous = self.__indices
+        self.__indices = self.__arrange()
+        # keep the current page, clamped to the new length
+        self.__current_index = max(min(self.__current_index, self.__max_index), 0)
+
+        if self.__indices is not previous:
+            self.__view.sync()
+
+    def __arrange(self) -> "array[int] | None":
+        if self.__sort is None and self.__filter is None:
+            return None
+
+        cache_key = (None if self.__sort is None else self.__sort[0], self.filter_key)
+        if (indices := self.__arranged_cache.get(cache_key)) is not None:
+            return indices
+
+        if self.__filter is None:
+            indices = self.__sorted()
+        elif self.__sort is None:
+            indices = self.__filtered()
+        else:
+            mask = bytearray(len(self.__source))
+            for i in self.__filtered():
+                mask[i] = 1
+            indices = array("q", (i for i in self.__sorted() if mask[i]))
+
+        self.__arranged_cache.put(cache_key, indices)
+        return indices
+
+    def __sorted(self) -> "array[int]":
+        assert self.__sort is not None  # noqa: S101
+        name, key, reverse = self.__sort
+        if (permutation := self.__sort_cache.get(name)) is None:
+            keys = [key(item) for item in self.__source]
+            permutation = array("q", sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse))
+            self.__sort_cache.put(name, permutation)
+        return permutation
+
+    def __filtered(self) -> "array[int]":
+        assert self.__filter is not None  # noqa: S101
+        name, predicate = self.__filter
+        if (indices := self.__filter_cache.get(name)) is None:
+            indices = array("q", (i for i, item in enumerate(self.__source) if predicate(item)))
+            self.__filter_cache.put(name, indices)
+        return indices
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
@@ -9,6 +10,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound=Any)
 
+_logger = get_logger(__name__)
+
 __all__ = [
     "State",
     # "use_state",
@@ -36,7 +39,7 @@ class State(Generic[T]):
 
         self._loop = loop or asyncio.get_event_loop()
         self._view = view
-        self._logger = get_logger(self.__class__.__name__)
+        self._logger = _logger
 
     def __call__(self) -> T:
         """
@@ -92,6 +95,9 @@ class State(Generic[T]):
         Set the current value of the state to the new value.
 
         After the state is changed, this method calls `View.sync()` to synchronize the view with the controller.
+        If the new value is equal to the current value, the state is not changed and `View.sync()` is not called.
+
+        **Note that mutating the current value in place and setting it again is not detected as a change.**
 
         Parameters
         ----------
@@ -114,8 +120,17 @@ class State(Generic[T]):
         else:
             _new_value = new_value
 
-        msg = f"State changed: {self._current_value} -> {_new_value}"
-        self._logger.debug(msg)
+        if self.__equals(self._current_value, _new_value):
+            return
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            # formatting large values is deferred to handlers, and skipped entirely when debug logs are off
+            self._logger.debug(
+                "State changed: %s -> %s",
+                self._current_value,
+                _new_value,
+                extra={"view": type(self._view).__qualname__},
+            )
         self._current_value = _new_value
         self.__sync()
 
@@ -126,13 +141,27 @@ class State(Generic[T]):
         After the state is changed, this method calls `View.sync()` to synchronize the view with the controller.
         """
         if self.__previous_value is not None:
+            changed = not self.__equals(self._current_value, self.__previous_value)
             self._current_value = self.__previous_value
-            self.__sync()
+            if changed:
+                self.__sync()
         else:
             self._logger.warning("No previous value")
 
+    @staticmethod
+    def __equals(current: T, new: T) -> bool:
+        if current is new:
+            return True
+
+        try:
+            return bool(current == new)
+        except Exception:  # noqa: BLE001
+            # some types (e.g. numpy.ndarray) can not be compared as a bool, treat them as changed
+            return False
+
     def __sync(self) -> None:
         if self._view:
+            self._view._trace_state(self)  # noqa: SLF001
             self._view.sync()
         else:
             self._logger.warning("View is not set")
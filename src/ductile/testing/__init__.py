@@ -0,0 +1,10 @@
+from .clock import VirtualClock
+from .fakes import FakeInteraction, FakeInteractionResponse, FakeMessage, FakeMessageable
+
+__all__ = [
+    "FakeInteraction",
+    "FakeInteractionResponse",
+    "FakeMessage",
+    "FakeMessageable",
+    "VirtualClock",
+]
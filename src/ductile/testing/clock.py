@@ -0,0 +1,106 @@
+import asyncio
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+__all__ = [
+    "VirtualClock",
+]
+
+
+class VirtualClock:
+    """
+    VirtualClock replaces the clock of an event loop, so timers fire without waiting in real time.
+
+    Whenever the loop would sleep until the next timer, the clock jumps to that timer instead.
+    Sync intervals, timeouts, hibernation and rate limits of `ductile` all read `loop.time()`,
+    so a view timing out after 180 seconds times out immediately under this clock.
+
+    The loop still waits in real time when there is no timer, e.g. for a render running in an executor.
+    Only selector event loops (the default on Linux and macOS) are supported.
+
+    Example
+    -------
+    ```py
+    clock = VirtualClock()
+    with clock.patch_loop(loop):
+        loop.run_until_complete(controller.wait())
+    print(clock.time())  # 180.0
+    ```
+
+    Parameters
+    ----------
+    start : `float`, optional
+        The initial time, by default 0.
+    """
+
+    def __init__(self, start: float = 0) -> None:
+        self.__time = start
+
+    def time(self) -> float:
+        """
+        Return the virtual time.
+
+        Returns
+        -------
+        float
+            Seconds since the clock started, plus `start`.
+        """
+        return self.__time
+
+    def advance(self, seconds: float) -> None:
+        """
+        Move the clock forward. Timers due by then fire on the next iteration of the loop.
+
+        Parameters
+        ----------
+        seconds : `float`
+            Seconds to move forward.
+        """
+        if seconds < 0:
+            msg = "seconds must not be negative"
+            raise ValueError(msg)
+        self.__time += seconds
+
+    @contextmanager
+    def patch_loop(
+        self, loop: asyncio.AbstractEventLoop | None = None
+    ) -> "Generator[asyncio.AbstractEventLoop, None, None]":
+        """
+        Drive the event loop by this clock inside the block.
+
+        Parameters
+        ----------
+        loop : `asyncio.AbstractEventLoop | None`, optional
+            The event loop to patch. If None, the current event loop is used.
+
+        Yields
+        ------
+        asyncio.AbstractEventLoop
+            The patched event loop.
+        """
+        loop = loop or asyncio.get_event_loop()
+        selector = getattr(loop, "_selector", None)
+        if selector is None:
+            msg = "VirtualClock supports selector event loops only"
+            raise TypeError(msg)
+
+        select = selector.select
+
+        def virtual_select(timeout: float | None = None) -> Any:  # noqa: ANN401
+            if timeout is not None and timeout > 0:
+                # jump to the next timer instead of sleeping, and poll ready I/O
+                self.__time += timeout
+                return select(0)
+            return select(timeout)
+
+        # instance attributes shadow the methods of the loop and the selector
+        loop.time = self.time  # type: ignore[method-assign]
+        selector.select = virtual_select
+        try:
+            yield loop
+        finally:
+            del loop.time
+            del selector.select
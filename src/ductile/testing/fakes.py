@@ -0,0 +1,345 @@
+import asyncio
+import itertools
+from typing import TYPE_CHECKING, Any
+
+from discord import ComponentType, InteractionResponded
+
+if TYPE_CHECKING:
+    from discord import ui
+
+__all__ = [
+    "FakeInteraction",
+    "FakeInteractionResponse",
+    "FakeMessage",
+    "FakeMessageable",
+]
+
+# ids of fake messages, channels and interactions. unique across all fakes like snowflakes.
+_ids = itertools.count(1)
+
+
+class FakeMessageable:
+    """
+    FakeMessageable stands in for `discord.abc.Messageable` and records the messages sent to it.
+
+    Pass this to `MessageableController` to run a view without Discord.
+
+    Parameters
+    ----------
+    latency : `float`, optional
+        Seconds each send and edit takes, by default 0.
+
+    Attributes
+    ----------
+    id : `int`
+        The id of the channel.
+    messages : `list[FakeMessage]`
+        The messages sent to the channel, in order.
+    """
+
+    def __init__(self, *, latency: float = 0) -> None:
+        self.id = next(_ids)
+        self.messages: list[FakeMessage] = []
+        self.__latency = latency
+
+    async def send(self, **kwargs: Any) -> "FakeMessage":  # noqa: ANN401
+        """
+        Record a message sent with the keyword arguments of `discord.abc.Messageable.send`.
+
+        Returns
+        -------
+        FakeMessage
+            The sent message.
+        """
+        if self.__latency:
+            await asyncio.sleep(self.__latency)
+        message = FakeMessage(self, kwargs, latency=self.__latency)
+        self.messages.append(message)
+        return message
+
+    def get_partial_message(self, message_id: int) -> "FakeMessage":
+        """
+        Return the sent message with the id, standing in for `discord.TextChannel.get_partial_message`.
+
+        Parameters
+        ----------
+        message_id : `int`
+            The id of the message.
+
+        Returns
+        -------
+        FakeMessage
+            The sent message. Unlike Discord, every message sent to this channel is kept.
+
+        Raises
+        ------
+        LookupError
+            If no message with the id has been sent to this channel.
+        """
+        for message in self.messages:
+            if message.id == message_id:
+                return message
+
+        msg = f"No message with id {message_id}"
+        raise LookupError(msg)
+
+
+class FakeMessage:
+    """
+    FakeMessage stands in for `discord.Message` and records the edits made to it.
+
+    Use `click` and `select` to interact with the components of the message like a user.
+    The interactions run through the real callbacks of the components.
+
+    Parameters
+    ----------
+    channel : `FakeMessageable`
+        The channel the message was sent to.
+    payload : `dict[str, Any]`
+        The keyword arguments the message was sent with.
+    latency : `float`, optional
+        Seconds each edit takes, by default 0.
+
+    Attributes
+    ----------
+    id : `int`
+        The id of the message.
+    channel : `FakeMessageable`
+        The channel the message was sent to.
+    content : `str | None`
+        The latest content.
+    view : `discord.ui.View | None`
+        The latest view attached.
+    edits : `list[dict[str, Any]]`
+        The keyword arguments of every edit, including edits made as the response of an interaction.
+    edited_at : `list[float]`
+        The time of every edit by the clock of the event loop.
+    """
+
+    def __init__(self, channel: FakeMessageable, payload: dict[str, Any], *, latency: float = 0) -> None:
+        self.id = next(_ids)
+        self.channel = channel
+        self.content: str | None = payload.get("content")
+        self.view: ui.View | None = payload.get("view")
+        self.edits: list[dict[str, Any]] = []
+        self.edited_at: list[float] = []
+        self.__latency = latency
+
+    async def edit(self, **kwargs: Any) -> "FakeMessage":  # noqa: ANN401
+        """
+        Record an edit made with the keyword arguments of `discord.Message.edit`.
+
+        Returns
+        -------
+        FakeMessage
+            This message.
+        """
+        await self._apply(kwargs)
+        return self
+
+    async def _apply(self, kwargs: dict[str, Any]) -> None:
+        if self.__latency:
+            await asyncio.sleep(self.__latency)
+        self.edits.append(kwargs)
+        self.edited_at.append(asyncio.get_running_loop().time())
+        self.content = kwargs.get("content", self.content)
+        self.view = kwargs.get("view", self.view)
+
+    async def click(self, target: str | int) -> "FakeInteraction":
+        """
+        Click a button of the message and wait for its callback.
+
+        Parameters
+        ----------
+        target : `str | int`
+            The custom_id or the label of the button, or its index in the view.
+
+        Returns
+        -------
+        FakeInteraction
+            The interaction dispatched to the button.
+        """
+        return await self.__dispatch(target, {"component_type": ComponentType.button.value})
+
+    async def select(self, target: str | int, values: list[str]) -> "FakeInteraction":
+        """
+        Choose values of a select of the message and wait for its callback.
+
+        Parameters
+        ----------
+        target : `str | int`
+            The custom_id or the placeholder of the select, or its index in the view.
+        values : `list[str]`
+            The chosen values.
+
+        Returns
+        -------
+        FakeInteraction
+            The interaction dispatched to the select.
+        """
+        return await self.__dispatch(target, {"component_type": ComponentType.string_select.value, "values": values})
+
+    async def __dispatch(self, target: str | int, data: dict[str, Any]) -> "FakeInteraction":
+        item = self.__find(target)
+        interaction = FakeInteraction(message=self, data={"custom_id": getattr(item, "custom_id", None), **data})
+        # the same entry point discord.py uses for component interactions
+        task = item.view._dispatch_item(item, interaction)  # type: ignore[union-attr, arg-type]  # noqa: SLF001
+        if task is not None:
+            await task
+        return interaction
+
+    def __find(self, target: str | int) -> "ui.Item[Any]":
+        if self.view is None:
+            msg = "The message has no view"
+            raise LookupError(msg)
+
+        children = self.view.children
+        if isinstance(target, int):
+            return children[target]
+        for item in children:
+            if target in (
+                getattr(item, "custom_id", None),
+                getattr(item, "label", None),
+                getattr(item, "placeholder", None),
+            ):
+                return item
+
+        msg = f"No component matches {target!r}"
+        raise LookupError(msg)
+
+
+class FakeInteractionResponse:
+    """
+    FakeInteractionResponse stands in for `discord.InteractionResponse`.
+
+    Attributes
+    ----------
+    deferred : `bool`
+        Whether the interaction has been deferred.
+    messages : `list[dict[str, Any]]`
+        The keyword arguments of `send_message` calls.
+    modal : `discord.ui.Modal | None`
+        The modal sent as the response.
+    """
+
+    def __init__(self, interaction: "FakeInteraction") -> None:
+        self.__interaction = interaction
+        self.__done = False
+        self.deferred = False
+        self.messages: list[dict[str, Any]] = []
+        self.modal: ui.Modal | None = None
+
+    def is_done(self) -> bool:
+        """
+        Return whether the interaction has been responded to.
+
+        Returns
+        -------
+        bool
+            Whether the interaction has been responded to.
+        """
+        return self.__done
+
+    def __respond(self) -> None:
+        if self.__done:
+            raise InteractionResponded(self.__interaction)  # type: ignore[arg-type]
+        self.__done = True
+
+    async def defer(self, **_: Any) -> None:  # noqa: ANN401
+        """Defer the interaction."""
+        self.__respond()
+        self.deferred = True
+
+    async def edit_message(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Edit the message of the interaction as the response."""
+        self.__respond()
+        if (message := self.__interaction.message) is not None:
+            await message._apply(kwargs)  # noqa: SLF001
+
+    async def send_message(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Send a message as the response."""
+        self.__respond()
+        self.messages.append(kwargs)
+        self.__interaction._original = FakeMessage(self.__interaction.channel, kwargs)  # noqa: SLF001
+
+    async def send_modal(self, modal: "ui.Modal") -> None:
+        """Send a modal as the response."""
+        self.__respond()
+        self.modal = modal
+
+
+class _FakeFollowup:
+    def __init__(self, channel: FakeMessageable) -> None:
+        self.__channel = channel
+
+    async def send(self, *, ephemeral: bool = False, wait: bool = False, **kwargs: Any) -> FakeMessage:  # noqa: ANN401, ARG002
+        return await self.__channel.send(**kwargs)
+
+
+class FakeInteraction:
+    """
+    FakeInteraction stands in for `discord.Interaction`.
+
+    Pass this to `InteractionController` to run a view without Discord,
+    or get one from `FakeMessage.click` and `FakeMessage.select`.
+
+    Parameters
+    ----------
+    channel : `FakeMessageable | None`, optional
+        The channel of the interaction. If None, the channel of the message or a new channel is used.
+    message : `FakeMessage | None`, optional
+        The message of the component the interaction comes from.
+    data : `dict[str, Any] | None`, optional
+        The payload of the interaction.
+    expired : `bool`, optional
+        Whether the interaction token has expired, by default False.
+
+    Attributes
+    ----------
+    id : `int`
+        The id of the interaction.
+    response : `FakeInteractionResponse`
+        The response of the interaction.
+    """
+
+    def __init__(
+        self,
+        *,
+        channel: FakeMessageable | None = None,
+        message: FakeMessage | None = None,
+        data: dict[str, Any] | None = None,
+        expired: bool = False,
+    ) -> None:
+        self.id = next(_ids)
+        self.channel = channel or (message.channel if message is not None else FakeMessageable())
+        self.message = message
+        self.data = data or {}
+        self.response = FakeInteractionResponse(self)
+        self.followup = _FakeFollowup(self.channel)
+        self.__expired = expired
+        self._original: FakeMessage | None = None
+
+    def is_expired(self) -> bool:
+        """
+        Return whether the interaction token has expired.
+
+        Returns
+        -------
+        bool
+            Whether the interaction token has expired.
+        """
+        return self.__expired
+
+    async def original_response(self) -> FakeMessage:
+        """
+        Return the message sent as the response.
+
+        Returns
+        -------
+        FakeMessage
+            The message sent by `response.send_message`.
+        """
+        if self._original is None:
+            msg = "The interaction has not been responded with a message"
+            raise LookupError(msg)
+        return self._original
@@ -14,7 +14,7 @@ from .callback import (
     UserSelectCallback,
     UserSelectSyncCallback,
 )
-from .view import ViewErrorHandler, ViewTimeoutHandler
+from .view import ViewErrorHandler, ViewInteractionResponder, ViewTimeoutHandler
 
 __all__ = [
     "ChannelSelectCallback",
@@ -32,5 +32,6 @@ __all__ = [
     "UserSelectCallback",
     "UserSelectSyncCallback",
     "ViewErrorHandler",
+    "ViewInteractionResponder",
     "ViewTimeoutHandler",
 ]
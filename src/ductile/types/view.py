@@ -5,8 +5,10 @@ import discord
 
 __all__ = [
     "ViewErrorHandler",
+    "ViewInteractionResponder",
     "ViewTimeoutHandler",
 ]
 
 ViewErrorHandler: TypeAlias = Callable[[discord.Interaction, Exception, discord.ui.Item], Awaitable[None]]
 ViewTimeoutHandler: TypeAlias = Callable[[], Awaitable[None]]
+ViewInteractionResponder: TypeAlias = Callable[[discord.Interaction], Awaitable[None]]
@@ -1,6 +1,8 @@
 from .button import Button, LinkButton
 from .modal import Modal, TextInput
+from .searchable_select import SearchableSelect, SearchableSelectConfig, SearchIndex
 from .select import ChannelSelect, MentionableSelect, RoleSelect, Select, SelectOption, UserSelect
+from .virtual_select import VirtualSelect, VirtualSelectConfig
 
 __all__ = [
     "Button",
@@ -9,8 +11,13 @@ __all__ = [
     "MentionableSelect",
     "Modal",
     "RoleSelect",
+    "SearchIndex",
+    "SearchableSelect",
+    "SearchableSelectConfig",
     "Select",
     "SelectOption",
     "TextInput",
     "UserSelect",
+    "VirtualSelect",
+    "VirtualSelectConfig",
 ]
@@ -4,7 +4,9 @@ from discord import ButtonStyle as _ButtonStyle
 from discord import ui
 from typing_extensions import NotRequired, Required, TypedDict
 
-from ..utils import call_any_function, is_sync_func  # noqa: TID252
+from ..internal import _respond  # noqa: TID252
+from ..utils import call_any_function  # noqa: TID252
+from .memo import _MemoizedComponent, _props_key
 
 if TYPE_CHECKING:
     from discord import Emoji, Interaction, PartialEmoji
@@ -21,11 +23,13 @@ class ButtonStyle(TypedDict):
     row: NotRequired[Literal[0, 1, 2, 3, 4]]
 
 
-class Button(ui.Button):
+class Button(_MemoizedComponent, ui.Button):
     """
     Button is a class that represents a button.
 
     This class has compatibility with the `discord.ui.Button` class.
+
+    The component payload is cached by the props, so identical buttons across renders and views are serialized once.
     """
 
     def __init__(
@@ -50,16 +54,14 @@ class Button(ui.Button):
             label=label,
             custom_id=custom_id,
         )
+        self._memo_key = _props_key(__style, __disabled, __emoji, label)
 
     async def callback(self, interaction: "Interaction") -> None:
-        if self.__callback_fn is None:
-            await interaction.response.defer()
-            return
-
-        if is_sync_func(self.__callback_fn):
-            await interaction.response.defer()
+        if self.__callback_fn is not None:
+            await call_any_function(self.__callback_fn, interaction)
 
-        await call_any_function(self.__callback_fn, interaction)
+        # respond with the latest render if the callback has not responded yet
+        await _respond(self, interaction)
 
 
 class LinkButton(ui.Button):
@@ -0,0 +1,57 @@
+from collections.abc import Hashable
+from typing import Any
+
+from ..utils import LRUCache  # noqa: TID252
+
+__all__ = [
+    "_MemoizedComponent",
+    "_props_key",
+]
+
+# component payloads shared across renders and views, keyed by the props of the component
+_PAYLOADS: LRUCache[Hashable, dict[str, Any]] = LRUCache(1024)
+
+
+def _props_key(*props: Any) -> Hashable | None:  # noqa: ANN401
+    """Return `props` as a cache key, or None if some of them are not hashable."""
+    try:
+        hash(props)
+    except TypeError:
+        return None
+    return props
+
+
+class _MemoizedComponent:
+    """
+    A mixin caching the payload of a component by the props it has been built with.
+
+    Identical components across renders and views share a single payload, so serializing them
+    for the fingerprint of `ViewObject` costs a dictionary lookup. The shared payload is read-only and
+    only used for the fingerprint. `to_component_dict` builds a new payload as usual.
+
+    Setting a public attribute (e.g. `disabled`) after construction disables the cache for the component.
+    Mutating nested objects in place is not detected, so components exposing them (e.g. `Select.options`)
+    disable the cache when they are read.
+    """
+
+    _memo_key: Hashable | None = None
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        # discord.py items do not override __setattr__. this is called for every attribute, so keep it cheap.
+        object.__setattr__(self, name, value)
+        if name[0] != "_" and self._memo_key is not None:
+            # props have been changed after construction
+            object.__setattr__(self, "_memo_key", None)
+
+    def _component_payload(self) -> dict[str, Any]:
+        """Return the payload of the component, shared with identical components. Do not mutate it."""
+        base: Any = super()
+        if self._memo_key is None:
+            return base.to_component_dict()
+
+        # custom_id and id may be assigned after construction, e.g. by reconciliation
+        key = (type(self), self._memo_key, getattr(self, "custom_id", None), getattr(self, "id", None))
+        if (payload := _PAYLOADS.get(key)) is None:
+            payload = base.to_component_dict()
+            _PAYLOADS.put(key, payload)
+        return payload
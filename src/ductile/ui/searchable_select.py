@@ -0,0 +1,346 @@
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import TypedDict
+
+from ..utils import LRUCache, call_any_function  # noqa: TID252
+from .button import Button, ButtonStyle
+from .modal import Modal, TextInput
+from .select import Select, SelectOption, SelectStyle
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Sequence
+
+    from discord import Interaction
+
+    from ..types import SelectCallback, SelectSyncCallback  # noqa: TID252
+    from ..view import View  # noqa: TID252
+
+__all__ = [
+    "SearchIndex",
+    "SearchableSelect",
+    "SearchableSelectConfig",
+]
+
+# Discord accepts at most 25 options per select
+_MAX_OPTIONS = 25
+_TRIGRAM = 3
+
+_NO_RESULTS = "__ductile_searchable_select_no_results__"
+
+
+class SearchIndex:
+    """
+    SearchIndex is an in-memory index over the labels of select options.
+
+    Labels are indexed by their words for prefix search and by their trigrams for substring search,
+    so a query only touches the matching options instead of scanning all of them.
+
+    Build an index once per source with `SearchIndex.shared` and share it across views.
+    Building is CPU bound (about a second for 50k options), so build large indices at startup.
+
+    Parameters
+    ----------
+    source : `Sequence[SelectOption]`
+        The options to index.
+    """
+
+    __shared: "LRUCache[int, tuple[Sequence[SelectOption], SearchIndex]]" = LRUCache(32)
+
+    def __init__(self, source: "Sequence[SelectOption]") -> None:
+        self.__source = source
+        self.__labels = [_normalize(option["label"]) for option in source]
+
+        # sorted labels and the index of the option of each label, for labels starting with multi-word queries
+        labels = sorted((label, i) for i, label in enumerate(self.__labels))
+        self.__sorted_labels = [label for label, _ in labels]
+        self.__label_ids = array("q", (i for _, i in labels))
+
+        # sorted words and the index of the option each word belongs to
+        words = sorted((word, i) for i, label in enumerate(self.__labels) for word in set(label.split()))
+        self.__words = [word for word, _ in words]
+        self.__word_ids = array("q", (i for _, i in words))
+
+        trigrams: defaultdict[str, array[int]] = defaultdict(lambda: array("q"))
+        for i, label in enumerate(self.__labels):
+            for trigram in _trigrams(label):
+                trigrams[trigram].append(i)
+        self.__trigrams = dict(trigrams)
+
+    @classmethod
+    def shared(cls, source: "Sequence[SelectOption]") -> "SearchIndex":
+        """
+        Return the index of the source, building it only on the first call for the source.
+
+        The source must not be mutated after the index is built.
+
+        Parameters
+        ----------
+        source : `Sequence[SelectOption]`
+            The options to index.
+
+        Returns
+        -------
+        SearchIndex
+            The index shared by all callers with the same source.
+        """
+        # the cache keeps the source alive, so its id is not reused while the entry exists
+        if (entry := cls.__shared.get(id(source))) is not None and entry[0] is source:
+            return entry[1]
+
+        index = cls(source)
+        cls.__shared.put(id(source), (source, index))
+        return index
+
+    @property
+    def source(self) -> "Sequence[SelectOption]":
+        """
+        property: The indexed options.
+
+        Returns
+        -------
+        Sequence[SelectOption]
+            The indexed options.
+        """
+        return self.__source
+
+    def search(self, query: str, *, limit: int = _MAX_OPTIONS) -> list[int]:
+        """
+        Search options by label.
+
+        Options whose label starts with the query come first, then options with a word starting with the query,
+        then options containing the query. Options of the same rank are ordered as in the source.
+
+        Parameters
+        ----------
+        query : `str`
+            The query. Case is ignored.
+        limit : `int`, optional
+            Maximum number of results, by default 25.
+
+        Returns
+        -------
+        list[int]
+            The indices of the matched options in the source.
+        """
+        q = _normalize(query).strip()
+        if not q:
+            return list(range(min(limit, len(self.__source))))
+
+        label_hits = sorted(_prefix(self.__sorted_labels, self.__label_ids, q))
+        word_hits = set(_prefix(self.__words, self.__word_ids, q)).difference(label_hits)
+        result = label_hits + sorted(word_hits)
+        if len(result) < limit:
+            seen = word_hits.union(label_hits)
+            result += sorted(i for i in self.__substring(q) if i not in seen)
+        return result[:limit]
+
+    def __substring(self, q: str) -> "Iterable[int]":
+        if len(q) < _TRIGRAM:
+            # too short for trigrams. fall back to scanning the labels.
+            return (i for i, label in enumerate(self.__labels) if q in label)
+
+        postings = [self.__trigrams.get(trigram) for trigram in _trigrams(q)]
+        if any(p is None for p in postings):
+            return ()
+
+        # intersect from the shortest posting list, then verify the order of trigrams
+        postings.sort(key=len)  # type: ignore[arg-type]
+        candidates = set(postings[0])  # type: ignore[arg-type]
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)  # type: ignore[arg-type]
+        return (i for i in candidates if q in self.__labels[i])
+
+
+def _prefix(keys: list[str], ids: "array[int]", q: str) -> "Iterable[int]":
+    """Yield the ids of the sorted keys starting with `q`."""
+    k = bisect_left(keys, q)
+    while k < len(keys) and keys[k].startswith(q):
+        yield ids[k]
+        k += 1
+
+
+def _normalize(label: str) -> str:
+    return label.casefold()
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + _TRIGRAM] for i in range(len(text) - _TRIGRAM + 1)}
+
+
+class SearchableSelectConfig(TypedDict, total=False):
+    """
+    SearchableSelectConfig is a TypedDict that represents the config of a searchable select.
+
+    Attributes
+    ----------
+    max_values : `int`
+        Maximum number of values selected at once, by default 1.
+    modal_title : `str`
+        Title of the search modal.
+    input_label : `str`
+        Label of the query input in the search modal.
+    no_results_label : `str`
+        Label of the option shown when nothing matches.
+    """
+
+    max_values: int
+    modal_title: str
+    input_label: str
+    no_results_label: str
+
+
+class SearchableSelect:
+    """
+    SearchableSelect is a select refilled with the top 25 matches of a query typed in a modal.
+
+    Attach this to the view like `Paginator`, and call `render` and `render_search_button` in `View.render`.
+
+    Parameters
+    ----------
+    view : `View`
+        The view to attach.
+    source : `Sequence[SelectOption] | SearchIndex`
+        All options, or an index of them. An index of the options is shared across views via `SearchIndex.shared`.
+    config : `SearchableSelectConfig`, optional
+        The searchable select configuration.
+    on_select : `SelectCallback | SelectSyncCallback | None`, optional
+        Called with the selected values.
+    """
+
+    def __init__(
+        self,
+        view: "View",
+        *,
+        source: "Sequence[SelectOption] | SearchIndex",
+        config: SearchableSelectConfig | None = None,
+        on_select: "SelectCallback | SelectSyncCallback | None" = None,
+    ) -> None:
+        config = config or {}
+        self.__view = view
+        self.__index = source if isinstance(source, SearchIndex) else SearchIndex.shared(source)
+        self.__max_values = config.get("max_values", 1)
+        self.__modal_title = config.get("modal_title", "Search")
+        self.__input_label = config.get("input_label", "Query")
+        self.__no_results_label = config.get("no_results_label", "No results")
+        self.__on_select = on_select
+
+        self.__query = ""
+        self.__results = self.__index.search("")
+
+    @property
+    def query(self) -> str:
+        """
+        Return the current query.
+
+        Returns
+        -------
+        str
+            The current query.
+        """
+        return self.__query
+
+    def _render_key(self) -> "Hashable":
+        """Return the key of what `render` can read from this select. See `View.render_key`."""
+        return self.__query
+
+    def _hibernate(self) -> "Hashable":
+        """Return the query of this select to keep while the view is hibernated."""
+        return self.__query
+
+    def _restore(self, snapshot: "Hashable") -> None:
+        """Restore the query returned by `_hibernate` without sync."""
+        self.__query = str(snapshot)
+        self.__results = self.__index.search(self.__query)
+
+    def search(self, query: str) -> None:
+        """
+        Refill the select with the matches of the query. This method will call `View.sync`.
+
+        Parameters
+        ----------
+        query : `str`
+            The query.
+        """
+        if query == self.__query:
+            return
+
+        self.__query = query
+        self.__results = self.__index.search(query)
+        self.__view.sync()
+
+    def render(self, *, style: SelectStyle | None = None, custom_id: str | None = None) -> Select:
+        """
+        Build the select showing the matches of the current query.
+
+        Parameters
+        ----------
+        style : `SelectStyle | None`, optional
+            The style of the select.
+        custom_id : `str | None`, optional
+            The custom_id of the select.
+
+        Returns
+        -------
+        Select
+            The select showing the matches.
+        """
+        source = self.__index.source
+        options: list[SelectOption] = [source[i] for i in self.__results]
+        if not options:
+            # a select needs at least one option
+            options = [{"label": self.__no_results_label, "value": _NO_RESULTS}]
+
+        return Select(
+            config={"max_values": min(self.__max_values, len(options))},
+            style=style or {},
+            options=options,
+            custom_id=custom_id,
+            on_select=self.__handle_select,
+        )
+
+    def render_search_button(
+        self,
+        label: str | None = "Search",
+        /,
+        *,
+        style: ButtonStyle | None = None,
+        custom_id: str | None = None,
+    ) -> Button:
+        """
+        Build the button opening the search modal.
+
+        Parameters
+        ----------
+        label : `str | None`, optional
+            The label of the button, by default "Search".
+        style : `ButtonStyle | None`, optional
+            The style of the button.
+        custom_id : `str | None`, optional
+            The custom_id of the button.
+
+        Returns
+        -------
+        Button
+            The button opening the search modal.
+        """
+        return Button(label, style=style or {"color": "grey"}, custom_id=custom_id, on_click=self.__open_modal)
+
+    async def __open_modal(self, interaction: "Interaction") -> None:
+        query_input = TextInput(
+            self.__input_label,
+            style={"field": "short", "default": self.__query or None},
+            config={"required": False, "max_length": 100},
+        )
+        modal = Modal(title=self.__modal_title, inputs=[query_input], on_submit=self.__handle_search)
+        await interaction.response.send_modal(modal)
+
+    def __handle_search(self, _: "Interaction", values: dict[str, Any]) -> None:
+        self.search(values.get(self.__input_label) or "")
+
+    async def __handle_select(self, interaction: "Interaction", values: list[str]) -> None:
+        values = [v for v in values if v != _NO_RESULTS]
+        if values and self.__on_select is not None:
+            await call_any_function(self.__on_select, interaction, values)
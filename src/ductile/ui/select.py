@@ -4,9 +4,13 @@ from discord import Emoji, PartialEmoji, ui
 from discord import SelectOption as _SelectOption
 from typing_extensions import NotRequired, Required, TypedDict
 
-from ..utils import call_any_function, is_sync_func  # noqa: TID252
+from ..internal import _respond  # noqa: TID252
+from ..utils import LRUCache, call_any_function  # noqa: TID252
+from .memo import _MemoizedComponent, _props_key
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, Sequence
+
     from discord import ChannelType, Interaction
 
     from ..types import (  # noqa: TID252
@@ -86,11 +90,52 @@ class UserSelectConfig(SelectConfigBase):
     """UserSelectConfig is a class that represents the config of a user select."""
 
 
-class Select(ui.Select):
+# converted options by the option props. they are never handed out, only copied, since they are mutable.
+_OPTIONS: "LRUCache[Hashable, tuple[_SelectOption, ...]]" = LRUCache(256)
+_OPTION_SLOTS: tuple[str, ...] = _SelectOption.__slots__
+
+
+def _copy_option(option: _SelectOption) -> _SelectOption:
+    # copying the slots skips the validation of the constructor
+    copied = _SelectOption.__new__(_SelectOption)
+    for name in _OPTION_SLOTS:
+        setattr(copied, name, getattr(option, name))
+    return copied
+
+
+def _build_options(options: "Sequence[SelectOption]") -> tuple["Hashable | None", list[_SelectOption]]:
+    """Convert options into `discord.SelectOption`, copying the ones converted from the same props."""
+    props = tuple(
+        (
+            (label := option.get("label", "")),
+            option.get("value", None) or label,
+            option.get("description", None),
+            option.get("emoji", None),
+            option.get("default", False),
+        )
+        for option in options
+    )
+    key = _props_key(*props)
+    if key is not None and (cached := _OPTIONS.get(key)) is not None:
+        return key, [_copy_option(option) for option in cached]
+
+    built = [
+        _SelectOption(label=label, value=value, description=description, emoji=emoji, default=default)
+        for label, value, description, emoji, default in props
+    ]
+    if key is not None:
+        _OPTIONS.put(key, tuple(_copy_option(option) for option in built))
+    return key, built
+
+
+class Select(_MemoizedComponent, ui.Select):
     """
     Select is a class that represents a select.
 
     This class has compatibility with the `discord.ui.Select` class.
+
+    Converted options and the component payload are cached by the props,
+    so identical selects across renders and views are built and serialized once.
     """
 
     def __init__(
@@ -105,37 +150,53 @@ class Select(ui.Select):
         __disabled = style.get("disabled", False)
         __placeholder = style.get("placeholder", None)
         __row = style.get("row", None)
+        __options_key, __options = _build_options(options)
         __d = {
             "disabled": __disabled,
             "placeholder": __placeholder,
             "row": __row,
             "min_values": config.get("min_values", None),
             "max_values": config.get("max_values", None),
-            "options": [
-                _SelectOption(
-                    label=(_label := option.get("label", "")),
-                    value=option.get("value", None) or _label,
-                    description=option.get("description", None),
-                    emoji=option.get("emoji", None),
-                    default=option.get("default", False),
-                )
-                for option in options
-            ],
+            "options": __options,
         }
         if custom_id:
             __d["custom_id"] = custom_id
         self.__callback_fn = on_select
         super().__init__(**__d)
+        if __options_key is not None:
+            self._memo_key = (__disabled, __placeholder, __d["min_values"], __d["max_values"], __options_key)
+
+    @property
+    def options(self) -> list[_SelectOption]:
+        """
+        property: The options of the select.
+
+        The options may be mutated in place, so reading them disables the payload cache for the select.
+
+        Returns
+        -------
+        `list[discord.SelectOption]`
+            The options.
+        """
+        self._memo_key = None
+        return self._underlying.options
+
+    @options.setter
+    def options(self, value: list[_SelectOption]) -> None:
+        self._memo_key = None
+        ui.Select.options.fset(self, value)  # type: ignore[attr-defined]
+
+    def append_option(self, option: _SelectOption) -> None:
+        # the options are changed after construction
+        self._memo_key = None
+        super().append_option(option)
 
     async def callback(self, interaction: "Interaction") -> None:
-        if self.__callback_fn is None:
-            await interaction.response.defer()
-            return
+        if self.__callback_fn is not None:
+            await call_any_function(self.__callback_fn, interaction, self.values)
 
-        if is_sync_func(self.__callback_fn):
-            await interaction.response.defer()
-
-        await call_any_function(self.__callback_fn, interaction, self.values)
+        # respond with the latest render if the callback has not responded yet
+        await _respond(self, interaction)
 
 
 class ChannelSelect(ui.ChannelSelect):
@@ -170,14 +231,11 @@ class ChannelSelect(ui.ChannelSelect):
         super().__init__(**__d)
 
     async def callback(self, interaction: "Interaction") -> None:
-        if self.__callback_fn is None:
-            await interaction.response.defer()
-            return
-
-        if is_sync_func(self.__callback_fn):
-            await interaction.response.defer()
+        if self.__callback_fn is not None:
+            await call_any_function(self.__callback_fn, interaction, self.values)
 
-        await call_any_function(self.__callback_fn, interaction, self.values)
+        # respond with the latest render if the callback has not responded yet
+        await _respond(self, interaction)
 
 
 class RoleSelect(ui.RoleSelect):
@@ -211,14 +269,11 @@ class RoleSelect(ui.RoleSelect):
         super().__init__(**__d)
 
     async def callback(self, interaction: "Interaction") -> None:
-        if self.__callback_fn is None:
-            await interaction.response.defer()
-            return
+        if self.__callback_fn is not None:
+            await call_any_function(self.__callback_fn, interaction, self.values)
 
-        if is_sync_func(self.__callback_fn):
-            await interaction.response.defer()
-
-        await call_any_function(self.__callback_fn, interaction, self.values)
+        # respond with the latest render if the callback has not responded yet
+        await _respond(self, interaction)
 
 
 class MentionableSelect(ui.MentionableSelect):
@@ -253,14 +308,11 @@ class MentionableSelect(ui.MentionableSelect):
         super().__init__(**__d)
 
     async def callback(self, interaction: "Interaction") -> None:
-        if self.__callback_fn is None:
-            await interaction.response.defer()
-            return
-
-        if is_sync_func(self.__callback_fn):
-            await interaction.response.defer()
+        if self.__callback_fn is not None:
+            await call_any_function(self.__callback_fn, interaction, self.values)
 
-        await call_any_function(self.__callback_fn, interaction, self.values)
+        # respond with the latest render if the callback has not responded yet
+        await _respond(self, interaction)
 
 
 class UserSelect(ui.UserSelect):
@@ -294,11 +346,8 @@ class UserSelect(ui.UserSelect):
         super().__init__(**__d)
 
     async def callback(self, interaction: "Interaction") -> None:
-        if self.__callback_fn is None:
-            await interaction.response.defer()
-            return
-
-        if is_sync_func(self.__callback_fn):
-            await interaction.response.defer()
+        if self.__callback_fn is not None:
+            await call_any_function(self.__callback_fn, interaction, self.values)
 
-        await call_any_function(self.__callback_fn, interaction, self.values)
+        # respond with the latest render if the callback has not responded yet
+        await _respond(self, interaction)
@@ -0,0 +1,220 @@
+from typing import TYPE_CHECKING
+
+from typing_extensions import TypedDict
+
+from ..utils import call_any_function  # noqa: TID252
+from .select import Select, SelectOption, SelectStyle
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Sequence
+
+    from discord import Interaction
+
+    from ..types import SelectCallback, SelectSyncCallback  # noqa: TID252
+    from ..view import View  # noqa: TID252
+
+__all__ = [
+    "VirtualSelect",
+    "VirtualSelectConfig",
+]
+
+# Discord accepts at most 25 options per select. two of them are reserved for the sentinels.
+_MAX_OPTIONS = 25
+_MAX_WINDOW_SIZE = _MAX_OPTIONS - 2
+
+_PREVIOUS = "__ductile_virtual_select_previous__"
+_NEXT = "__ductile_virtual_select_next__"
+
+
+class VirtualSelectConfig(TypedDict, total=False):
+    """
+    VirtualSelectConfig is a TypedDict that represents the config of a virtual select.
+
+    Attributes
+    ----------
+    window_size : `int`
+        Number of options shown at once, at most 23, by default 23.
+    max_values : `int`
+        Maximum number of values selected across all windows, by default 1.
+    previous_label : `str`
+        Label of the option moving to the previous window.
+    next_label : `str`
+        Label of the option moving to the next window.
+    """
+
+    window_size: int
+    max_values: int
+    previous_label: str
+    next_label: str
+
+
+class VirtualSelect:
+    """
+    VirtualSelect windows a large option source into selects within Discord's 25-option limit.
+
+    Only the options of the visible window are converted into `discord.SelectOption`,
+    and the window is moved by the "previous" and "next" sentinel options.
+    Selected values are kept across windows.
+
+    Attach this to the view like `Paginator` and call `render` in `View.render`.
+
+    Parameters
+    ----------
+    view : `View`
+        The view to attach.
+    source : `Sequence[SelectOption]`
+        All options. The source is not copied, the visible window is sliced on demand.
+    config : `VirtualSelectConfig`, optional
+        The virtual select configuration.
+    on_select : `SelectCallback | SelectSyncCallback | None`, optional
+        Called with all selected values when the selection changes.
+    """
+
+    def __init__(
+        self,
+        view: "View",
+        *,
+        source: "Sequence[SelectOption]",
+        config: VirtualSelectConfig | None = None,
+        on_select: "SelectCallback | SelectSyncCallback | None" = None,
+    ) -> None:
+        config = config or {}
+        window_size = config.get("window_size", _MAX_WINDOW_SIZE)
+        if not 0 < window_size <= _MAX_WINDOW_SIZE:
+            msg = f"window_size must be between 1 and {_MAX_WINDOW_SIZE}"
+            raise ValueError(msg)
+
+        self.__view = view
+        self.__source = source
+        self.__window_size = window_size
+        self.__max_values = config.get("max_values", 1)
+        self.__previous_label = config.get("previous_label", "◀ Previous")
+        self.__next_label = config.get("next_label", "Next ▶")
+        self.__on_select = on_select
+
+        self.__window = 0
+        # selected values in the order of selection
+        self.__selected: dict[str, None] = {}
+
+    @property
+    def window(self) -> int:
+        """
+        Return the current window number.
+
+        Returns
+        -------
+        int
+            The current window number.
+        """
+        return self.__window + 1
+
+    @property
+    def max_window(self) -> int:
+        """
+        Return the maximum window number.
+
+        Returns
+        -------
+        int
+            The maximum window number.
+        """
+        return max(-(-len(self.__source) // self.__window_size), 1)
+
+    @property
+    def selected(self) -> list[str]:
+        """
+        Return the selected values across all windows.
+
+        Returns
+        -------
+        list[str]
+            The selected values in the order of selection.
+        """
+        return list(self.__selected)
+
+    def _render_key(self) -> "Hashable":
+        """Return the key of what `render` can read from this select. See `View.render_key`."""
+        return (self.__window, tuple(self.__selected))
+
+    def _hibernate(self) -> "Hashable":
+        """Return the position of this select to keep while the view is hibernated."""
+        return (self.__window, tuple(self.__selected))
+
+    def _restore(self, snapshot: "Hashable") -> None:
+        """Restore the position returned by `_hibernate` without sync."""
+        window, selected = snapshot  # type: ignore[misc]
+        self.__window = min(window, self.max_window - 1)
+        self.__selected = dict.fromkeys(selected)
+
+    def clear(self) -> None:
+        """Clear the selected values. This method will call `View.sync`."""
+        if self.__selected:
+            self.__selected.clear()
+            self.__view.sync()
+
+    def render(self, *, style: SelectStyle | None = None, custom_id: str | None = None) -> Select:
+        """
+        Build the select showing the current window.
+
+        Parameters
+        ----------
+        style : `SelectStyle | None`, optional
+            The style of the select.
+        custom_id : `str | None`, optional
+            The custom_id of the select.
+
+        Returns
+        -------
+        Select
+            The select showing the current window.
+        """
+        options: list[SelectOption] = []
+        if self.__window > 0:
+            options.append({"label": self.__previous_label, "value": _PREVIOUS})
+
+        for option in self.__visible():
+            value = _value(option)
+            options.append({**option, "value": value, "default": value in self.__selected})
+
+        if self.__window < self.max_window - 1:
+            options.append({"label": self.__next_label, "value": _NEXT})
+
+        return Select(
+            config={"min_values": 0, "max_values": max(min(self.__max_values, len(options)), 1)},
+            style=style or {},
+            options=options,
+            custom_id=custom_id,
+            on_select=self.__handle_select,
+        )
+
+    def __visible(self) -> "Sequence[SelectOption]":
+        start = self.__window * self.__window_size
+        return self.__source[start : start + self.__window_size]
+
+    async def __handle_select(self, interaction: "Interaction", values: list[str]) -> None:
+        move = 1 if _NEXT in values else -1 if _PREVIOUS in values else 0
+        chosen = [v for v in values if v not in {_NEXT, _PREVIOUS}]
+
+        before = self.selected
+        if chosen or move == 0:
+            # replace the selection within the visible window, keeping selections in other windows
+            for option in self.__visible():
+                self.__selected.pop(_value(option), None)
+            for value in chosen:
+                self.__selected[value] = None
+            while len(self.__selected) > self.__max_values:
+                # drop the oldest selection
+                del self.__selected[next(iter(self.__selected))]
+
+        window = self.__window
+        self.__window = min(max(self.__window + move, 0), self.max_window - 1)
+        changed = self.selected != before
+        if changed or self.__window != window:
+            self.__view.sync()
+
+        if changed and self.__on_select is not None:
+            await call_any_function(self.__on_select, interaction, self.selected)
+
+
+def _value(option: SelectOption) -> str:
+    return option.get("value") or option["label"]
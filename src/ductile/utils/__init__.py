@@ -1,14 +1,17 @@
 from .async_helper import get_all_tasks, wait_tasks_by_name
 from .call import call_any_function
 from .chunk import chunks
-from .debounce import debounce
-from .logger import get_logger
+from .logger import SamplingFilter, get_logger
+from .lru import LRUCache
+from .scheduler import TrailingEdgeScheduler
 from .type_helper import is_async_func, is_sync_func
 
 __all__ = [
+    "LRUCache",
+    "SamplingFilter",
+    "TrailingEdgeScheduler",
     "call_any_function",
     "chunks",
-    "debounce",
     "get_all_tasks",
     "get_logger",
     "is_async_func",
@@ -1,40 +1,76 @@
 import logging
-import logging.handlers
 
 __all__ = [
+    "SamplingFilter",
     "get_logger",
 ]
 
+_ROOT = "ductile"
 
-def get_logger(name: str, level: str = "DEBUG") -> logging.Logger:  # name: __name__
+
+def get_logger(name: str) -> logging.Logger:  # name: __name__
     """
-    Get a logger with a stream handler.
+    Get a logger under the `ductile` logger.
+
+    Handlers and levels are left to the application. Configure `logging.getLogger("ductile")` to see the logs.
 
     Parameters
     ----------
     name : str
-        logger name. Usually __name__.
-    level : str, optional
-        logging level, by default "DEBUG"
+        logger name. Usually __name__. Names outside the package are nested under `ductile`.
 
     Returns
     -------
     logging.Logger
-        _description_
+        The logger.
+    """
+    if name != _ROOT and not name.startswith(f"{_ROOT}."):
+        name = f"{_ROOT}.{name}"
+    return logging.getLogger(name)
+
+
+class SamplingFilter(logging.Filter):
     """
-    logger = logging.getLogger(name)
-    stream_handler = logging.StreamHandler()
+    SamplingFilter passes one of every `every` records per View class, so high-traffic views do not flood the logs.
+
+    Records are grouped by their `view` attribute, which ductile sets to the qualified name of the View class,
+    or by the logger name if they have none. Records at `level` or above always pass.
 
-    # set format
-    literal_formatter = logging.Formatter("%(asctime)s:%(levelname)s:\n%(name)s:%(message)s")
-    stream_handler.setFormatter(literal_formatter)
+    Attach this to a handler. Filters of a logger do not apply to records propagated from its children,
+    e.g. `ductile.state`.
 
-    # set level
-    logger.setLevel(level)
-    stream_handler.setLevel(level)
+    ```py
+    handler = logging.StreamHandler()
+    handler.addFilter(SamplingFilter(100))
+    logging.getLogger("ductile").addHandler(handler)
+    ```
+
+    Parameters
+    ----------
+    every : `int`
+        Pass one of every `every` records.
+    level : `int`, optional
+        The level of records never sampled, by default `logging.WARNING`.
+
+    Raises
+    ------
+    ValueError
+        If `every` is less than 1.
+    """
 
-    # add handler
-    if not logger.hasHandlers():
-        logger.addHandler(stream_handler)
+    def __init__(self, every: int, *, level: int = logging.WARNING) -> None:
+        if every < 1:
+            msg = "every must be 1 or greater"
+            raise ValueError(msg)
+        super().__init__()
+        self.__every = every
+        self.__level = level
+        self.__counts: dict[str, int] = {}
 
-    return logger
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.__level:
+            return True
+        key = getattr(record, "view", record.name)
+        count = self.__counts.get(key, 0)
+        self.__counts[key] = count + 1
+        return count % self.__every == 0
@@ -0,0 +1,113 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar, overload
+
+__all__ = [
+    "LRUCache",
+]
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+_D = TypeVar("_D")
+
+
+class LRUCache(Generic[_K, _V]):
+    """
+    A bounded mapping that evicts the least recently used entry.
+
+    Parameters
+    ----------
+    maxsize : `int`
+        Maximum number of entries.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            msg = "maxsize must be greater than 0"
+            raise ValueError(msg)
+
+        self.__maxsize = maxsize
+        self.__data: OrderedDict[_K, _V] = OrderedDict()
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Return the maximum number of entries.
+
+        Returns
+        -------
+        int
+            The maximum number of entries.
+        """
+        return self.__maxsize
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def __contains__(self, key: _K) -> bool:
+        return key in self.__data
+
+    @overload
+    def get(self, key: _K) -> _V | None: ...
+
+    @overload
+    def get(self, key: _K, default: _D) -> _V | _D: ...
+
+    def get(self, key: _K, default: "_D | None" = None) -> "_V | _D | None":
+        """
+        Return the value for the key and mark it as the most recently used.
+
+        Parameters
+        ----------
+        key : `_K`
+            The key.
+        default : `_D | None`, optional
+            The value returned if the key is not found, by default None.
+
+        Returns
+        -------
+        `_V | _D | None`
+            The value for the key, or `default`.
+        """
+        try:
+            self.__data.move_to_end(key)
+            # the entry may be evicted in between by a render running in another thread
+            return self.__data[key]
+        except KeyError:
+            return default
+
+    def put(self, key: _K, value: _V) -> None:
+        """
+        Set the value for the key, evicting the least recently used entry if the cache is full.
+
+        Parameters
+        ----------
+        key : `_K`
+            The key.
+        value : `_V`
+            The value.
+        """
+        self.__data[key] = value
+        self.__data.move_to_end(key)
+        if len(self.__data) > self.__maxsize:
+            self.__data.popitem(last=False)
+
+    def pop(self, key: _K) -> _V | None:
+        """
+        Remove the key and return its value.
+
+        Parameters
+        ----------
+        key : `_K`
+            The key.
+
+        Returns
+        -------
+        `_V | None`
+            The removed value. None if the key is not found.
+        """
+        return self.__data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.__data.clear()
@@ -0,0 +1,145 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+__all__ = [
+    "TrailingEdgeScheduler",
+]
+
+
+class TrailingEdgeScheduler:
+    """
+    Coalesce bursts of calls into a single trailing-edge execution on the event loop.
+
+    Unlike a thread based debounce, this scheduler uses a single `asyncio.TimerHandle` per burst
+    and never drops the last call: every burst is followed by exactly one execution of `fn`.
+
+    Executions of different bursts may overlap if `fn` takes longer than `wait`,
+    so `fn` is responsible for ordering its side effects.
+
+    Parameters
+    ----------
+    fn : `Callable[[], Awaitable[None]]`
+        The coroutine function to execute.
+    wait : `float`
+        Seconds to wait after the last call before executing `fn`.
+    max_wait : `float | None`, optional
+        Maximum seconds a burst can postpone the execution since its first call.
+        If None, a continuous burst can postpone the execution indefinitely.
+    loop : `asyncio.AbstractEventLoop | None`, optional
+        The event loop to schedule on. If None, the current event loop is used.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[], Awaitable[None]],
+        *,
+        wait: float,
+        max_wait: float | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        self.__fn = fn
+        self.__wait = max(wait, 0)
+        self.__max_wait = max_wait
+        self.__loop = loop
+
+        self.__handle: asyncio.TimerHandle | None = None
+        self.__deadline: float | None = None
+        self.__waiter: asyncio.Future[None] | None = None
+        self.__tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> bool:
+        """
+        Return whether an execution is scheduled but not started yet.
+
+        Returns
+        -------
+        bool
+            Whether an execution is scheduled.
+        """
+        return self.__waiter is not None
+
+    def schedule(self) -> "asyncio.Future[None]":
+        """
+        Schedule a trailing-edge execution of `fn`.
+
+        Returns
+        -------
+        `asyncio.Future[None]`
+            A future resolved when the execution covering this call has finished.
+            Every call in the same burst returns the same future.
+        """
+        loop = self.__get_loop()
+        now = loop.time()
+
+        if self.__waiter is None:
+            self.__waiter = loop.create_future()
+            self.__deadline = None if self.__max_wait is None else now + self.__max_wait
+
+        if self.__handle is not None:
+            self.__handle.cancel()
+
+        when = now + self.__wait
+        if self.__deadline is not None:
+            when = min(when, self.__deadline)
+
+        self.__handle = loop.call_at(when, self.__fire)
+        return self.__waiter
+
+    async def flush(self, fn: Callable[[], Awaitable[None]] | None = None) -> None:
+        """
+        Execute `fn` immediately, taking over the pending burst if any.
+
+        Parameters
+        ----------
+        fn : `Callable[[], Awaitable[None]] | None`, optional
+            The coroutine function to execute instead of the scheduled one.
+        """
+        waiter = self.__take_waiter()
+        await self.__run(waiter, fn, propagate=True)
+
+    def cancel(self) -> None:
+        """Cancel the pending execution. Callers waiting on it are released without executing `fn`."""
+        waiter = self.__take_waiter()
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def __get_loop(self) -> asyncio.AbstractEventLoop:
+        if self.__loop is None:
+            self.__loop = asyncio.get_event_loop()
+        return self.__loop
+
+    def __take_waiter(self) -> "asyncio.Future[None] | None":
+        if self.__handle is not None:
+            self.__handle.cancel()
+            self.__handle = None
+
+        waiter, self.__waiter = self.__waiter, None
+        self.__deadline = None
+        return waiter
+
+    def __fire(self) -> None:
+        waiter = self.__take_waiter()
+
+        # keep a strong reference to the task until it is done
+        task = self.__get_loop().create_task(self.__run(waiter))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def __run(
+        self,
+        waiter: "asyncio.Future[None] | None",
+        fn: Callable[[], Awaitable[None]] | None = None,
+        *,
+        propagate: bool = False,
+    ) -> None:
+        try:
+            await (fn or self.__fn)()
+        except Exception as e:
+            if waiter is not None and not waiter.done():
+                waiter.set_exception(e)
+            if propagate or waiter is None:
+                raise
+        else:
+            if waiter is not None and not waiter.done():
+                waiter.set_result(None)
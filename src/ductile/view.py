@@ -1,12 +1,21 @@
 import asyncio
-from typing import TYPE_CHECKING
+import hashlib
+import pickle
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import contextmanager
+from functools import cached_property, wraps
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from discord import Embed, File, ui
 from pydantic import BaseModel, Field
 
+from .state import State
 from .utils import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from discord import Interaction
 
     from .controller import ViewController
@@ -15,8 +24,110 @@ if TYPE_CHECKING:
 __all__ = [
     "View",
     "ViewObject",
+    "static",
 ]
 
+_V = TypeVar("_V", bound="View")
+_S = TypeVar("_S")
+
+# digests of static components. they are weakly referenced, since their callbacks usually refer to the view.
+_STATIC_DIGESTS: "weakref.WeakKeyDictionary[ui.Item[Any], bytes]" = weakref.WeakKeyDictionary()
+# embeds can not be weakly referenced, so they are kept by id with the embed to make sure the id is not reused.
+# embeds do not refer to the view, and entries are removed when the view owning them is garbage collected.
+_STATIC_EMBED_DIGESTS: dict[int, tuple[Embed, bytes]] = {}
+
+
+def _digest(payload: Any) -> bytes:  # noqa: ANN401
+    try:
+        serialized = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        serialized = repr(payload).encode()
+    return hashlib.blake2b(serialized, digest_size=16).digest()
+
+
+def _static_digest(obj: Any) -> bytes | None:  # noqa: ANN401
+    if isinstance(obj, Embed):
+        entry = _STATIC_EMBED_DIGESTS.get(id(obj))
+        return entry[1] if entry is not None and entry[0] is obj else None
+    try:
+        return _STATIC_DIGESTS.get(obj)
+    except TypeError:
+        # not weakly referenceable, so never registered
+        return None
+
+
+def _component_payload(item: ui.Item[Any]) -> Any:  # noqa: ANN401
+    # memoized components share the payload with identical ones. see `ductile.ui.memo`.
+    memoized = getattr(item, "_component_payload", None)
+    return memoized() if memoized is not None else item.to_component_dict()
+
+
+def _freeze(value: Any) -> Hashable:  # noqa: ANN401
+    """Convert built-in containers into hashable equivalents. Raise `TypeError` if `value` can not be hashed."""
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, set):
+        return frozenset(value)
+    hash(value)
+    return value
+
+
+def _forget_static(ids: list[int]) -> None:
+    for i in ids:
+        _STATIC_EMBED_DIGESTS.pop(i, None)
+
+
+def static(fn: Callable[[_V], _S]) -> "cached_property[_S]":
+    """
+    Declare embeds or components which do not depend on any state.
+
+    The decorated method is called once per view and returns the same objects on every access,
+    so they are not rebuilt on every render. Their payload is serialized once
+    and the diff of renders uses it instead of serializing them again.
+
+    **Note that static embeds and components must not be mutated after they are built.**
+
+    Example
+    -------
+    ```py
+    class MyView(View):
+        @static
+        def footer(self) -> list[ui.Item]:
+            return [Button("stop", style={"color": "red"}, on_click=lambda _: self.stop())]
+
+        def render(self) -> ViewObject:
+            return ViewObject(components=[Button(str(self.count()), style={"color": "grey"}), *self.footer])
+    ```
+
+    Parameters
+    ----------
+    fn : `Callable[[View], _S]`
+        The method building an embed, a component, or a list of them.
+
+    Returns
+    -------
+    `cached_property[_S]`
+        The property returning the built objects.
+    """
+
+    @wraps(fn)
+    def build(self: _V) -> _S:
+        built = fn(self)
+        objects: list[Any] = list(built) if isinstance(built, list | tuple) else [built]  # type: ignore[arg-type]
+        embeds = [obj for obj in objects if isinstance(obj, Embed)]
+        for obj in objects:
+            if isinstance(obj, Embed):
+                _STATIC_EMBED_DIGESTS[id(obj)] = (obj, _digest(obj.to_dict()))
+            else:
+                _STATIC_DIGESTS[obj] = _digest(obj.to_component_dict())
+        if embeds:
+            weakref.finalize(self, _forget_static, [id(obj) for obj in embeds])
+        return built
+
+    return cached_property(build)
+
 
 class ViewObject(BaseModel):
     """
@@ -41,46 +152,41 @@ class ViewObject(BaseModel):
 
     model_config = {"arbitrary_types_allowed": True}
 
-    def equals(self, other: "ViewObject") -> bool:
-        if self.content != other.content:
-            return False
-
-        if self._equals_embeds(other.embeds) is False:
-            return False
-
-        if self._equals_components(other.components) is False:
-            return False
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        super().__setattr__(name, value)
+        # invalidate the cached fingerprint
+        self.__dict__.pop("fingerprint", None)
 
-        # Comparing content of File is not easy, so just compare Nullity
-        return self.files is None and other.files is None
-
-    def _equals_embeds(self, other: "list[Embed] | None") -> bool:
-        if self.embeds is None and other is None:
-            return True
-
-        # One of them is None, so they are not equal
-        if self.embeds is None or other is None:
-            return False
+    @cached_property
+    def fingerprint(self) -> bytes:
+        """
+        property: A structural hash of the content, embeds and components.
 
-        if len(self.embeds) != len(other):
-            return False
+        This is computed once and cached, so comparing two rendered view objects costs O(1).
 
-        return all(self.embeds[i] == other[i] for i in range(len(self.embeds)))
+        **Note that mutating embeds or components in place after the fingerprint is computed is not detected.**
 
-    def _equals_components(self, other: "list[ui.Item] | None") -> bool:
-        if self.components is None and other is None:
-            return True
+        Returns
+        -------
+        bytes
+            The fingerprint of the view object.
+        """
+        # static embeds and components are represented by the digest of their payload serialized once
+        payload = (
+            self.content,
+            None if self.embeds is None else [_static_digest(e) or e.to_dict() for e in self.embeds],
+            None if self.components is None else [_static_digest(c) or _component_payload(c) for c in self.components],
+        )
 
-        # One of them is None, so they are not equal
-        if self.components is None or other is None:
-            return False
+        # equal payloads built in a different key order only cost a redundant edit, never a missed one
+        return _digest(payload)
 
-        if len(self.components) != len(other):
+    def equals(self, other: "ViewObject") -> bool:
+        # Comparing content of File is not easy, so just compare Nullity
+        if self.files is not None or other.files is not None:
             return False
 
-        return all(
-            self.components[i].to_component_dict() == other[i].to_component_dict() for i in range(len(self.components))
-        )
+        return self.fingerprint == other.fingerprint
 
 
 class View:
@@ -96,10 +202,14 @@ class View:
 
     Methods
     -------
-    render() -> `ViewObject`:
+    render() -> `ViewObject | Awaitable[ViewObject]`:
         Renders the UI and returns a `ViewObject` representing the UI.
     sync() -> `None`:
         Synchronizes the view with the controller.
+    render_key() -> `Hashable | None`:
+        Returns the key to memoize renders with.
+    batch() -> `ContextManager[None]`:
+        Defers all synchronizations inside the block into a single one.
     stop() -> `None`:
         Stops the view.
     on_error(interaction: `discord.Interaction`, error: `Exception`, item: `discord.ui.Item`) -> `None`:
@@ -115,24 +225,114 @@ class View:
         self._loop = loop or asyncio.get_event_loop()
         self._controller: ViewController | None = None
         self.__logger = get_logger(__name__)
+        self.__version = 0
+        self.__batch_depth = 0
+        self.__batch_pending = False
 
-    def render(self) -> ViewObject:
+    def render(self) -> ViewObject | Awaitable[ViewObject]:
         """
         Render the view and returns a ViewObject. This method is called by `Controller`.
 
+        This can be overridden with `async def`, or return an awaitable, to await data while rendering.
+        Renders superseded by state changes made meanwhile are discarded. Pass `render_in_executor`
+        to the controller to run a CPU-heavy sync render off the event loop instead.
+
         Returns
         -------
         ViewObject: The rendered view.
         """
         return ViewObject()
 
+    def render_key(self) -> Hashable | None:
+        """
+        Return the key to memoize renders with. This method is called by `Controller` when `render_cache` is enabled.
+
+        By default, this is a snapshot of the values of all `State` attributes and the positions of paginators
+        and selects of `ductile`. Built-in containers are converted into hashable equivalents.
+        Override this if `render()` depends on anything else, or to provide a cheaper key.
+
+        Returns
+        -------
+        Hashable | None
+            The key. Renders with the same key must return the same `ViewObject`.
+            None if the render can not be memoized.
+        """
+        snapshot: list[Hashable] = []
+        for name, value in self.__dict__.items():
+            if isinstance(value, State):
+                try:
+                    snapshot.append((name, _freeze(value.get_state())))
+                except TypeError:
+                    return None
+            elif callable(render_key := getattr(value, "_render_key", None)):
+                snapshot.append((name, render_key()))
+        return (type(self), *snapshot)
+
     def sync(self) -> None:
-        """Synchronize the view with the controller. This method is called by `State` when its value changes."""
+        """
+        Synchronize the view with the controller. This method is called by `State` when its value changes.
+
+        Synchronizations requested in the same event loop iteration are coalesced by the controller,
+        so calling this method several times in a row results in a single render and a single edit.
+
+        This method marks the view as dirty. The controller skips `render()` when the view is not dirty.
+        """
+        self._mark_dirty()
+        if self.__batch_depth > 0:
+            self.__batch_pending = True
+            return
+
         if self._controller:
-            self._loop.create_task(self._controller.sync())
+            self._controller._request_sync()  # noqa: SLF001
         else:
             self.__logger.warning("Controller is not set")
 
+    def _trace_state(self, state: State[Any]) -> None:
+        """Let the controller trace the change of the state. This method is called by `State` before `sync()`."""
+        if self._controller:
+            self._controller._trace_state(state)  # noqa: SLF001
+
+    @property
+    def _version(self) -> int:
+        """
+        property: The version of the view. This is incremented every time the view is marked as dirty.
+
+        Returns
+        -------
+        int
+            The version of the view.
+        """
+        return self.__version
+
+    def _mark_dirty(self) -> None:
+        """Mark the view as dirty so that the controller renders it on the next sync."""
+        self.__version += 1
+
+    @contextmanager
+    def batch(self) -> "Generator[None, None, None]":
+        """
+        Defer all synchronizations inside the block into a single one at the end of the outermost block.
+
+        This is useful when states are updated across `await` in a callback.
+
+        Example
+        -------
+        ```py
+        async def handle_click(interaction: discord.Interaction) -> None:
+            with self.batch():
+                self.count.set_state(lambda x: x + 1)
+                self.history.set_state(await fetch_history())
+        ```
+        """
+        self.__batch_depth += 1
+        try:
+            yield
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0 and self.__batch_pending:
+                self.__batch_pending = False
+                self.sync()
+
     def stop(self) -> None:
         """Stop the view. This method is called by child components implicitly."""
         if self._controller:
@@ -0,0 +1,280 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Generator
+from types import SimpleNamespace
+
+import pytest
+from discord import NotFound
+
+from ductile import State, View, ViewObject
+from ductile.controller import MessageableController
+from ductile.testing import FakeInteraction, FakeInteractionResponse, FakeMessageable
+from ductile.ui import Button
+
+
+class CounterView(View):
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = State(0, self)
+
+    def render(self) -> ViewObject:
+        return ViewObject(content=str(self.count()))
+
+
+@pytest.fixture
+def loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    # controllers and views get the current event loop on construction
+    previous = asyncio.get_event_loop_policy().get_event_loop()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+    asyncio.set_event_loop(previous)
+
+
+def test_sync_coalesce_state_changes(loop: asyncio.AbstractEventLoop) -> None:
+    async def main() -> list[str]:
+        view = CounterView()
+        messageable = FakeMessageable()
+        controller = MessageableController(view, messageable=messageable)
+        await controller.send()
+
+        for _ in range(3):
+            view.count.set_state(lambda x: x + 1)
+        await controller.sync()
+        return [e["content"] for e in messageable.messages[0].edits]
+
+    assert loop.run_until_complete(main()) == ["3"]
+
+
+def test_sync_drop_superseded_render(loop: asyncio.AbstractEventLoop) -> None:
+    async def main() -> list[str]:
+        view = CounterView()
+        messageable = FakeMessageable(latency=0.05)
+        controller = MessageableController(view, messageable=messageable)
+        await controller.send()
+
+        syncs = []
+        for _ in range(3):
+            view.count.set_state(lambda x: x + 1)
+            syncs.append(asyncio.ensure_future(controller.sync()))
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*syncs)
+        return [e["content"] for e in messageable.messages[0].edits]
+
+    # "2" is superseded by "3" while "1" is in flight
+    assert loop.run_until_complete(main()) == ["1", "3"]
+
+
+def test_sync_components_only_change(loop: asyncio.AbstractEventLoop) -> None:
+    class ButtonView(CounterView):
+        def render(self) -> ViewObject:
+            return ViewObject(content="counter", components=[Button(str(self.count()), style={})])
+
+    async def main() -> list[str]:
+        view = ButtonView()
+        messageable = FakeMessageable()
+        controller = MessageableController(view, messageable=messageable)
+        await controller.send()
+
+        view.count.set_state(1)
+        await controller.sync()
+        return [e["view"].children[0].label for e in messageable.messages[0].edits]
+
+    assert loop.run_until_complete(main()) == ["1"]
+
+
+def test_wait_timeout(loop: asyncio.AbstractEventLoop) -> None:
+    class TimeoutView(CounterView):
+        timed_out = False
+
+        async def on_timeout(self) -> None:
+            self.timed_out = True
+
+    async def main() -> tuple[bool, bool]:
+        view = TimeoutView()
+        controller = MessageableController(view, messageable=FakeMessageable(), timeout=0.01)
+        await controller.send()
+        result = await controller.wait()
+        return result.timed_out, view.timed_out
+
+    assert loop.run_until_complete(main()) == (True, True)
+
+
+def test_wait_stop(loop: asyncio.AbstractEventLoop) -> None:
+    async def main() -> bool:
+        view = CounterView()
+        controller = MessageableController(view, messageable=FakeMessageable(), timeout=0.01)
+        await controller.send()
+        view.stop()
+        result = await controller.wait()
+        await asyncio.sleep(0.02)
+        return result.timed_out
+
+    assert loop.run_until_complete(main()) is False
+
+
+def test_render_cache(loop: asyncio.AbstractEventLoop) -> None:
+    class ToggleView(View):
+        def __init__(self) -> None:
+            super().__init__()
+            self.label = State("A", self)
+            self.renders = 0
+
+        def render(self) -> ViewObject:
+            self.renders += 1
+            return ViewObject(content=self.label())
+
+    async def main() -> tuple[list[str], int]:
+        view = ToggleView()
+        messageable = FakeMessageable()
+        controller = MessageableController(view, messageable=messageable, render_cache=8)
+        await controller.send()
+
+        for label in ["B", "A", "B"]:
+            view.label.set_state(label)
+            await controller.sync()
+        # changed and changed back before the sync. neither rendered nor edited.
+        view.label.set_state("A")
+        view.label.set_state("B")
+        await controller.sync()
+        return [e["content"] for e in messageable.messages[0].edits], view.renders
+
+    assert loop.run_until_complete(main()) == (["B", "A", "B"], 2)
+
+
+def test_async_render_discard_superseded(loop: asyncio.AbstractEventLoop) -> None:
+    class SlowView(CounterView):
+        async def render(self) -> ViewObject:  # type: ignore[override]
+            count = self.count()
+            await asyncio.sleep(0.02)
+            return ViewObject(content=str(count))
+
+    async def main() -> list[str]:
+        view = SlowView()
+        messageable = FakeMessageable()
+        controller = MessageableController(view, messageable=messageable)
+        await controller.send()
+
+        view.count.set_state(1)
+        first = asyncio.ensure_future(controller.sync())
+        await asyncio.sleep(0.01)
+        # changed while "1" is being rendered
+        view.count.set_state(2)
+        await asyncio.gather(first, controller.sync())
+        return [e["content"] for e in messageable.messages[0].edits]
+
+    assert loop.run_until_complete(main()) == ["2"]
+
+
+def test_render_returning_awaitable(loop: asyncio.AbstractEventLoop) -> None:
+    class DelegatingView(CounterView):
+        def render(self) -> Awaitable[ViewObject]:  # type: ignore[override]
+            return self.render_later()
+
+        async def render_later(self) -> ViewObject:
+            return ViewObject(content=f"later {self.count()}")
+
+    async def main() -> str | None:
+        messageable = FakeMessageable()
+        await MessageableController(DelegatingView(), messageable=messageable).send()
+        return messageable.messages[0].content
+
+    assert loop.run_until_complete(main()) == "later 0"
+
+
+def test_render_in_executor(loop: asyncio.AbstractEventLoop) -> None:
+    class ThreadView(CounterView):
+        def __init__(self) -> None:
+            super().__init__()
+            self.threads: set[int] = set()
+
+        def render(self) -> ViewObject:
+            self.threads.add(threading.get_ident())
+            return super().render()
+
+    async def main() -> tuple[list[str], set[int]]:
+        view = ThreadView()
+        messageable = FakeMessageable()
+        controller = MessageableController(view, messageable=messageable, render_in_executor=True)
+        await controller.send()
+
+        view.count.set_state(1)
+        await controller.sync()
+        return [e["content"] for e in messageable.messages[0].edits], view.threads
+
+    edits, threads = loop.run_until_complete(main())
+    assert edits == ["1"]
+    assert threading.get_ident() not in threads
+
+
+class ClickView(CounterView):
+    def render(self) -> ViewObject:
+        async def increment(_: object) -> None:
+            self.count.set_state(lambda x: x + 1)
+
+        return ViewObject(content=str(self.count()), components=[Button("+1", style={}, on_click=increment)])
+
+
+def test_respond_defer_slow_render(loop: asyncio.AbstractEventLoop) -> None:
+    class SlowView(ClickView):
+        async def render(self) -> ViewObject:  # type: ignore[override]
+            await asyncio.sleep(0.02)
+            return super().render()
+
+    async def main() -> tuple[bool, list[str]]:
+        messageable = FakeMessageable()
+        await MessageableController(SlowView(), messageable=messageable).send()
+        message = messageable.messages[0]
+        interaction = await message.click("+1")
+        await asyncio.sleep(0.05)
+        return interaction.response.deferred, [e["content"] for e in message.edits]
+
+    # the interaction is acknowledged before the render, which edits the message after it
+    assert loop.run_until_complete(main()) == (True, ["1"])
+
+
+def test_respond_failed_callback(loop: asyncio.AbstractEventLoop) -> None:
+    class FailingView(ClickView):
+        def render(self) -> ViewObject:
+            def fail(_: object) -> None:
+                self.count.set_state(1)
+                msg = "failed"
+                raise RuntimeError(msg)
+
+            return ViewObject(content=str(self.count()), components=[Button("fail", style={}, on_click=fail)])
+
+    async def main() -> tuple[bool, list[str]]:
+        messageable = FakeMessageable()
+        await MessageableController(FailingView(), messageable=messageable).send()
+        message = messageable.messages[0]
+        interaction = await message.click("fail")
+        await asyncio.sleep(0.01)
+        return interaction.response.deferred, [e["content"] for e in message.edits]
+
+    # the interaction is answered and the change made before the error is still synced
+    assert loop.run_until_complete(main()) == (True, ["1"])
+
+
+def test_respond_failed_response(loop: asyncio.AbstractEventLoop) -> None:
+    class ExpiredResponse(FakeInteractionResponse):
+        async def edit_message(self, **_: object) -> None:
+            raise NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown interaction")  # type: ignore[arg-type]
+
+    async def main() -> list[str]:
+        messageable = FakeMessageable()
+        view = ClickView()
+        controller = MessageableController(view, messageable=messageable)
+        await controller.send()
+        message = messageable.messages[0]
+
+        view.count.set_state(1)
+        interaction = FakeInteraction(message=message)
+        interaction.response = ExpiredResponse(interaction)
+        with pytest.raises(NotFound):
+            await message.view.respond(interaction)  # type: ignore[union-attr]
+        await asyncio.sleep(0.01)
+        return [e["content"] for e in message.edits]
+
+    # the sync taken over by the failed response is rescheduled and edits the message
+    assert loop.run_until_complete(main()) == ["1"]
@@ -0,0 +1,135 @@
+import asyncio
+from collections.abc import Coroutine
+from types import SimpleNamespace
+from typing import Any, TypeVar
+
+import pytest
+from discord import HTTPException, RateLimited
+
+from ductile.controller import EditDispatcher, get_default_dispatcher
+
+T = TypeVar("T")
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class FakeHTTP:
+    """A fake HTTP layer that rejects the first `rate_limited` requests with 429."""
+
+    def __init__(self, *, rate_limited: int = 0, delay: float = 0.01) -> None:
+        self.rate_limited = rate_limited
+        self.delay = delay
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def edit(self, name: str) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            self.requests.append(name)
+            if self.rate_limited > 0:
+                self.rate_limited -= 1
+                response = SimpleNamespace(status=429, reason="Too Many Requests", headers={"Retry-After": "0.01"})
+                raise HTTPException(response, {"message": "You are being rate limited.", "code": 0})
+            return name
+        finally:
+            self.in_flight -= 1
+
+
+def test_retry_on_429() -> None:
+    http = FakeHTTP(rate_limited=2)
+    dispatcher = EditDispatcher()
+
+    assert run(dispatcher.submit(lambda: http.edit("a"), key="a")) == "a"
+    assert http.requests == ["a", "a", "a"]
+
+
+def test_give_up_after_max_retries() -> None:
+    async def edit() -> None:
+        raise RateLimited(0.01)
+
+    dispatcher = EditDispatcher(max_retries=1)
+
+    with pytest.raises(RateLimited):
+        run(dispatcher.submit(edit, key="a"))
+
+
+def test_per_channel_concurrency() -> None:
+    http = FakeHTTP()
+    dispatcher = EditDispatcher(max_concurrency_per_channel=2)
+
+    async def main() -> None:
+        await asyncio.gather(*(dispatcher.submit(lambda i=i: http.edit(str(i)), key=i, channel="c") for i in range(10)))
+
+    run(main())
+    assert http.max_in_flight == 2  # noqa: PLR2004
+
+
+def test_global_concurrency() -> None:
+    http = FakeHTTP()
+    dispatcher = EditDispatcher(max_concurrency=3)
+
+    async def main() -> None:
+        await asyncio.gather(*(dispatcher.submit(lambda i=i: http.edit(str(i)), key=i, channel=i) for i in range(10)))
+
+    run(main())
+    assert http.max_in_flight == 3  # noqa: PLR2004
+
+
+def test_collapse_queued_edits() -> None:
+    http = FakeHTTP()
+    dispatcher = EditDispatcher()
+
+    async def main() -> list[str]:
+        return await asyncio.gather(*(dispatcher.submit(lambda i=i: http.edit(str(i)), key="m") for i in range(4)))
+
+    # "0" is in flight, then "1" and "2" are replaced by "3"
+    assert run(main()) == ["0", "3", "3", "3"]
+    assert http.requests == ["0", "3"]
+
+
+def test_fair_queuing_between_owners() -> None:
+    http = FakeHTTP()
+    dispatcher = EditDispatcher(max_concurrency=1)
+
+    async def main() -> None:
+        busy = [dispatcher.submit(lambda i=i: http.edit(f"busy{i}"), key=f"busy{i}", owner="busy") for i in range(5)]
+        quiet = dispatcher.submit(lambda: http.edit("quiet"), key="quiet", owner="quiet")
+        await asyncio.gather(*busy, quiet)
+
+    run(main())
+    # first-in-first-out would run "quiet" last. round-robin runs it right after the next "busy" edit.
+    assert http.requests.index("quiet") == 2  # noqa: PLR2004
+
+
+def test_rate_limit_blocks_channel() -> None:
+    http = FakeHTTP(rate_limited=1)
+    dispatcher = EditDispatcher(max_concurrency_per_channel=5)
+
+    async def main() -> None:
+        first = asyncio.ensure_future(dispatcher.submit(lambda: http.edit("a"), key="a", channel="c"))
+        await asyncio.sleep(0.015)  # "a" has been rate limited
+        await asyncio.gather(first, dispatcher.submit(lambda: http.edit("b"), key="b", channel="c"))
+
+    run(main())
+    # "b" waits until the rate limit of the channel is released
+    assert http.requests[0] == "a"
+    assert sorted(http.requests[1:]) == ["a", "b"]
+
+
+def test_default_dispatcher_per_loop() -> None:
+    first, second = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        assert get_default_dispatcher(first) is get_default_dispatcher(first)
+        assert get_default_dispatcher(first) is not get_default_dispatcher(second)
+    finally:
+        first.close()
+        second.close()
@@ -0,0 +1,196 @@
+import asyncio
+import gc
+import weakref
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+
+from ductile import State, View, ViewObject
+from ductile.controller import MessageableController
+from ductile.hibernation import HibernationStore, MemoryHibernationStore, SqliteHibernationStore
+from ductile.pagination import CursorPaginator, Paginator
+from ductile.testing import FakeMessage, FakeMessageable
+from ductile.ui import Button
+
+
+class CounterView(View):
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = State(0, self)
+
+    def render(self) -> ViewObject:
+        async def increment(_: Any) -> None:  # noqa: ANN401
+            self.count.set_state(lambda x: x + 1)
+
+        return ViewObject(content=str(self.count()), components=[Button("+1", style={"color": "green"}, on_click=increment)])
+
+
+@pytest.fixture
+def loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    previous = asyncio.get_event_loop_policy().get_event_loop()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+    asyncio.set_event_loop(previous)
+
+
+@pytest.mark.parametrize("store", [MemoryHibernationStore(), SqliteHibernationStore()])
+def test_store(store: HibernationStore) -> None:
+    assert store.load("a") is None
+    store.save("a", b"1")
+    store.save("a", b"2")
+    assert store.load("a") == b"2"
+    store.delete("a")
+    store.delete("a")
+    assert store.load("a") is None
+
+
+def test_hibernate_and_wake(loop: asyncio.AbstractEventLoop) -> None:
+    store = MemoryHibernationStore()
+    messageable = FakeMessageable()
+
+    async def main() -> tuple[str, str, str | None]:
+        view = CounterView()
+        view.count.set_state(3)
+        controller = MessageableController(view, messageable=messageable, hibernation={"idle": 0.01, "store": store})
+        await controller.send()
+        message = messageable.messages[0]
+        assert message.view is not None
+        custom_id = message.view.children[0].custom_id  # type: ignore[attr-defined]
+
+        ref = weakref.ref(view)
+        del view
+        await asyncio.sleep(0.05)
+        gc.collect()
+        assert controller.hibernated
+        assert ref() is None
+        assert len(store) == 1
+
+        # discord.py checks the interaction with the view, which rebuilds it, before dispatching it to the item
+        interaction = await message.click(custom_id)
+        assert not controller.hibernated
+        assert len(store) == 0
+        assert not interaction.response.deferred
+        return custom_id, message.view.children[0].custom_id, message.content  # type: ignore[attr-defined]
+
+    before, after, content = loop.run_until_complete(main())
+    # the rebuilt view keeps the custom_id attached to the message and the restored state
+    assert before == after
+    assert content == "4"
+
+
+def test_hibernate_release_message(loop: asyncio.AbstractEventLoop) -> None:
+    class PartialMessageable(FakeMessageable):
+        def get_partial_message(self, message_id: int) -> FakeMessage:
+            # a new message with the id only, like `discord.PartialMessage`
+            partial = FakeMessage(self, {})
+            partial.id = message_id
+            return partial
+
+    async def main() -> None:
+        messageable = PartialMessageable()
+        config = {"idle": 0.01, "store": MemoryHibernationStore()}
+        controller = MessageableController(CounterView(), messageable=messageable, hibernation=config)  # type: ignore[arg-type]
+        await controller.send()
+        message = messageable.messages.pop()
+        ref, message_id = weakref.ref(message), message.id
+        del message
+
+        await asyncio.sleep(0.05)
+        gc.collect()
+        assert controller.hibernated
+        assert ref() is None
+        assert controller.message is not None
+        assert controller.message.id == message_id
+
+    loop.run_until_complete(main())
+
+
+def test_hibernate_factory_type(loop: asyncio.AbstractEventLoop) -> None:
+    async def main() -> None:
+        config = {"idle": 0.01, "store": MemoryHibernationStore(), "factory": View}
+        controller = MessageableController(CounterView(), messageable=FakeMessageable(), hibernation=config)  # type: ignore[arg-type]
+        await controller.send()
+        await asyncio.sleep(0.05)
+        assert controller.hibernated
+
+        controller.stop()
+        with pytest.raises(TypeError, match="factory must return"):
+            await controller.wait()
+
+    loop.run_until_complete(main())
+
+
+class PagerView(View):
+    def __init__(self) -> None:
+        super().__init__()
+        self.pages = Paginator(self, source=range(100), config={"page_size": 10})
+        # not kept while hibernated
+        self.title = "pages"
+
+    def render(self) -> ViewObject:
+        def go_next(interaction: Any) -> None:  # noqa: ANN401
+            self.pages.go_next(interaction)
+
+        content = f"{self.title} {self.pages.current_page}"
+        return ViewObject(content=content, components=[Button("next", style={"color": "green"}, on_click=go_next)])
+
+
+async def hibernate_and_click(view: PagerView) -> FakeMessage:
+    # discord.py dispatches interactions only to views built in a running event loop
+    messageable = FakeMessageable()
+    config = {"idle": 0.01, "store": MemoryHibernationStore()}
+    controller = MessageableController(view, messageable=messageable, hibernation=config)  # type: ignore[arg-type]
+    await controller.send()
+    await asyncio.sleep(0.05)
+    assert controller.hibernated
+
+    message = messageable.messages[0]
+    await message.click("next")
+    return message
+
+
+def test_hibernate_keeps_paginator_position(loop: asyncio.AbstractEventLoop) -> None:
+    view = PagerView()
+    view.pages.go_last(None)  # type: ignore[arg-type]
+    view.pages.go_previous(None)  # type: ignore[arg-type]
+
+    message = loop.run_until_complete(hibernate_and_click(view))
+    assert message.edits[0]["content"] == "pages 10"
+
+
+def test_wake_edit_stale_message(loop: asyncio.AbstractEventLoop) -> None:
+    view = PagerView()
+    view.pages.go_last(None)  # type: ignore[arg-type]
+    view.title = "changed"
+
+    message = loop.run_until_complete(hibernate_and_click(view))
+    # "next" changes nothing on the last page, but the title is reset by the rebuild, so the message is edited
+    assert message.edits[0]["content"] == "pages 10"
+
+
+def test_refuse_hibernating_unkept_helpers(loop: asyncio.AbstractEventLoop) -> None:
+    class CursorView(View):
+        def __init__(self) -> None:
+            super().__init__()
+            self.pages = CursorPaginator(self, fetch=self.fetch, config={"page_size": 10})
+
+        async def fetch(self, cursor: int | None, limit: int) -> tuple[list[int], int | None]:
+            start = cursor or 0
+            return list(range(start, start + limit)), start + limit
+
+        def render(self) -> ViewObject:
+            return ViewObject(content=str(list(self.pages.data)))
+
+    async def main() -> bool:
+        view = CursorView()
+        config = {"idle": 0.01, "store": MemoryHibernationStore()}
+        controller = MessageableController(view, messageable=FakeMessageable(), hibernation=config)  # type: ignore[arg-type]
+        await view.pages.load()
+        await controller.send()
+        await asyncio.sleep(0.05)
+        return controller.hibernated
+
+    assert not loop.run_until_complete(main())
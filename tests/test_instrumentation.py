@@ -0,0 +1,106 @@
+import asyncio
+from typing import Any
+
+from ductile import State, View, ViewObject
+from ductile.controller import MessageableController
+from ductile.instrumentation import InMemoryMetrics, SyncTrace, to_prometheus
+from ductile.testing import FakeMessageable
+from ductile.ui import Button
+
+
+class ParityView(View):
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = State(0, self)
+
+    def render(self) -> ViewObject:
+        return ViewObject(content="even" if self.count() % 2 == 0 else "odd")
+
+
+def test_metrics() -> None:
+    metrics = InMemoryMetrics()
+
+    async def main() -> None:
+        view = ParityView()
+        controller = MessageableController(view, messageable=FakeMessageable(), metrics=metrics)
+        await controller.send()
+        view.count.set_state(1)
+        await controller.sync()
+        # rendered but identical to the committed render
+        view.count.set_state(3)
+        await controller.sync()
+
+    asyncio.new_event_loop().run_until_complete(main())
+
+    summaries = metrics.summaries()
+    counters = metrics.counters()
+    assert summaries["render_seconds", "ParityView"].count == 3  # noqa: PLR2004
+    assert summaries["equals_seconds", "ParityView"].count == 2  # noqa: PLR2004
+    assert summaries["send_seconds", "ParityView"].count == 1
+    assert summaries["edit_seconds", "ParityView"].count == 1
+    assert summaries["payload_bytes", "ParityView"].max > 0
+    assert counters["renders_committed", "ParityView"] == 1
+    assert counters["renders_skipped", "ParityView"] == 1
+
+
+def test_to_prometheus() -> None:
+    metrics = InMemoryMetrics()
+    metrics.observe("render_seconds", 0.5, view="A")
+    metrics.observe("render_seconds", 1.5, view="A")
+    metrics.increment("timeouts", view='B"')
+
+    assert to_prometheus(metrics) == (
+        "# TYPE ductile_render_seconds summary\n"
+        'ductile_render_seconds_count{view="A"} 2\n'
+        'ductile_render_seconds_sum{view="A"} 2.0\n'
+        "# TYPE ductile_render_seconds_max gauge\n"
+        'ductile_render_seconds_max{view="A"} 1.5\n'
+        "# TYPE ductile_timeouts_total counter\n"
+        'ductile_timeouts_total{view="B\\""} 1\n'
+    )
+
+
+class TraceView(View):
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = State(0, self)
+        self.label = State("", self)
+
+    def render(self) -> ViewObject:
+        return ViewObject(
+            content=f"{self.count() % 2} {self.label()}",
+            components=[Button("bump", style={}, on_click=self.bump)],
+        )
+
+    def bump(self, _: Any) -> None:  # noqa: ANN401
+        self.count.set_state(lambda x: x + 1)
+        self.label.set_state("bumped")
+
+
+def test_sync_tracer() -> None:
+    async def main() -> tuple[list[SyncTrace], int, str]:
+        view = TraceView()
+        messageable = FakeMessageable()
+        controller = MessageableController(view, messageable=messageable, trace=8)
+        await controller.send()
+        interaction = await messageable.messages[0].click("bump")
+        # rendered but identical to the committed render
+        view.count.set_state(3)
+        await controller.sync()
+
+        assert controller.tracer is not None
+        return controller.tracer.traces, interaction.id, controller.tracer.dump()
+
+    traces, interaction_id, dump = asyncio.new_event_loop().run_until_complete(main())
+    assert [trace.outcome for trace in traces] == ["committed", "identical"]
+    assert traces[0].states == ("count", "label")
+    assert traces[0].callbacks == ("TraceView.bump",)
+    assert traces[0].interactions == (interaction_id,)
+    assert traces[1].states == ("count",)
+    assert traces[1].callbacks == ()
+    assert dump.splitlines()[0].startswith("committed")
+
+
+def test_sync_tracer_disabled() -> None:
+    controller = MessageableController(TraceView(), messageable=FakeMessageable())
+    assert controller.tracer is None
@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from ductile import View, ViewObject
+from ductile.loadtest import run
+from ductile.loadtest.__main__ import main
+from ductile.ui import Button
+
+
+def test_run() -> None:
+    result = asyncio.new_event_loop().run_until_complete(
+        run({"views": 10, "rate": 200, "duration": 0.2, "latency": 0.01, "seed": 0}),
+    )
+
+    assert result.interactions == 40  # noqa: PLR2004
+    assert result.errors == 0
+    assert 0 < result.edits <= result.interactions
+    assert result.edits + result.coalesced == result.interactions
+    assert 0 < result.latency_p50 <= result.latency_p99
+
+
+def test_run_count_callback_errors() -> None:
+    class FailingView(View):
+        def render(self) -> ViewObject:
+            def fail(_: object) -> None:
+                msg = "failed"
+                raise RuntimeError(msg)
+
+            return ViewObject(components=[Button("fail", style={}, on_click=fail)])
+
+    result = asyncio.new_event_loop().run_until_complete(
+        run({"views": 2, "rate": 100, "duration": 0.1, "latency": 0, "view": FailingView, "seed": 0}),
+    )
+    assert result.errors == result.interactions == 10  # noqa: PLR2004
+
+
+def test_main(capsys: pytest.CaptureFixture[str]) -> None:
+    # asyncio.run unsets the current event loop on exit
+    previous = asyncio.get_event_loop_policy().get_event_loop()
+    main(["--views", "2", "--rate", "50", "--duration", "0.1", "--latency", "0"])
+    asyncio.set_event_loop(previous)
+    assert "interactions : 5" in capsys.readouterr().out
@@ -0,0 +1,60 @@
+import logging
+
+import pytest
+
+from ductile import State, View
+from ductile.utils import SamplingFilter, get_logger
+
+
+def test_get_logger_leaves_configuration_to_application() -> None:
+    logger = get_logger("Example")
+    assert logger.name == "ductile.Example"
+    assert logger.handlers == []
+    assert logger.level == logging.NOTSET
+    assert get_logger("ductile.state").name == "ductile.state"
+
+
+def test_sampling_filter() -> None:
+    sampler = SamplingFilter(3)
+
+    def record(view: str, level: int = logging.DEBUG) -> logging.LogRecord:
+        r = logging.LogRecord("ductile.state", level, __file__, 0, "msg", None, None)
+        r.view = view
+        return r
+
+    assert [sampler.filter(record("Hot")) for _ in range(6)] == [True, False, False, True, False, False]
+    # views are sampled independently
+    assert sampler.filter(record("Cold"))
+    # warnings always pass
+    assert all(sampler.filter(record("Hot", logging.WARNING)) for _ in range(3))
+
+    with pytest.raises(ValueError, match="every"):
+        SamplingFilter(0)
+
+
+def test_sampling_filter_on_handler() -> None:
+    class Recorder(logging.Handler):
+        def __init__(self) -> None:
+            super().__init__()
+            self.records: list[logging.LogRecord] = []
+
+        def emit(self, record: logging.LogRecord) -> None:
+            self.records.append(record)
+
+    handler = Recorder()
+    handler.addFilter(SamplingFilter(10))
+    logger = logging.getLogger("ductile")
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    try:
+        state = State(0, View())
+        for i in range(50):
+            state.set_state(i + 1)
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+
+    # records propagated from `ductile.state` are sampled per view
+    assert [record.getMessage() for record in handler.records if record.name == "ductile.state"] == [
+        f"State changed: {i} -> {i + 1}" for i in range(0, 50, 10)
+    ]
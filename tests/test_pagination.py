@@ -0,0 +1,227 @@
+import asyncio
+from collections.abc import AsyncIterator, Coroutine
+from typing import Any, TypeVar
+
+import pytest
+
+from ductile import View
+from ductile.pagination import AsyncPaginator, CursorPaginator, Paginator
+
+T = TypeVar("T")
+
+
+class SyncCounterView(View):
+    def __init__(self) -> None:
+        super().__init__()
+        self.syncs = 0
+
+    def sync(self) -> None:
+        self.syncs += 1
+
+
+def test_paginate_range_without_copy() -> None:
+    source = range(10**9)
+    paginator = Paginator(SyncCounterView(), source=source, config={"page_size": 7})
+
+    assert paginator.max_page == -(-(10**9) // 7)
+    assert paginator.data == range(7)
+
+    paginator.go_last(None)  # type: ignore[arg-type]
+    assert paginator.at_last
+    assert paginator.data == range(10**9 - 10**9 % 7, 10**9)
+
+
+def test_paginate_list() -> None:
+    view = SyncCounterView()
+    paginator = Paginator(view, source=list(range(5)), config={"page_size": 2, "initial_page": 1})
+
+    assert (paginator.current_page, paginator.max_page) == (2, 3)
+    assert paginator.data == [2, 3]
+
+    paginator.go_next(None)  # type: ignore[arg-type]
+    paginator.go_next(None)  # type: ignore[arg-type]
+    assert paginator.data == [4]
+    assert view.syncs == 1
+
+
+def test_invalid_page_size() -> None:
+    with pytest.raises(ValueError, match="page_size"):
+        Paginator(SyncCounterView(), source=[], config={"page_size": 0})
+
+
+class FakeTable:
+    """A fake database table counting the queries."""
+
+    def __init__(self, size: int) -> None:
+        self.rows = list(range(size))
+        self.queries: list[tuple[int, int]] = []
+
+    async def fetch(self, offset: int, limit: int) -> list[int]:
+        self.queries.append((offset, limit))
+        await asyncio.sleep(0)
+        return self.rows[offset : offset + limit]
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_async_paginator_prefetch() -> None:
+    table = FakeTable(10)
+
+    async def main() -> None:
+        view = SyncCounterView()
+        paginator = AsyncPaginator(view, fetch=table.fetch, config={"page_size": 3, "total": 10})
+        await paginator.load()
+        assert paginator.data == [0, 1, 2]
+        assert paginator.max_page == 4  # noqa: PLR2004
+
+        # the next page has been prefetched, so going next does not query
+        await asyncio.sleep(0)
+        queries = len(table.queries)
+        await paginator.go_next(None)  # type: ignore[arg-type]
+        assert len(table.queries) == queries
+        assert paginator.data == [3, 4, 5]
+        assert view.syncs == 1
+
+    run(main())
+    assert table.queries[:2] == [(0, 3), (3, 3)]
+
+
+def test_async_paginator_unknown_total() -> None:
+    table = FakeTable(6)
+
+    async def main() -> None:
+        view = SyncCounterView()
+        paginator = AsyncPaginator(view, fetch=table.fetch, config={"page_size": 3, "prefetch": 0})
+        await paginator.load()
+        assert paginator.max_page is None
+
+        await paginator.go_next(None)  # type: ignore[arg-type]
+        assert paginator.data == [3, 4, 5]
+        assert not paginator.at_last
+
+        # the third page is empty, so the second page turns out to be the last
+        await paginator.go_next(None)  # type: ignore[arg-type]
+        assert paginator.current_page == 2  # noqa: PLR2004
+        assert paginator.at_last
+        assert view.syncs == 1
+
+    run(main())
+
+
+def test_async_paginator_cache_size() -> None:
+    table = FakeTable(100)
+
+    async def main() -> None:
+        paginator = AsyncPaginator(
+            SyncCounterView(),
+            fetch=table.fetch,
+            config={"page_size": 1, "cache_size": 2, "prefetch": 0},
+        )
+        await paginator.load()
+        for _ in range(3):
+            await paginator.go_next(None)  # type: ignore[arg-type]
+        await paginator.go_first(None)  # type: ignore[arg-type]
+
+    run(main())
+    # the first page has been evicted and fetched again
+    assert table.queries.count((0, 1)) == 2  # noqa: PLR2004
+
+
+def test_cursor_paginator_keyset() -> None:
+    rows = list(range(7))
+    cursors: list[int | None] = []
+
+    async def fetch(after: int | None, limit: int) -> tuple[list[int], int | None]:
+        cursors.append(after)
+        start = 0 if after is None else after + 1
+        page = rows[start : start + limit]
+        return page, (page[-1] if start + limit < len(rows) else None)
+
+    async def main() -> None:
+        view = SyncCounterView()
+        paginator = CursorPaginator(view, fetch=fetch, config={"page_size": 3})
+        await paginator.load()
+        assert paginator.max_page is None
+
+        await paginator.go_next(None)  # type: ignore[arg-type]
+        await paginator.go_next(None)  # type: ignore[arg-type]
+        assert paginator.data == [6]
+        assert paginator.at_last
+        assert paginator.max_page == 3  # noqa: PLR2004
+
+        # going back uses the cached page
+        await paginator.go_previous(None)  # type: ignore[arg-type]
+        assert paginator.data == [3, 4, 5]
+        assert view.syncs == 3  # noqa: PLR2004
+
+    run(main())
+    assert cursors == [None, 2, 5]
+
+
+def test_cursor_paginator_from_iterator() -> None:
+    async def source() -> AsyncIterator[int]:
+        for i in range(10):
+            yield i
+
+    async def main() -> None:
+        paginator = CursorPaginator.from_iterator(
+            SyncCounterView(), source=source(), config={"page_size": 2, "cache_size": 2}
+        )
+        await paginator.load()
+        for _ in range(3):
+            await paginator.go_next(None)  # type: ignore[arg-type]
+        assert paginator.data == [6, 7]
+
+        # only the cached pages can be revisited
+        await paginator.go_first(None)  # type: ignore[arg-type]
+        assert paginator.data == [4, 5]
+        assert paginator.at_first
+
+    run(main())
+
+
+def test_cursor_paginator_from_iterator_subclass() -> None:
+    class MyPaginator(CursorPaginator[int, int]):
+        pass
+
+    async def source() -> AsyncIterator[int]:
+        yield 0
+
+    paginator = MyPaginator.from_iterator(SyncCounterView(), source=source(), config={"page_size": 2})
+    assert isinstance(paginator, MyPaginator)
+
+
+def test_sort_and_filter() -> None:
+    view = SyncCounterView()
+    calls: list[int] = []
+
+    def score(x: int) -> int:
+        calls.append(x)
+        return -x
+
+    paginator = Paginator(view, source=list(range(10)), config={"page_size": 3, "initial_page": 3})
+
+    paginator.sort_by(score)
+    assert paginator.data == [0]
+    paginator.filter_by(lambda x: x % 2 == 0, name="even")
+    # the current page is clamped to the last page
+    assert (paginator.current_page, paginator.max_page) == (2, 2)
+    assert paginator.data == [2, 0]
+
+    paginator.sort_by(None)
+    paginator.sort_by(score)
+    assert paginator.data == [2, 0]
+    # the permutation is computed once
+    assert len(calls) == 10  # noqa: PLR2004
+    assert view.syncs == 4  # noqa: PLR2004
+
+    paginator.filter_by(None)
+    paginator.sort_by(None)
+    paginator.go_first(None)  # type: ignore[arg-type]
+    assert paginator.data == [0, 1, 2]
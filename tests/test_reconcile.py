@@ -0,0 +1,63 @@
+import pytest
+from discord import ui
+
+from ductile.internal import _reconcile
+from ductile.ui import Button, Select
+
+
+@pytest.fixture
+def view() -> ui.View:
+    return ui.View()
+
+
+def test_reconcile_keep_auto_custom_id(view: ui.View) -> None:
+    first = _reconcile(view, [Button("a", style={"color": "red"})])
+    custom_id = first[0].custom_id
+
+    second = _reconcile(view, [Button("b", style={"color": "green"})])
+
+    assert second[0] is first[0]
+    assert second[0].custom_id == custom_id
+    assert second[0].label == "b"
+    assert view.children == second
+
+
+def test_reconcile_patch_callback(view: ui.View) -> None:
+    called: list[str] = []
+    _reconcile(view, [Button("a", style={"color": "red"}, on_click=lambda _: called.append("old"))])
+    live = _reconcile(view, [Button("a", style={"color": "red"}, on_click=lambda _: called.append("new"))])
+
+    live[0]._Button__callback_fn(None)  # noqa: SLF001
+    assert called == ["new"]
+
+
+def test_reconcile_match_by_custom_id(view: ui.View) -> None:
+    a, b = Button("a", style={"color": "red"}, custom_id="a"), Button("b", style={"color": "red"}, custom_id="b")
+    _reconcile(view, [a, b])
+
+    live = _reconcile(view, [Button("b", style={"color": "red"}, custom_id="b")])
+
+    assert live == [b]
+    assert view.children == [b]
+
+
+def test_reconcile_add_and_replace(view: ui.View) -> None:
+    button = Button("a", style={"color": "red"})
+    _reconcile(view, [button])
+
+    select = Select(config={}, style={}, options=[{"label": "a"}])
+    live = _reconcile(view, [Button("a", style={"color": "red"}), select])
+
+    assert live == [button, select]
+    assert view.children == [button, select]
+
+
+def test_reconcile_keep_reused_item(view: ui.View) -> None:
+    stop = Button("stop", style={"color": "red"})
+    _reconcile(view, [stop])
+
+    extra = Button("extra", style={"color": "green"})
+    live = _reconcile(view, [extra, stop, stop])
+
+    assert live == [extra, stop]
+    assert [item.label for item in view.children] == ["extra", "stop"]
@@ -0,0 +1,93 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+import pytest
+
+from ductile.testing import VirtualClock
+from ductile.utils import TrailingEdgeScheduler
+
+T = TypeVar("T")
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    # do not use asyncio.run here since it unsets the current event loop used by other tests
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    async def __call__(self) -> None:
+        self.count += 1
+
+
+def test_schedule_coalesce_burst() -> None:
+    async def main() -> int:
+        counter = Counter()
+        scheduler = TrailingEdgeScheduler(counter, wait=0.01)
+        waiters = [scheduler.schedule() for _ in range(10)]
+        await asyncio.gather(*waiters)
+        return counter.count
+
+    assert run(main()) == 1
+
+
+def test_schedule_trailing_edge_never_drops_last_call() -> None:
+    async def main() -> int:
+        counter = Counter()
+        scheduler = TrailingEdgeScheduler(counter, wait=0.01)
+        await scheduler.schedule()
+        await scheduler.schedule()
+        return counter.count
+
+    assert run(main()) == 2  # noqa: PLR2004
+
+
+def test_schedule_max_wait() -> None:
+    wait, max_wait, interval = 0.05, 0.1, 0.03
+    loop = asyncio.new_event_loop()
+    clock = VirtualClock()
+    calls: list[float] = []
+    executions: list[float] = []
+
+    async def record() -> None:
+        executions.append(loop.time())
+
+    async def main() -> None:
+        scheduler = TrailingEdgeScheduler(record, wait=wait, max_wait=max_wait)
+        # a continuous stream of calls, never pausing for `wait`
+        for _ in range(30):
+            calls.append(loop.time())
+            scheduler.schedule()
+            await asyncio.sleep(interval)
+        await asyncio.sleep(wait)
+
+    with clock.patch_loop(loop):
+        loop.run_until_complete(main())
+    loop.close()
+
+    # each window starts at the first call after the previous execution, and is executed exactly once
+    # no later than `max_wait` after its start. the last window ends on the trailing edge.
+    expected: list[float] = []
+    for call in calls:
+        if not expected or call > expected[-1]:
+            expected.append(call + max_wait)
+    expected[-1] = min(expected[-1], calls[-1] + wait)
+    assert executions == pytest.approx(expected)
+
+
+def test_flush() -> None:
+    async def main() -> tuple[int, bool]:
+        counter = Counter()
+        scheduler = TrailingEdgeScheduler(counter, wait=60)
+        waiter = scheduler.schedule()
+        await scheduler.flush()
+        return counter.count, waiter.done()
+
+    assert run(main()) == (1, True)
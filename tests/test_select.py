@@ -0,0 +1,127 @@
+import asyncio
+from types import SimpleNamespace
+
+from ductile import View
+from ductile.ui import SearchableSelect, SearchIndex, Select, SelectOption, VirtualSelect
+
+
+class SyncCounterView(View):
+    def __init__(self) -> None:
+        super().__init__()
+        self.syncs = 0
+
+    def sync(self) -> None:
+        self.syncs += 1
+
+
+def choose(select: Select, values: list[str]) -> None:
+    # simulate a component interaction which has already been responded to
+    select._values = values  # noqa: SLF001
+    interaction = SimpleNamespace(response=SimpleNamespace(is_done=lambda: True))
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(select.callback(interaction))  # type: ignore[arg-type]
+    finally:
+        loop.close()
+
+
+def test_virtual_select_windows() -> None:
+    source: list[SelectOption] = [{"label": f"item{i}"} for i in range(50)]
+    selections: list[list[str]] = []
+    view = SyncCounterView()
+    virtual = VirtualSelect(
+        view,
+        source=source,
+        config={"window_size": 20, "max_values": 2},
+        on_select=lambda _, values: selections.append(values),
+    )
+    assert virtual.max_window == 3  # noqa: PLR2004
+
+    select = virtual.render()
+    # only the visible window and the "next" sentinel are built
+    assert [o.label for o in select.options][-2:] == ["item19", "Next ▶"]
+    assert len(select.options) == 21  # noqa: PLR2004
+
+    choose(select, ["item3"])
+    choose(virtual.render(), [select.options[-1].value])
+    assert virtual.window == 2  # noqa: PLR2004
+
+    select = virtual.render()
+    assert select.options[0].label == "◀ Previous"
+    choose(select, ["item25"])
+    # the selection in the first window is kept
+    assert virtual.selected == ["item3", "item25"]
+    assert selections == [["item3"], ["item3", "item25"]]
+    assert view.syncs == 3  # noqa: PLR2004
+
+    choose(virtual.render(), [select.options[0].value])
+    assert [o.value for o in virtual.render().options if o.default] == ["item3"]
+
+
+def test_search_index_ranking() -> None:
+    source: list[SelectOption] = [
+        {"label": "Green Apple"},
+        {"label": "Pineapple"},
+        {"label": "Apple Pie"},
+        {"label": "Banana"},
+    ]
+    index = SearchIndex.shared(source)
+    assert SearchIndex.shared(source) is index
+
+    # label prefix, then word prefix, then substring
+    assert index.search("apple") == [2, 0, 1]
+    assert index.search("APP", limit=1) == [2]
+    assert index.search("nan") == [3]
+    assert index.search("cherry") == []
+    assert index.search("") == [0, 1, 2, 3]
+
+
+def test_search_index_multi_word_prefix() -> None:
+    source: list[SelectOption] = [{"label": f"x red apple {i}"} for i in range(40)]
+    source.append({"label": "Red Apple pie"})
+
+    # the label starting with the query comes first even though it is the last in the source
+    result = SearchIndex(source).search("red apple")
+    assert result[0] == 40  # noqa: PLR2004
+    assert result[1:] == list(range(24))
+
+
+def test_searchable_select() -> None:
+    source: list[SelectOption] = [{"label": f"item{i}", "value": str(i)} for i in range(100)]
+    view = SyncCounterView()
+    searchable = SearchableSelect(view, source=source)
+    assert len(searchable.render().options) == 25  # noqa: PLR2004
+
+    searchable.search("item4")
+    assert [o.value for o in searchable.render().options] == ["4", *(str(i) for i in range(40, 50))]
+    searchable.search("nothing")
+    assert [o.label for o in searchable.render().options] == ["No results"]
+    assert view.syncs == 2  # noqa: PLR2004
+
+
+def test_memoized_select() -> None:
+    options: list[SelectOption] = [{"label": f"item{i}"} for i in range(24)]
+    a = Select(config={}, style={}, options=options, custom_id="a")
+    b = Select(config={}, style={}, options=options, custom_id="a")
+
+    # the payload is shared between identical selects for the fingerprint
+    assert a._component_payload() is b._component_payload()  # noqa: SLF001
+    assert a.to_component_dict() is not b.to_component_dict()
+
+    b.disabled = True
+    assert b._component_payload()["disabled"] is True  # noqa: SLF001
+    assert a._component_payload()["disabled"] is False  # noqa: SLF001
+
+    a.add_option(label="extra")
+    assert len(a._component_payload()["options"]) == 25  # noqa: PLR2004, SLF001
+
+
+def test_memoized_select_options_not_shared() -> None:
+    options: list[SelectOption] = [{"label": "a"}, {"label": "b"}]
+    a = Select(config={}, style={}, options=options, custom_id="a")
+    a.options[0].default = True
+    b = Select(config={}, style={}, options=options, custom_id="a")
+
+    assert a.options[0] is not b.options[0]
+    assert a._component_payload()["options"][0]["default"] is True  # noqa: SLF001
+    assert b._component_payload()["options"][0]["default"] is False  # noqa: SLF001
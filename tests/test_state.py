@@ -1,3 +1,4 @@
+import logging
 from collections.abc import Generator
 
 import pytest
@@ -57,3 +58,40 @@ def test_revert_state(state: State[int]) -> None:
 
     state.revert_state()
     assert state.get_state() == 0
+
+
+def test_set_state_same_value_does_not_sync(state: State[int], view_spy: MockType) -> None:
+    state.set_state(0)
+    view_spy.assert_not_called()
+
+
+def test_set_state_mark_view_dirty(state: State[int], view: View) -> None:
+    version = view._version  # noqa: SLF001
+    state.set_state(1)
+    assert view._version > version  # noqa: SLF001
+
+
+def test_set_state_skips_formatting_when_debug_is_off(view: View) -> None:
+    class Loud:
+        formatted = 0
+
+        def __str__(self) -> str:
+            Loud.formatted += 1
+            return "loud"
+
+    test_state = State(Loud(), view)
+    logging.getLogger("ductile").setLevel(logging.INFO)
+    try:
+        test_state.set_state(Loud())
+    finally:
+        logging.getLogger("ductile").setLevel(logging.NOTSET)
+    assert Loud.formatted == 0
+
+
+def test_set_state_debug_log(view: View, caplog: pytest.LogCaptureFixture) -> None:
+    test_state = State(0, view)
+    with caplog.at_level(logging.DEBUG, logger="ductile"):
+        test_state.set_state(1)
+    (record,) = [r for r in caplog.records if r.name == "ductile.state"]
+    assert record.getMessage() == "State changed: 0 -> 1"
+    assert record.view == "View"  # type: ignore[attr-defined]
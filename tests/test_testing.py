@@ -0,0 +1,80 @@
+import asyncio
+from typing import Any
+
+from ductile import State, View, ViewObject
+from ductile.controller import InteractionController, MessageableController
+from ductile.testing import FakeInteraction, FakeMessageable, VirtualClock
+from ductile.ui import Button, Select
+
+
+class FormView(View):
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = State(0, self)
+        self.fruit = State("none", self)
+
+    def render(self) -> ViewObject:
+        def increment(_: Any) -> None:  # noqa: ANN401
+            self.count.set_state(lambda x: x + 1)
+
+        def choose(_: Any, values: list[str]) -> None:  # noqa: ANN401
+            self.fruit.set_state(values[0])
+
+        return ViewObject(
+            content=f"{self.count()} {self.fruit()}",
+            components=[
+                Button("+1", style={"color": "green"}, on_click=increment),
+                Select(
+                    config={},
+                    style={"placeholder": "fruit"},
+                    options=[{"label": "apple"}, {"label": "banana"}],
+                    on_select=choose,
+                ),
+            ],
+        )
+
+
+def test_click_and_select() -> None:
+    async def main() -> tuple[list[str | None], bool]:
+        messageable = FakeMessageable()
+        controller = MessageableController(FormView(), messageable=messageable)
+        await controller.send()
+        message = messageable.messages[0]
+
+        contents = [message.content]
+        interaction = await message.click("+1")
+        contents.append(message.content)
+        await message.select("fruit", ["banana"])
+        contents.append(message.content)
+        # the state changes are pushed by the responses instead of extra edits
+        return contents, interaction.response.is_done()
+
+    contents, responded = asyncio.new_event_loop().run_until_complete(main())
+    assert contents == ["0 none", "1 none", "1 banana"]
+    assert responded
+
+
+def test_interaction_controller_send() -> None:
+    async def main() -> str | None:
+        interaction = FakeInteraction()
+        controller = InteractionController(FormView(), interaction=interaction)  # type: ignore[arg-type]
+        await controller.send()
+        return (await interaction.original_response()).content
+
+    assert asyncio.new_event_loop().run_until_complete(main()) == "0 none"
+
+
+def test_virtual_clock_timeout() -> None:
+    timeout = 180
+    loop = asyncio.new_event_loop()
+    clock = VirtualClock()
+
+    async def main() -> bool:
+        controller = MessageableController(FormView(), messageable=FakeMessageable(), timeout=timeout)
+        await controller.send()
+        return (await controller.wait()).timed_out
+
+    with clock.patch_loop(loop):
+        assert loop.run_until_complete(main())
+    # timed out in virtual time without waiting in real time
+    assert clock.time() >= timeout
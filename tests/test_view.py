@@ -0,0 +1,121 @@
+import gc
+import weakref
+
+import pytest
+from discord import Embed
+from pytest_mock import MockFixture, MockType
+
+from ductile import State, static
+from ductile.ui import Button
+from ductile.view import View, ViewObject
+
+
+@pytest.fixture
+def view() -> View:
+    return View()
+
+
+@pytest.fixture
+def controller(mocker: MockFixture, view: View) -> MockType:
+    c = mocker.Mock()
+    view._controller = c  # noqa: SLF001
+    return c
+
+
+def test_sync_request_controller(view: View, controller: MockType) -> None:
+    view.sync()
+    controller._request_sync.assert_called_once()  # noqa: SLF001
+
+
+def test_batch_collapse_sync(view: View, controller: MockType) -> None:
+    a, b, c = State(0, view), State(0, view), State(0, view)
+
+    with view.batch():
+        a.set_state(1)
+        b.set_state(2)
+        c.set_state(3)
+        controller._request_sync.assert_not_called()  # noqa: SLF001
+
+    controller._request_sync.assert_called_once()  # noqa: SLF001
+
+
+def test_nested_batch(view: View, controller: MockType) -> None:
+    s = State(0, view)
+
+    with view.batch():
+        with view.batch():
+            s.set_state(1)
+        controller._request_sync.assert_not_called()  # noqa: SLF001
+
+    controller._request_sync.assert_called_once()  # noqa: SLF001
+
+
+def test_batch_without_change(view: View, controller: MockType) -> None:
+    with view.batch():
+        pass
+
+    controller._request_sync.assert_not_called()  # noqa: SLF001
+
+
+def test_view_object_equals() -> None:
+    a = ViewObject(content="a", embeds=[Embed(title="a")])
+    b = ViewObject(content="a", embeds=[Embed(title="a")])
+    assert a.equals(b)
+
+
+def test_view_object_not_equals() -> None:
+    a = ViewObject(content="a", embeds=[Embed(title="a")])
+    b = ViewObject(content="a", embeds=[Embed(title="b")])
+    assert not a.equals(b)
+
+
+def test_view_object_fingerprint_invalidated_on_assignment() -> None:
+    a = ViewObject(content="a")
+    b = ViewObject(content="a")
+    assert a.equals(b)
+
+    b.content = "b"
+    assert not a.equals(b)
+
+
+def test_view_object_with_files_never_equals() -> None:
+    a = ViewObject(content="a", files=[])
+    assert not a.equals(ViewObject(content="a"))
+
+
+def test_static_members(mocker: MockFixture) -> None:
+    class StaticView(View):
+        builds = 0
+
+        @static
+        def footer(self) -> list[Button | Embed]:
+            self.builds += 1
+            return [Button("stop", style={"color": "red"}), Embed(title="footer")]
+
+        def render(self) -> ViewObject:
+            button, embed = self.footer
+            return ViewObject(embeds=[embed], components=[button])
+
+    view = StaticView()
+    first, second = view.render(), view.render()
+    assert view.builds == 1
+    assert first.components == second.components
+
+    # the payload of static members is not serialized again
+    spy = mocker.spy(Button, "to_component_dict")
+    assert first.equals(second)
+    spy.assert_not_called()
+
+
+def test_static_members_do_not_keep_view_alive() -> None:
+    class StaticView(View):
+        @static
+        def footer(self) -> list[Button | Embed]:
+            return [Button("stop", style={"color": "red"}, on_click=lambda _: self.stop()), Embed(title="footer")]
+
+    view = StaticView()
+    view.footer  # noqa: B018
+    ref = weakref.ref(view)
+    del view
+    gc.collect()
+    assert ref() is None